@@ -0,0 +1,50 @@
+"""
+Concurrent requests against the ASGI test client, rendering a form with
+model choice fields in a sync view and with ``arender_crispy_form`` in an
+async view.
+"""
+
+import asyncio
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from django.contrib.auth.models import Group
+from django.http import HttpResponse
+from django.test import AsyncClient
+from django.urls import path
+
+from crispy_bulma.aio import arender_crispy_form
+from crispy_forms.utils import render_crispy_form
+from tests.forms import ModelChoicesForm
+
+REQUESTS = 50
+
+
+def sync_view(request):
+    return HttpResponse(render_crispy_form(ModelChoicesForm()))
+
+
+async def async_view(request):
+    return HttpResponse(await arender_crispy_form(ModelChoicesForm()))
+
+
+urlpatterns = [
+    path("sync/", sync_view),
+    path("async/", async_view),
+]
+
+
+async def concurrent_requests(url):
+    client = AsyncClient()
+    responses = await asyncio.gather(*(client.get(url) for _ in range(REQUESTS)))
+    assert all(response.status_code == 200 for response in responses)
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("benchmarks.test_async")
+@pytest.mark.parametrize("url", ["/sync/", "/async/"], ids=["sync", "async"])
+def test_concurrent_requests(benchmark, url):
+    benchmark.group = "asgi-%s-requests" % REQUESTS
+    Group.objects.bulk_create(Group(name="Group %s" % i) for i in range(20))
+    benchmark.pedantic(async_to_sync(concurrent_requests), (url,), rounds=3)
@@ -0,0 +1,83 @@
+"""
+Rendering radio buttons and checkboxes for fields with many choices, with the
+template loops ``radioselect.html`` and ``checkboxselectmultiple.html`` used to
+run and with ``{% crispy_choices %}``.
+"""
+
+import pytest
+
+from django import forms
+from django.template import Context, Template
+
+LEGACY_RADIOS = Template(
+    """{% load crispy_forms_filters %}{% load l10n %}
+{% for choice in field.field.choices %}
+<div class="control">
+  <label class="radio" for="id_{{ field.html_name }}_{{ forloop.counter0 }}">
+    <input type="radio"{% if choice.0|stringformat:"s" == field.value|default_if_none:""|stringformat:"s" %} checked{% endif %} name="{{ field.html_name }}" id="id_{{ field.html_name }}_{{ forloop.counter0 }}" value="{{ choice.0|unlocalize }}" {% if field.field.disabled %}disabled{% endif %} {{ field.field.widget.attrs|flatatt }}>
+      {{ choice.1|unlocalize }}
+  </label>
+</div>
+{% endfor %}"""  # noqa: E501
+)
+
+LEGACY_CHECKBOXES = Template(
+    """{% load crispy_forms_filters %}{% load l10n %}
+{% for choice in field.field.choices %}
+<div class="control">
+  <label class="checkbox" for="id_{{ field.html_name }}_{{ forloop.counter0 }}">
+    <input type="checkbox"{% if choice.0 in field.value or choice.0|stringformat:"s" in field.value or choice.0|stringformat:"s" == field.value|default_if_none:""|stringformat:"s" %} checked{% endif %} name="{{ field.html_name }}" id="id_{{ field.html_name }}_{{ forloop.counter0 }}" value="{{ choice.0|unlocalize }}"{% if field.field.disabled %} disabled{% endif %} {{ field.field.widget.attrs|flatatt }}>
+      {{ choice.1|unlocalize }}
+  </label>
+</div>
+{% endfor %}"""  # noqa: E501
+)
+
+RADIOS = Template(
+    '{% load crispy_forms_bulma_field %}{% crispy_choices field "radio" %}'
+)
+
+CHECKBOXES = Template(
+    '{% load crispy_forms_bulma_field %}{% crispy_choices field "checkbox" %}'
+)
+
+SIZES = [10, 1_000, 10_000]
+
+
+def choices_form(size):
+    choices = [(i, "Permission %s" % i) for i in range(size)]
+
+    class ChoicesForm(forms.Form):
+        radio = forms.ChoiceField(choices=choices, widget=forms.RadioSelect)
+        checkboxes = forms.MultipleChoiceField(
+            choices=choices, widget=forms.CheckboxSelectMultiple
+        )
+
+    # every other choice is selected
+    return ChoicesForm(
+        initial={"radio": size // 2, "checkboxes": list(range(0, size, 2))}
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize(
+    "template",
+    [LEGACY_RADIOS, RADIOS],
+    ids=["legacy", "crispy_choices"],
+)
+def test_radios(benchmark, template, size):
+    benchmark.group = "radios-%s" % size
+    context = Context({"field": choices_form(size)["radio"]})
+    benchmark(template.render, context)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize(
+    "template",
+    [LEGACY_CHECKBOXES, CHECKBOXES],
+    ids=["legacy", "crispy_choices"],
+)
+def test_checkboxes(benchmark, template, size):
+    benchmark.group = "checkboxes-%s" % size
+    context = Context({"field": choices_form(size)["checkboxes"]})
+    benchmark(template.render, context)
@@ -0,0 +1,62 @@
+"""
+Rendering forms with the templates of ``crispy_bulma.loaders.Loader`` and
+with their flattened variants, ``CRISPY_BULMA_FLAT_TEMPLATES``.
+"""
+
+import pytest
+
+from django import forms
+from django.test import override_settings
+
+from crispy_bulma.layout import IconField
+from crispy_forms.helper import FormHelper
+from crispy_forms.layout import Layout
+from crispy_forms.utils import render_crispy_form
+from tests.forms import InputsForm, SampleForm
+from tests.utils import clear_crispy_templates
+
+LargeForm = type(
+    "LargeForm",
+    (forms.Form,),
+    {"field_%s" % i: forms.CharField(max_length=30) for i in range(100)},
+)
+
+
+def icon_helper():
+    helper = FormHelper()
+    helper.layout = Layout(
+        *(IconField("field_%s" % i, icon_prepend="fa fa-user") for i in range(100))
+    )
+    return helper
+
+
+CASES = {
+    "sample": (SampleForm, FormHelper),
+    "inputs": (InputsForm, FormHelper),
+    "large": (LargeForm, FormHelper),
+    "icons": (LargeForm, icon_helper),
+}
+
+
+@pytest.mark.parametrize("case", CASES)
+@pytest.mark.parametrize("flat", [False, True], ids=["templates", "flat"])
+def test_flat_templates(benchmark, flat, case):
+    benchmark.group = "flat-templates-%s" % case
+    form_class, make_helper = CASES[case]
+    templates = [
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "OPTIONS": {
+                "loaders": [
+                    "crispy_bulma.loaders.Loader",
+                    "django.template.loaders.app_directories.Loader",
+                ],
+            },
+        }
+    ]
+    clear_crispy_templates()
+    try:
+        with override_settings(TEMPLATES=templates, CRISPY_BULMA_FLAT_TEMPLATES=flat):
+            benchmark(render_crispy_form, form_class(), make_helper())
+    finally:
+        clear_crispy_templates()
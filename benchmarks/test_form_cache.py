@@ -0,0 +1,24 @@
+"""
+Rendering an unbound form on every request against rendering it from the
+fragment cache of ``crispy_bulma.cache``.
+"""
+
+import pytest
+
+from crispy_bulma.cache import render_cached_form
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+from tests.forms import SampleForm
+
+
+@pytest.mark.parametrize(
+    "render", [render_crispy_form, render_cached_form], ids=["crispy", "cached"]
+)
+def test_unbound_form(benchmark, render):
+    benchmark.group = "unbound-form"
+    helper = FormHelper()
+
+    def render_form():
+        return render(SampleForm(), helper, {"csrf_token": "token"})
+
+    benchmark(render_form)
@@ -0,0 +1,51 @@
+"""
+Re-rendering one field of an invalid form with 100 fields, as a whole form
+with ``render_crispy_form`` and as a fragment with ``render_fragment``.
+"""
+
+import pytest
+
+from django import forms
+
+from crispy_bulma.fragments import render_fragment
+from crispy_bulma.layout import Column, Layout, Row
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+
+FIELDS = 100
+
+LargeForm = type(
+    "LargeForm",
+    (forms.Form,),
+    {"field_%s" % i: forms.CharField(max_length=5) for i in range(FIELDS)},
+)
+
+
+def make_helper():
+    helper = FormHelper()
+    helper.layout = Layout(
+        *(
+            Row(Column("field_%s" % i), Column("field_%s" % (i + 1)))
+            for i in range(0, FIELDS, 2)
+        )
+    )
+    return helper
+
+
+def render_form(data, helper):
+    return render_crispy_form(LargeForm(data), helper)
+
+
+def render_field(data, helper):
+    return render_fragment(LargeForm(data), "field_50", helper)
+
+
+@pytest.mark.parametrize(
+    "render", [render_form, render_field], ids=["form", "fragment"]
+)
+def test_field_fragment(benchmark, render):
+    benchmark.group = "field-fragment"
+    data = {"field_%s" % i: "toolong" for i in range(FIELDS)}
+    helper = make_helper()
+    html = benchmark(render, data, helper)
+    assert 'id="div_id_field_50"' in html
@@ -0,0 +1,37 @@
+"""
+Rendering a form without instrumentation, with the timers installed but no
+``collect_timings()`` block and while collecting timings.
+"""
+
+import contextlib
+
+import pytest
+
+from crispy_bulma.instrumentation import collect_timings, install, uninstall
+from crispy_bulma.layout import Button, Column, FormGroup, IconField, Layout, Row
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+from tests.forms import SampleForm
+
+
+@pytest.mark.parametrize("mode", ["off", "installed", "collecting"])
+def test_instrumentation(benchmark, mode):
+    benchmark.group = "instrumentation"
+    helper = FormHelper()
+    helper.layout = Layout(
+        IconField("email", icon_prepend="fas fa-envelope"),
+        Row(Column("first_name"), Column("last_name")),
+        FormGroup(Button("Save"), Button("Cancel")),
+    )
+
+    def render():
+        scope = collect_timings() if mode == "collecting" else contextlib.nullcontext()
+        with scope:
+            return render_crispy_form(SampleForm(), helper)
+
+    if mode != "off":
+        install()
+    try:
+        benchmark(render)
+    finally:
+        uninstall()
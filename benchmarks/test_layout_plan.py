@@ -0,0 +1,46 @@
+"""
+Rendering nested layouts with the crispy-forms ``FormHelper``, which renders
+every wrapper template on each render, against the render plan of
+``crispy_bulma.helper.FormHelper``.
+"""
+
+import pytest
+
+from django.template import Context
+
+from crispy_bulma.helper import FormHelper
+from crispy_bulma.layout import Column, Div, Layout, Row
+from crispy_forms.helper import FormHelper as CrispyFormHelper
+from tests.forms import SampleForm
+
+FIELDS = ["email", "password1", "password2", "first_name", "last_name"]
+
+
+def nested_layout(depth):
+    """
+    Every field wrapped in ``depth`` levels of Row, Column and Div.
+    """
+    objects = []
+    for name in FIELDS:
+        layout_object = name
+        for level in range(depth):
+            wrapper = [Row, Column, Div][level % 3]
+            layout_object = wrapper(layout_object, css_class="level-%s" % level)
+        objects.append(layout_object)
+    return Layout(*objects)
+
+
+@pytest.mark.parametrize("depth", [5, 10])
+@pytest.mark.parametrize(
+    "helper_class", [CrispyFormHelper, FormHelper], ids=["crispy", "plan"]
+)
+def test_nested_layout(benchmark, helper_class, depth):
+    benchmark.group = "layout-depth-%s" % depth
+    form = SampleForm()
+    helper = helper_class()
+    helper.layout = nested_layout(depth)
+
+    def render():
+        return helper.render_layout(form, Context())
+
+    benchmark(render)
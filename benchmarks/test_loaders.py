@@ -0,0 +1,47 @@
+"""
+Rendering a form without the cached loader, e.g. with ``DEBUG = True``, with
+the Bulma templates loaded from the app directories, from memory with
+``crispy_bulma.loaders.Loader`` and with the cached loader for comparison.
+"""
+
+import pytest
+
+from django import forms
+from django.test import override_settings
+
+from crispy_forms.helper import FormHelper
+from crispy_forms.templatetags.crispy_forms_tags import whole_uni_form_template
+from crispy_forms.utils import render_crispy_form
+from tests.forms import SampleForm
+
+LargeForm = type(
+    "LargeForm",
+    (forms.Form,),
+    {"field_%s" % i: forms.CharField(max_length=30) for i in range(100)},
+)
+
+APP_DIRECTORIES = ["django.template.loaders.app_directories.Loader"]
+CRISPY_BULMA = ["crispy_bulma.loaders.Loader", *APP_DIRECTORIES]
+CACHED = [("django.template.loaders.cached.Loader", APP_DIRECTORIES)]
+
+
+@pytest.mark.parametrize("form_class", [SampleForm, LargeForm], ids=["sample", "large"])
+@pytest.mark.parametrize(
+    "loaders",
+    [APP_DIRECTORIES, CRISPY_BULMA, CACHED],
+    ids=["app-directories", "crispy-bulma", "cached"],
+)
+def test_loaders(benchmark, loaders, form_class):
+    benchmark.group = "loaders-%s" % form_class.__name__
+    templates = [
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "OPTIONS": {"loaders": loaders, "debug": True},
+        }
+    ]
+    whole_uni_form_template.cache_clear()
+    try:
+        with override_settings(TEMPLATES=templates):
+            benchmark(render_crispy_form, form_class(), FormHelper())
+    finally:
+        whole_uni_form_template.cache_clear()
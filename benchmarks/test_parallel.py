@@ -0,0 +1,47 @@
+"""
+Rendering a formset of 500 forms with ``render_crispy_form`` against
+``render_crispy_formset_parallel`` on thread pools of 1 to 8 workers. The
+workers only run in parallel on free-threaded Python builds, with the GIL
+this measures the overhead of the chunking.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from django.forms import formset_factory
+
+from crispy_bulma.layout import Column, Layout, Row
+from crispy_bulma.parallel import render_crispy_formset_parallel
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+from tests.forms import SampleForm
+
+FORMS = 500
+
+
+def formset_and_helper():
+    formset = formset_factory(SampleForm, extra=FORMS)()
+    helper = FormHelper()
+    helper.layout = Layout("email", Row(Column("first_name"), Column("last_name")))
+    return formset, helper
+
+
+def test_sequential(benchmark):
+    benchmark.group = "parallel-formset-%s" % FORMS
+    benchmark.pedantic(
+        render_crispy_form, setup=lambda: (formset_and_helper(), {}), rounds=3
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4, 8])
+def test_parallel(benchmark, workers):
+    benchmark.group = "parallel-formset-%s" % FORMS
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+
+        def render(formset, helper):
+            return render_crispy_formset_parallel(
+                formset, helper, executor=executor, max_workers=workers
+            )
+
+        benchmark.pedantic(render, setup=lambda: (formset_and_helper(), {}), rounds=3)
@@ -0,0 +1,40 @@
+"""
+Responding to an invalid form with 120 fields and 3 errors by rendering the
+whole form with ``render_crispy_form`` and by rendering the changed fields
+with ``render_partial``.
+"""
+
+import pytest
+
+from django import forms
+
+from crispy_bulma.partial import render_partial
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+
+FIELDS = 120
+
+LargeForm = type(
+    "LargeForm",
+    (forms.Form,),
+    {"field_%s" % i: forms.CharField(max_length=5) for i in range(FIELDS)},
+)
+
+DATA = {"field_%s" % i: "ok" for i in range(FIELDS)}
+DATA.update({"field_10": "toolong", "field_60": "toolong", "field_110": "toolong"})
+
+
+def render_form(helper):
+    return render_crispy_form(LargeForm(DATA), helper)
+
+
+def render_changed(helper):
+    return render_partial(LargeForm(DATA), helper=helper)
+
+
+@pytest.mark.parametrize(
+    "render", [render_form, render_changed], ids=["form", "partial"]
+)
+def test_invalid_form(benchmark, render):
+    benchmark.group = "invalid-form"
+    benchmark(render, FormHelper())
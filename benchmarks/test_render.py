@@ -0,0 +1,146 @@
+"""
+The ``render_crispy_form`` suite: the forms of ``tests/forms.py``, forms of
+10, 100 and 1,000 fields, formsets of 10, 100 and 1,000 forms, nested
+``Row``/``Column`` layouts, ``IconField``, ``FormGroup`` with many buttons
+and choice widgets with large choice lists.
+
+``make bench-save`` stores the results in ``.benchmarks/``, ``make
+bench-compare`` compares a run with the last stored one and fails when a
+case got slower than ``BENCH_THRESHOLD`` percent.
+"""
+
+import pytest
+
+from django import forms
+from django.forms import formset_factory
+
+from crispy_bulma.layout import Button, Column, FormGroup, IconField, Layout, Row
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+from tests import forms as test_forms
+
+TEST_FORMS = [
+    test_forms.SampleForm,
+    test_forms.SampleForm2,
+    test_forms.CheckboxesSampleForm,
+    test_forms.SampleForm3,
+    test_forms.SampleForm4,
+    test_forms.SampleForm5,
+    test_forms.SampleForm6,
+    test_forms.SampleForm7,
+    test_forms.SampleForm8,
+    test_forms.SampleFormWithMedia,
+    test_forms.SampleFormWithMultiValueField,
+    test_forms.FileForm,
+    test_forms.FileFormRequired,
+    test_forms.InputsForm,
+]
+
+
+def make_form_class(fields):
+    attrs = {"field_%s" % i: forms.CharField(max_length=30) for i in range(fields)}
+    return type("Form%s" % fields, (forms.Form,), attrs)
+
+
+def run(benchmark, render, *args, rounds=None):
+    if rounds is None:
+        return benchmark(render, *args)
+    return benchmark.pedantic(render, args, rounds=rounds)
+
+
+@pytest.mark.parametrize("form_class", TEST_FORMS, ids=lambda cls: cls.__name__)
+def test_test_forms(benchmark, form_class):
+    benchmark.group = "test-forms"
+    run(benchmark, lambda: render_crispy_form(form_class(), FormHelper()))
+
+
+@pytest.mark.parametrize("fields", [10, 100, 1_000])
+def test_fields(benchmark, fields):
+    benchmark.group = "fields"
+    form_class = make_form_class(fields)
+    rounds = 5 if fields == 1_000 else None
+    run(
+        benchmark,
+        lambda: render_crispy_form(form_class(), FormHelper()),
+        rounds=rounds,
+    )
+
+
+@pytest.mark.parametrize("size", [10, 100, 1_000])
+def test_formset(benchmark, size):
+    benchmark.group = "formset"
+    formset_class = formset_factory(
+        test_forms.SampleForm, extra=size, max_num=size, absolute_max=size
+    )
+    rounds = {100: 5, 1_000: 1}.get(size)
+    run(
+        benchmark,
+        lambda: render_crispy_form(formset_class(), FormHelper()),
+        rounds=rounds,
+    )
+
+
+@pytest.mark.parametrize("depth", [1, 3, 6])
+def test_nested_rows(benchmark, depth):
+    benchmark.group = "nested-rows"
+    form_class = make_form_class(20)
+    columns = []
+    for i in range(20):
+        layout_object = "field_%s" % i
+        for level in range(depth):
+            layout_object = Row(Column(layout_object))
+        columns.append(layout_object)
+    helper = FormHelper()
+    helper.layout = Layout(*columns)
+    run(benchmark, lambda: render_crispy_form(form_class(), helper))
+
+
+def test_icon_fields(benchmark):
+    benchmark.group = "layout-objects"
+    form_class = make_form_class(50)
+    helper = FormHelper()
+    helper.layout = Layout(
+        *(
+            IconField(
+                "field_%s" % i, icon_prepend="fas fa-user", icon_append="fas fa-check"
+            )
+            for i in range(50)
+        )
+    )
+    run(benchmark, lambda: render_crispy_form(form_class(), helper))
+
+
+def test_form_group_buttons(benchmark):
+    benchmark.group = "layout-objects"
+    form_class = make_form_class(1)
+    helper = FormHelper()
+    helper.layout = Layout(
+        "field_0",
+        FormGroup(*(Button("Button %s" % i, css_class="is-link") for i in range(50))),
+    )
+    run(benchmark, lambda: render_crispy_form(form_class(), helper))
+
+
+@pytest.mark.parametrize(
+    "widget",
+    [
+        forms.Select,
+        forms.SelectMultiple,
+        forms.RadioSelect,
+        forms.CheckboxSelectMultiple,
+    ],
+    ids=lambda widget: widget.__name__,
+)
+@pytest.mark.parametrize("choices", [100, 1_000])
+def test_choices(benchmark, widget, choices):
+    benchmark.group = "choices-%s" % choices
+    field_class = forms.ChoiceField
+    if widget in (forms.SelectMultiple, forms.CheckboxSelectMultiple):
+        field_class = forms.MultipleChoiceField
+    choice_list = [(i, "Choice %s" % i) for i in range(choices)]
+    form_class = type(
+        "ChoiceForm",
+        (forms.Form,),
+        {"choice": field_class(choices=choice_list, widget=widget)},
+    )
+    run(benchmark, lambda: render_crispy_form(form_class(), FormHelper()))
@@ -0,0 +1,39 @@
+"""
+Rendering forms without a layout with ``render_crispy_form`` and with
+``{{ form }}`` and the ``BulmaFormRenderer``, which give the same HTML.
+"""
+
+import pytest
+
+from django import forms
+
+from crispy_bulma.renderers import BulmaFormRenderer
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+from tests.forms import InputsForm, SampleForm
+
+LargeForm = type(
+    "LargeForm",
+    (forms.Form,),
+    {"field_%s" % i: forms.CharField(max_length=30) for i in range(100)},
+)
+
+
+def crispy(form_class, renderer):
+    helper = FormHelper()
+    helper.form_tag = False
+    helper.include_media = False
+    return render_crispy_form(form_class(), helper)
+
+
+def form_renderer(form_class, renderer):
+    return str(form_class(renderer=renderer))
+
+
+@pytest.mark.parametrize(
+    "form_class", [SampleForm, InputsForm, LargeForm], ids=lambda cls: cls.__name__
+)
+@pytest.mark.parametrize("render", [crispy, form_renderer], ids=["crispy", "renderer"])
+def test_form_renderer(benchmark, render, form_class):
+    benchmark.group = "form-renderer-%s" % form_class.__name__
+    benchmark(render, form_class, BulmaFormRenderer())
@@ -0,0 +1,51 @@
+"""
+Rendering formsets of 100, 1,000 and 5,000 forms with ``render_crispy_form``,
+with ``render_crispy_form`` in a ``row_plan()`` scope and with
+``stream_crispy_formset``, which renders all forms from one layout plan in a
+``row_plan()`` scope.
+"""
+
+import pytest
+
+from django.forms import formset_factory
+
+from crispy_bulma.layout import Column, Layout, Row
+from crispy_bulma.rows import row_plan
+from crispy_bulma.streaming import stream_crispy_formset
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+from tests.forms import SampleForm
+
+
+def render(formset, helper):
+    return render_crispy_form(formset, helper)
+
+
+def render_row_plan(formset, helper):
+    with row_plan():
+        return render_crispy_form(formset, helper)
+
+
+def stream(formset, helper):
+    return "".join(stream_crispy_formset(formset, helper))
+
+
+@pytest.mark.parametrize("size", [100, 1_000, 5_000])
+@pytest.mark.parametrize(
+    "render_formset",
+    [render, render_row_plan, stream],
+    ids=["render", "row_plan", "stream"],
+)
+def test_formset(benchmark, render_formset, size):
+    benchmark.group = "formset-rows-%s" % size
+
+    def setup():
+        formset_class = formset_factory(
+            SampleForm, extra=size, max_num=size, absolute_max=size
+        )
+        formset = formset_class()
+        helper = FormHelper()
+        helper.layout = Layout("email", Row(Column("first_name"), Column("last_name")))
+        return (formset, helper), {}
+
+    benchmark.pedantic(render_formset, setup=setup, rounds=3 if size < 5_000 else 1)
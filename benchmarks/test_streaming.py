@@ -0,0 +1,47 @@
+"""
+Rendering a formset of 500 forms with ``render_crispy_form`` against
+``stream_crispy_formset``, for the whole formset and up to the first form.
+"""
+
+import pytest
+
+from django.forms import formset_factory
+
+from crispy_bulma.layout import Column, Layout, Row
+from crispy_bulma.streaming import stream_crispy_formset
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+from tests.forms import SampleForm
+
+FORMS = 500
+
+
+def formset_and_helper():
+    formset = formset_factory(SampleForm, extra=FORMS)()
+    helper = FormHelper()
+    helper.layout = Layout("email", Row(Column("first_name"), Column("last_name")))
+    return formset, helper
+
+
+def render(formset, helper):
+    return render_crispy_form(formset, helper)
+
+
+def stream(formset, helper):
+    return "".join(stream_crispy_formset(formset, helper))
+
+
+def first_form(formset, helper):
+    for chunk in stream_crispy_formset(formset, helper):
+        if "div_id_form-0-email" in chunk:
+            return chunk
+
+
+@pytest.mark.parametrize(
+    "render_formset", [render, stream, first_form], ids=["render", "stream", "first"]
+)
+def test_formset(benchmark, render_formset):
+    benchmark.group = "formset-%s" % FORMS
+    benchmark.pedantic(
+        render_formset, setup=lambda: (formset_and_helper(), {}), rounds=3
+    )
@@ -0,0 +1,67 @@
+"""
+Per-field cost of classifying widgets in ``bulma/field.html``: the chain of
+``is_*`` filters the template used to run against the cached widget kind.
+"""
+
+import pytest
+
+from crispy_bulma.kinds import widget_kind
+from crispy_bulma.templatetags.crispy_forms_bulma_field import (
+    is_checkbox,
+    is_checkboxselectmultiple,
+    is_radioselect,
+    is_select,
+)
+from tests.forms import (
+    CheckboxesSampleForm,
+    FileForm,
+    GroupedChoiceForm,
+    InputsForm,
+    SampleForm,
+    SampleForm5,
+    SampleFormCustomWidgets,
+)
+
+FORMS = [
+    CheckboxesSampleForm,
+    FileForm,
+    GroupedChoiceForm,
+    InputsForm,
+    SampleForm,
+    SampleForm5,
+    SampleFormCustomWidgets,
+]
+
+
+@pytest.fixture
+def fields():
+    return [field for form_class in FORMS for field in form_class()]
+
+
+def classify_with_filters(fields):
+    for field in fields:
+        # the filters field.html used to run for the label ...
+        if not is_checkbox(field):
+            is_radioselect(field) or is_checkboxselectmultiple(field)
+        # ... and for the field body
+        (
+            is_select(field)
+            or is_radioselect(field)
+            or is_checkbox(field)
+            or is_checkboxselectmultiple(field)
+        )
+
+
+def classify_with_widget_kind(fields):
+    for field in fields:
+        widget_kind(field)
+
+
+@pytest.mark.benchmark(group="widget-kind")
+def test_is_filters(benchmark, fields):
+    benchmark(classify_with_filters, fields)
+
+
+@pytest.mark.benchmark(group="widget-kind")
+def test_widget_kind(benchmark, fields):
+    benchmark(classify_with_widget_kind, fields)
@@ -0,0 +1,34 @@
+"""
+Async rendering.
+
+Rendering a form is synchronous: the templates are rendered on the calling
+thread and the choices of model choice fields are fetched with the sync ORM,
+which Django refuses to run in the event loop. ``arender_crispy_form``
+fetches the choices with the async ORM first and then renders the form in
+the thread ``sync_to_async`` runs sync code in, so the event loop keeps
+serving other requests meanwhile::
+
+    async def signup(request):
+        form = SignupForm()
+        html = await arender_crispy_form(form, context={"csrf_token": get_token(request)})
+        return HttpResponse(html)
+
+The layout objects of ``crispy_bulma.layout`` have an ``arender`` method for
+the same purpose.
+"""
+
+from asgiref.sync import sync_to_async
+
+from crispy_bulma.choices import aprefetch_choices, choice_cache
+from crispy_forms.utils import render_crispy_form
+
+
+async def arender_crispy_form(form, helper=None, context=None):
+    """
+    Async version of ``render_crispy_form``. The choices of the model choice
+    fields of ``form``, or of the forms of a formset, are fetched before the
+    form is rendered.
+    """
+    with choice_cache():
+        await aprefetch_choices(form)
+        return await sync_to_async(render_crispy_form)(form, helper, context)
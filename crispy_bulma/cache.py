@@ -0,0 +1,264 @@
+"""
+Fragment cache for unbound forms.
+
+An unbound form renders the same HTML on every request, except for values
+such as the CSRF token or a CSP nonce. ``render_cached_form`` renders the
+form once with placeholders for these values, stores the HTML in a Django
+cache and substitutes the placeholders of the current request on every
+render::
+
+    html = render_cached_form(form, helper, {"csrf_token": get_token(request)})
+
+or in a template::
+
+    {% load crispy_forms_bulma_field %}
+    {% crispy_cached form helper %}
+
+The cache key is made of the form class, prefix and initial data, its
+fields, the helper, the active language and time zone, the crispy-bulma
+version and a fingerprint of the templates, so changing any of them renders
+the form again. The fields are described by their attributes, including
+choices, initial values and widget attributes set in the form's
+``__init__``, and querysets by their SQL. Values the form output depends on
+otherwise, e.g. a layout using the current user, must be passed as
+``vary_on``.
+
+Settings:
+
+``CRISPY_BULMA_FORM_CACHE``
+    The alias of the cache, ``"default"`` by default.
+``CRISPY_BULMA_FORM_CACHE_TIMEOUT``
+    The timeout of the cached forms, the default timeout of the cache by
+    default.
+``CRISPY_BULMA_FORM_CACHE_HOLES``
+    The context variables substituted on every render, ``("csrf_token",
+    "csp_nonce")`` by default.
+"""
+
+import hashlib
+import os
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.exceptions import EmptyResultSet
+from django.core.signals import setting_changed
+from django.db.models import Model
+from django.db.models.query import QuerySet
+from django.dispatch import receiver
+from django.forms import BaseForm, Field
+from django.forms.formsets import BaseFormSet
+from django.template.loader import get_template
+from django.utils import timezone, translation
+from django.utils.autoreload import file_changed
+from django.utils.functional import Promise
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
+
+import crispy_bulma
+from crispy_bulma.fast_fields import TEMPLATES_DIR
+from crispy_forms.utils import TEMPLATE_PACK, render_crispy_form
+
+DEFAULT_HOLES = ("csrf_token", "csp_nonce")
+
+# values of the {% csrf_token %} tag and context processor meaning "no token"
+EMPTY_VALUES = (None, "", "NOTPROVIDED")
+
+PLACEHOLDER = "\x00crispy-bulma-hole:%s\x00"
+
+# attributes of helpers and layout objects that don't change the output
+IGNORED_ATTRIBUTES = frozenset(["_render_plans", "bound_fields"])
+
+# attributes of form fields that don't change the output of unbound forms
+IGNORED_FIELD_ATTRIBUTES = frozenset(["error_messages", "validators"])
+
+_templates_fingerprints = {}
+
+
+@receiver(setting_changed)
+def _reset_fingerprints(*, setting, **kwargs):
+    if setting == "TEMPLATES":
+        _templates_fingerprints.clear()
+
+
+@receiver(file_changed)
+def _template_changed(*, file_path, **kwargs):
+    if file_path.suffix != ".py":
+        _templates_fingerprints.clear()
+
+
+def get_cache():
+    return caches[getattr(settings, "CRISPY_BULMA_FORM_CACHE", "default")]
+
+
+def get_holes(context):
+    """
+    Returns the ``{name: value}`` of the per-request values in ``context``.
+    """
+    holes = {}
+    for name in getattr(settings, "CRISPY_BULMA_FORM_CACHE_HOLES", DEFAULT_HOLES):
+        value = context.get(name)
+        if value not in EMPTY_VALUES:
+            holes[name] = value
+    return holes
+
+
+def describe(value, seen=frozenset()):
+    """
+    Returns a hashable description of ``value`` that is stable between
+    processes for plain values, layout objects and helpers.
+    """
+    if isinstance(value, Promise):
+        return str(value)
+    if value is None or isinstance(value, (str, bytes, bool, int, float, Decimal)):
+        return repr(value)
+    if isinstance(value, type) or (callable(value) and hasattr(value, "__qualname__")):
+        return "%s.%s" % (value.__module__, value.__qualname__)
+    if isinstance(value, (BaseForm, BaseFormSet)):
+        # e.g. FormHelper.form, the form is part of the key already
+        return describe(type(value))
+    if isinstance(value, QuerySet):
+        return describe_queryset(value)
+    if isinstance(value, Field) and id(value) not in seen:
+        attributes = {
+            name: attribute
+            for name, attribute in vars(value).items()
+            if name not in IGNORED_FIELD_ATTRIBUTES
+        }
+        return (describe(type(value)), describe(attributes, seen | {id(value)}))
+    if isinstance(value, Model) and value.pk is not None:
+        return (describe(type(value)), repr(value.pk))
+    if id(value) in seen:
+        return "<recursion>"
+
+    seen = seen | {id(value)}
+    if isinstance(value, dict):
+        items = ((str(key), describe(item, seen)) for key, item in value.items())
+        return tuple(sorted(items, key=lambda item: item[0]))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(describe(item, seen)) for item in value))
+    if isinstance(value, (list, tuple)):
+        return tuple(describe(item, seen) for item in value)
+    if hasattr(value, "__dict__"):
+        attributes = {
+            name: attribute
+            for name, attribute in vars(value).items()
+            if name not in IGNORED_ATTRIBUTES
+        }
+        return (describe(type(value)), describe(attributes, seen))
+    return repr(value)
+
+
+def describe_queryset(queryset):
+    """
+    Returns a description of ``queryset`` by its SQL, without fetching it.
+    """
+    try:
+        sql, params = queryset.query.get_compiler(using=queryset.db).as_sql()
+    except EmptyResultSet:
+        sql, params = None, ()
+    return (
+        describe(QuerySet),
+        describe(queryset.model),
+        queryset.db,
+        sql,
+        describe(list(params)),
+        describe(list(queryset._prefetch_related_lookups)),
+    )
+
+
+def templates_fingerprint(template_pack, template_names=()):
+    """
+    Returns a hash of the source of the templates of ``template_pack`` and of
+    ``template_names`` as resolved by the template engines, so overriding or
+    editing any of them changes the fingerprint. Computed once per process
+    and whenever the templates change.
+    """
+    key = (template_pack, template_names)
+    try:
+        return _templates_fingerprints[key]
+    except KeyError:
+        pass
+
+    names = []
+    pack_dir = os.path.join(TEMPLATES_DIR, template_pack)
+    for root, dirs, files in os.walk(pack_dir):
+        for filename in files:
+            path = os.path.join(root, filename)
+            names.append(os.path.relpath(path, TEMPLATES_DIR).replace(os.sep, "/"))
+
+    digest = hashlib.sha256()
+    for name in sorted(names) + [name for name in template_names if name]:
+        digest.update(name.encode())
+        digest.update(get_template(name).template.source.encode())
+
+    fingerprint = _templates_fingerprints[key] = digest.hexdigest()
+    return fingerprint
+
+
+def cache_key(form, helper=None, holes=(), vary_on=()):
+    """
+    Returns the cache key of the unbound ``form`` rendered with ``helper``.
+    """
+    if helper is None:
+        helper = getattr(form, "helper", None)
+    template_pack = str(getattr(helper, "template_pack", None) or TEMPLATE_PACK)
+    template_names = (
+        getattr(helper, "template", None),
+        getattr(helper, "field_template", None),
+    )
+    description = (
+        crispy_bulma.__version__,
+        template_pack,
+        templates_fingerprint(template_pack, template_names),
+        translation.get_language(),
+        timezone.get_current_timezone_name(),
+        describe(type(form)),
+        describe(form.prefix),
+        describe(getattr(form, "auto_id", None)),
+        describe(form.initial),
+        # e.g. choices or querysets set in __init__ for the current user
+        describe(list(form.fields.items())),
+        describe(helper),
+        tuple(sorted(holes)),
+        describe(list(vary_on)),
+    )
+    digest = hashlib.sha256(repr(description).encode())
+    return "crispy_bulma.form.%s" % digest.hexdigest()
+
+
+def get_or_render(key, render):
+    """
+    Returns the HTML cached under ``key``, calling ``render()`` and caching
+    its result on a miss.
+    """
+    cache = get_cache()
+    html = cache.get(key)
+    if html is None:
+        html = str(render())
+        timeout = getattr(settings, "CRISPY_BULMA_FORM_CACHE_TIMEOUT", DEFAULT_TIMEOUT)
+        cache.set(key, html, timeout)
+    return html
+
+
+def render_cached_form(form, helper=None, context=None, vary_on=()):
+    """
+    Renders ``form`` like ``render_crispy_form``, from the cache if the form
+    is unbound. ``vary_on`` are additional values the output depends on.
+    """
+    context = {} if context is None else context
+    if form.is_bound:
+        return render_crispy_form(form, helper, context)
+
+    holes = get_holes(context)
+    placeholders = {name: PLACEHOLDER % name for name in holes}
+    html = get_or_render(
+        cache_key(form, helper, holes, vary_on),
+        lambda: render_crispy_form(form, helper, {**context, **placeholders}),
+    )
+    for name, value in holes.items():
+        placeholder = PLACEHOLDER % name
+        if placeholder in html:
+            html = html.replace(placeholder, conditional_escape(value))
+    return mark_safe(html)
@@ -0,0 +1,222 @@
+"""
+Opt-in cache of the choices of ``ModelChoiceField`` and
+``ModelMultipleChoiceField``.
+
+Iterating the choices of a model choice field runs its queryset, so a form
+rendered twice, or a formset whose forms share a queryset, runs the same
+query once per render. Inside a ``choice_cache()`` scope the crispy-bulma
+widgets and choice templates fetch the objects of each distinct query once,
+keyed by database alias, model, SQL and parameters::
+
+    with choice_cache():
+        html = render_crispy_form(formset)
+
+The scope can also be the whole request with ``choice_cache_middleware``, or
+a part of a template with ``{% choice_cache %}...{% endchoice_cache %}``.
+``assert_no_duplicate_choice_queries()`` reports choices fetched more than
+once, e.g. in tests.
+
+``prefetch_choices(form)`` fetches the choices of a form into the cache up
+front, so rendering the form afterwards doesn't query the database, and
+``aprefetch_choices(form)`` does so with the async ORM.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+from django.core.exceptions import EmptyResultSet
+from django.forms.formsets import BaseFormSet
+from django.forms.models import ModelChoiceIterator
+
+_cache = ContextVar("crispy_bulma_choice_cache", default=None)
+_queries = ContextVar("crispy_bulma_choice_queries", default=None)
+
+
+@contextmanager
+def choice_cache():
+    """
+    Caches the choices of model choice fields rendered inside the block.
+    Nested blocks share the cache of the outermost one.
+    """
+    if _cache.get() is not None:
+        yield
+        return
+
+    token = _cache.set({})
+    try:
+        yield
+    finally:
+        _cache.reset(token)
+
+
+def choice_cache_middleware(get_response):
+    """
+    Caches the choices of model choice fields for the duration of a request.
+    """
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            with choice_cache():
+                return await get_response(request)
+
+        markcoroutinefunction(middleware)
+
+    else:
+
+        def middleware(request):
+            with choice_cache():
+                return get_response(request)
+
+    return middleware
+
+
+choice_cache_middleware.sync_capable = True
+choice_cache_middleware.async_capable = True
+
+
+@contextmanager
+def assert_no_duplicate_choice_queries():
+    """
+    Raises ``AssertionError`` if the choices of a model choice field are
+    fetched more than once with the same query inside the block::
+
+        with assert_no_duplicate_choice_queries():
+            render_crispy_form(formset)
+    """
+    queries = Counter()
+    token = _queries.set(queries)
+    try:
+        yield queries
+    finally:
+        _queries.reset(token)
+
+    duplicates = [
+        "%dx %s %s" % (count, sql, params)
+        for (alias, model, sql, params, lookups), count in queries.items()
+        if count > 1
+    ]
+    if duplicates:
+        raise AssertionError(
+            "%d choice queries were executed more than once:\n%s"
+            % (len(duplicates), "\n".join(duplicates))
+        )
+
+
+def query_key(queryset):
+    """
+    Returns the cache key of ``queryset`` or ``None`` if it can't be cached.
+    """
+    query = queryset.query
+    try:
+        sql, params = query.get_compiler(using=queryset.db).as_sql()
+        key = (
+            queryset.db,
+            queryset.model,
+            sql,
+            tuple(params),
+            tuple(queryset._prefetch_related_lookups),
+        )
+        hash(key)
+    except (EmptyResultSet, TypeError):
+        return None
+    return key
+
+
+def get_choices(choices):
+    """
+    Returns ``choices``, or a list of them if ``choices`` are the choices of a
+    model choice field and the objects were fetched through the cache.
+    """
+    if not isinstance(choices, ModelChoiceIterator):
+        return choices
+
+    cache = _cache.get()
+    queries = _queries.get()
+    queryset = choices.queryset
+    if (cache is None and queries is None) or queryset._result_cache is not None:
+        return choices
+
+    key = query_key(queryset)
+    if key is None:
+        return choices
+
+    if cache is None:
+        queries[key] += 1
+        return choices
+
+    try:
+        objs = cache[key]
+    except KeyError:
+        if queries is not None:
+            queries[key] += 1
+        # same as ModelChoiceIterator.__iter__
+        if not queryset._prefetch_related_lookups:
+            queryset = queryset.iterator()
+        objs = cache[key] = list(queryset)
+
+    field = choices.field
+    cached = [choices.choice(obj) for obj in objs]
+    if field.empty_label is not None:
+        cached.insert(0, ("", field.empty_label))
+    return cached
+
+
+def prefetch_choices(form, field_names=None):
+    """
+    Fetches the choices of the model choice fields of ``form``, or of the
+    forms of a formset, into the current ``choice_cache()``. ``field_names``
+    limits the fields to prefetch.
+    """
+    cache = _get_prefetch_cache("prefetch_choices")
+    forms = form.forms if isinstance(form, BaseFormSet) else [form]
+    for key, queryset in uncached_querysets(cache, forms, field_names):
+        cache[key] = list(queryset.all())
+
+
+async def aprefetch_choices(form, field_names=None):
+    """
+    Async version of ``prefetch_choices``, the choices are fetched with the
+    async ORM.
+    """
+    cache = _get_prefetch_cache("aprefetch_choices")
+    if isinstance(form, BaseFormSet):
+        # model formsets query their objects to build the forms
+        forms = await sync_to_async(lambda: form.forms)()
+    else:
+        forms = [form]
+    for key, queryset in uncached_querysets(cache, forms, field_names):
+        cache[key] = [obj async for obj in queryset.all()]
+
+
+def _get_prefetch_cache(name):
+    cache = _cache.get()
+    if cache is None:
+        raise RuntimeError("%s() must be called inside choice_cache()." % name)
+    return cache
+
+
+def uncached_querysets(cache, forms, field_names=None):
+    """
+    Yields the cache keys and querysets of the model choice fields of
+    ``forms`` whose objects are not in ``cache``, once per key.
+    """
+    queries = _queries.get()
+    for form in forms:
+        for name, field in form.fields.items():
+            if field_names is not None and name not in field_names:
+                continue
+            choices = getattr(field, "choices", None)
+            if not isinstance(choices, ModelChoiceIterator):
+                continue
+            queryset = choices.queryset
+            if queryset._result_cache is not None:
+                continue
+            key = query_key(queryset)
+            if key is None or key in cache:
+                continue
+            if queries is not None:
+                queries[key] += 1
+            yield key, queryset
@@ -0,0 +1,84 @@
+"""
+Registry of the CSS classes added to widgets by ``{% crispy_field %}``.
+
+Widgets are looked up by their lowercased class name, e.g. ``textinput``. The
+table is built once from the defaults below, the converters registered by apps
+and ``settings.CRISPY_CLASS_CONVERTERS`` (in that order of precedence) and is
+rebuilt whenever one of them changes.
+"""
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+DEFAULT_CONVERTERS = {
+    "dateinput": "dateinput input",
+    "datetimeinput": "datetimeinput input",
+    "textinput": "input",
+    "fileinput": "fileinput",
+    "clearablefileinput": "clearablefileinput",
+    "passwordinput": "input",
+    "emailinput": "input",
+    "checkboxinput": "",
+    "select": "",
+    "selectmultiple": "",
+    "numberinput": "numberinput input",
+    "timeinput": "timeinput input",
+    "urlinput": "urlinput input",
+    # custom widget
+    "fileuploadinput": "file-input",
+}
+
+_registered = {}
+_converters = None
+
+
+def _widget_key(widget):
+    if isinstance(widget, str):
+        return widget.lower()
+    return widget.__name__.lower()
+
+
+def register_converter(widget, css_class):
+    """
+    Registers the CSS classes ``{% crispy_field %}`` adds to ``widget``.
+
+    ``widget`` can be a widget class or its class name. Converters defined in
+    ``settings.CRISPY_CLASS_CONVERTERS`` still take precedence::
+
+        register_converter(ColorInput, "input is-color")
+    """
+    _registered[_widget_key(widget)] = css_class
+    clear_converters()
+
+
+def unregister_converter(widget):
+    """
+    Removes a converter previously added with ``register_converter``.
+    """
+    _registered.pop(_widget_key(widget), None)
+    clear_converters()
+
+
+def get_converters():
+    """
+    Returns the resolved ``{class name: css classes}`` table.
+    """
+    global _converters
+    converters = _converters
+    if converters is None:
+        converters = {**DEFAULT_CONVERTERS, **_registered}
+        converters.update(getattr(settings, "CRISPY_CLASS_CONVERTERS", {}))
+        _converters = converters
+    return converters
+
+
+def clear_converters():
+    global _converters
+    _converters = None
+
+
+@receiver(setting_changed)
+def _reset_converters(*, setting, **kwargs):
+    if setting == "CRISPY_CLASS_CONVERTERS":
+        clear_converters()
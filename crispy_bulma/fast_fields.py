@@ -0,0 +1,241 @@
+"""
+Python fast path for ``bulma/field.html``.
+
+When ``CRISPY_BULMA_FAST_FIELDS`` is enabled, the ``{% fast_field %}`` tag
+wrapping ``bulma/field.html`` renders the field wrapper, label, control, errors
+and help text in Python instead of running the template and its includes. The
+output is byte-identical to the templates below, so the fast path is only used
+while none of them is overridden by the project and ``field.html`` is not
+extended by another template (e.g. ``layout/input_with_icon.html``).
+"""
+
+import os
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template.base import render_value_in_context
+from django.template.loader_tags import BLOCK_CONTEXT_KEY
+from django.utils.safestring import mark_safe
+
+from crispy_bulma import kinds
+from crispy_bulma.rendering import render_choices, render_widget
+
+FIELD_TEMPLATES = (
+    "bulma/field.html",
+    "bulma/layout/checkboxinput.html",
+    "bulma/layout/checkboxselectmultiple.html",
+    "bulma/layout/help_text.html",
+    "bulma/layout/radioselect.html",
+    "bulma/layout/select.html",
+)
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+# the flattened variants of the templates, see crispy_bulma.flatten
+FLAT_TEMPLATES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "flat_templates"
+)
+
+_overridden = {}
+
+
+def templates_overridden(engine):
+    """
+    Returns whether ``engine`` resolves any of ``FIELD_TEMPLATES`` to another
+    file than the one shipped with crispy-bulma or its flattened variant. The
+    answer is cached per engine.
+    """
+    try:
+        return _overridden[engine]
+    except KeyError:
+        pass
+
+    overridden = False
+    for name in FIELD_TEMPLATES:
+        path = os.path.abspath(engine.get_template(name).origin.name)
+        if path not in (
+            os.path.join(TEMPLATES_DIR, name),
+            os.path.join(FLAT_TEMPLATES_DIR, name),
+        ):
+            overridden = True
+            break
+
+    _overridden[engine] = overridden
+    return overridden
+
+
+@receiver(setting_changed)
+def _reset_overridden(*, setting, **kwargs):
+    if setting == "TEMPLATES":
+        _overridden.clear()
+
+
+def uses_shipped_templates(context):
+    """
+    Returns whether the field in ``context`` is rendered with the templates
+    shipped with crispy-bulma, i.e. ``bulma/field.html`` is not extended and
+    none of ``FIELD_TEMPLATES`` is overridden.
+    """
+    return (
+        "field" in context
+        and context.render_context.get(BLOCK_CONTEXT_KEY) is None
+        and not templates_overridden(context.template.engine)
+    )
+
+
+def can_render(context):
+    """
+    Returns whether the field in ``context`` can be rendered in Python.
+    """
+    return (
+        getattr(settings, "CRISPY_BULMA_FAST_FIELDS", False)
+        and context.autoescape
+        and uses_shipped_templates(context)
+    )
+
+
+def render(context):
+    """
+    Renders the content of ``{% fast_field %}`` in ``bulma/field.html``.
+    """
+    field = context["field"]
+    if field.is_hidden:
+        return "\n\n\n  %s\n" % render_value_in_context(field, context)
+
+    kind = kinds.widget_kind(field)
+    exclude_field_wrapper = context.get("exclude_field_wrapper")
+    form_horizontal = context.get("form_horizontal")
+
+    html = ["\n\n\n\n\n"]
+    if not exclude_field_wrapper:
+        auto_id = render_value_in_context(field.auto_id, context)
+        wrapper_class = context.get("wrapper_class")
+        html.append('\n  <div\n    id="div_%s"\n    class="field' % auto_id)
+        if wrapper_class:
+            html.append(" " + render_value_in_context(wrapper_class, context))
+        if form_horizontal:
+            html.append(" is-horizontal")
+        html.append('"\n  >\n    ')
+        if form_horizontal:
+            html.append('<div class="field-label">')
+        html.append("\n      ")
+        if field.label and kind != kinds.CHECKBOX:
+            html.append(_label(field, kind, context))
+        html.append("\n    ")
+        if form_horizontal:
+            html.append("</div>")
+        html.append("\n\n    ")
+        if form_horizontal:
+            html.append('<div class="field-body"><div class="field">')
+        html.append("\n")
+
+    html.append("\n\n      \n\n      ")
+    if kind == kinds.SELECT or kind == kinds.SELECTMULTIPLE:
+        html.append("\n        %s\n\n      " % _select(field, kind))
+    elif kind == kinds.RADIOSELECT:
+        html.append("\n        %s\n\n      " % _choices(field, "radio", context))
+    elif kind == kinds.CHECKBOX:
+        html.append("\n        %s\n\n      " % _checkbox(field, context))
+    elif kind == kinds.CHECKBOXSELECTMULTIPLE:
+        html.append("\n        %s\n\n      " % _choices(field, "checkbox", context))
+    else:
+        html.append(
+            '\n        <div class="control">\n          \n              %s\n'
+            "          \n        </div>\n      " % _widget(field)
+        )
+    html.append("\n\n      \n\n")
+
+    if not exclude_field_wrapper:
+        html.append("\n      ")
+        if context.get("form_show_errors"):
+            html.append("\n        ")
+            html.extend(_errors(field, context))
+            html.append("\n      ")
+        html.append("\n\n      %s\n    " % _help_text(field, context))
+        if form_horizontal:
+            html.append("</div></div>")
+        html.append("\n  </div>\n")
+
+    html.append("\n\n")
+    return "".join(html)
+
+
+def _widget(field):
+    # {% crispy_field field "class" "is-danger" %} or {% crispy_field field %}
+    if field.errors:
+        return render_widget(field, (("class", "is-danger"),))
+    return render_widget(field)
+
+
+def _label(field, kind, context):
+    html = ["\n        <label "]
+    if kind != kinds.RADIOSELECT and kind != kinds.CHECKBOXSELECTMULTIPLE:
+        html.append('for="%s"' % render_value_in_context(field.id_for_label, context))
+    html.append(' class="label')
+    label_class = context.get("label_class")
+    if label_class:
+        html.append(" " + render_value_in_context(label_class, context))
+    html.append(
+        '">\n          %s\n          ' % render_value_in_context(field.label, context)
+    )
+    if field.field.required:
+        html.append('\n            <span class="asterisk">*</span>\n          ')
+    html.append("\n        </label>\n      ")
+    return "".join(html)
+
+
+def _errors(field, context):
+    auto_id = render_value_in_context(field.auto_id, context)
+    for counter, error in enumerate(field.errors, 1):
+        yield (
+            '\n          <p id="error_%s_%s"\n             class="help is-danger">\n'
+            "            %s\n          </p>\n        "
+            % (
+                render_value_in_context(counter, context),
+                auto_id,
+                render_value_in_context(error, context),
+            )
+        )
+
+
+def _help_text(field, context):
+    # bulma/layout/help_text.html
+    if not field.help_text:
+        return "\n"
+    return '\n  <p id="%s_helptext" class="help">%s</p>\n\n' % (
+        render_value_in_context(field.auto_id, context),
+        render_value_in_context(mark_safe(str(field.help_text)), context),
+    )
+
+
+def _select(field, kind):
+    # bulma/layout/select.html
+    html = ['\n\n<div class="control">\n  <div class="select']
+    if kind == kinds.SELECTMULTIPLE:
+        html.append(" is-multiple")
+    if field.errors:
+        html.append(" is-danger")
+    html.append('">\n    %s\n  </div>\n</div>\n' % render_widget(field))
+    return "".join(html)
+
+
+def _checkbox(field, context):
+    # bulma/layout/checkboxinput.html
+    html = ['\n\n<div class="control">\n  <label ']
+    id_for_label = field.id_for_label
+    if id_for_label:
+        html.append('for="%s" ' % render_value_in_context(id_for_label, context))
+    html.append(
+        'class="checkbox">\n    \n        %s\n    \n    %s\n    '
+        % (_widget(field), render_value_in_context(field.label, context))
+    )
+    if field.field.required:
+        html.append('\n      <span class="asterisk">*</span>\n    ')
+    html.append("\n  </label>\n</div>\n")
+    return "".join(html)
+
+
+def _choices(field, input_type, context):
+    # bulma/layout/radioselect.html and bulma/layout/checkboxselectmultiple.html
+    return "\n\n%s\n" % render_choices(field, input_type, context)
@@ -0,0 +1,238 @@
+"""
+Flattened variants of the Bulma templates.
+
+Every ``{% include %}`` costs a template lookup and a context push, and
+``bulma/field.html`` includes up to five templates for every field. The
+flattened variants of ``FLAT_TEMPLATES`` have their includes and their
+``{% extends %}`` inlined and render the same HTML. They are built into
+``crispy_bulma/flat_templates/`` with::
+
+    python manage.py flatten_templates
+
+and used by ``crispy_bulma.loaders.Loader`` when the
+``CRISPY_BULMA_FLAT_TEMPLATES`` setting is enabled. A flattened template
+starts with a comment listing the templates inlined into it, so the loader
+falls back to the original template when the project overrides any of them.
+
+Includes with a constant template name are replaced by the included template,
+wrapped in ``{% with %}`` for their ``with`` arguments. ``{% include
+field_template %}`` is inlined for the default ``bulma/field.html`` and kept
+for other field templates. The ``{% load %}`` tags of the inlined templates
+are moved to the top.
+"""
+
+import os
+import re
+
+from django.template.base import DebugLexer, TokenType
+from django.template.loader_tags import construct_relative_path
+
+from crispy_bulma.fast_fields import TEMPLATES_DIR
+
+FLAT_TEMPLATES = (
+    "bulma/field.html",
+    "bulma/layout/checkboxselectmultiple_inline.html",
+    "bulma/layout/input_with_icon.html",
+    "bulma/layout/radioselect_inline.html",
+    "bulma/uni_form.html",
+    "bulma/whole_uni_form.html",
+)
+
+# the templates of includes with a variable name that are inlined
+INCLUDE_VARIABLES = {"field_template": "bulma/field.html"}
+
+# tags dropped from extended templates: the Python fast path of
+# bulma/field.html is never used when the template is extended
+EXTENDED_DROPPED_TAGS = ("fast_field", "endfast_field")
+
+HEADER = "{# flattened: %s #}"
+HEADER_RE = re.compile(r"\{# flattened: (.*?) #\}")
+
+
+def read_source(template_name):
+    """
+    Returns the source of the template ``template_name`` shipped with
+    crispy-bulma.
+    """
+    path = os.path.join(TEMPLATES_DIR, *template_name.split("/"))
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def inlined_templates(source):
+    """
+    Returns the names of the templates inlined into the flattened ``source``,
+    or ``None`` if it isn't flattened.
+    """
+    match = HEADER_RE.match(source)
+    if match is None:
+        return None
+    return match.group(1).split()
+
+
+def tokenize(source):
+    """
+    Returns the tokens of ``source`` with their source text.
+    """
+    return [
+        (token, source[token.position[0] : token.position[1]])
+        for token in DebugLexer(source).tokenize()
+    ]
+
+
+def find_blocks(tokens):
+    """
+    Returns the ``(start, end)`` indexes of the ``{% block %}`` and
+    ``{% endblock %}`` tokens of the top level blocks in ``tokens``, by name.
+    """
+    blocks = {}
+    depth = 0
+    for i, (token, text) in enumerate(tokens):
+        if token.token_type != TokenType.BLOCK:
+            continue
+        bits = token.split_contents()
+        if bits[0] == "block":
+            if depth == 0:
+                name, start = bits[1], i
+            depth += 1
+        elif bits[0] == "endblock":
+            depth -= 1
+            if depth == 0:
+                blocks[name] = (start, i)
+    return blocks
+
+
+class Flattener:
+    """
+    Flattens templates read with ``get_source(template_name)``, collecting
+    the ``{% load %}`` tags and the names of the inlined templates.
+    """
+
+    def __init__(self, get_source=read_source):
+        self.get_source = get_source
+        self.loads = []
+        self.inlined = []
+
+    def flatten(self, template_name):
+        """
+        Returns the flattened source of ``template_name``, with the header and
+        the ``{% load %}`` tags.
+        """
+        body = self.inline(template_name)
+        return HEADER % " ".join(self.inlined) + "".join(self.loads) + body
+
+    def add_load(self, text):
+        if text not in self.loads:
+            self.loads.append(text)
+
+    def add_inlined(self, template_name):
+        if template_name not in self.inlined:
+            self.inlined.append(template_name)
+
+    def inline(self, template_name):
+        """
+        Returns the flattened source of ``template_name`` without its
+        ``{% load %}`` tags.
+        """
+        tokens = tokenize(self.get_source(template_name))
+        for token, text in tokens:
+            if token.token_type == TokenType.BLOCK:
+                if token.split_contents()[0] == "extends":
+                    return self.inline_extends(template_name, token, tokens)
+                break
+
+        return "".join(self.inline_tokens(template_name, tokens))
+
+    def inline_tokens(self, template_name, tokens):
+        """
+        Returns the source of ``tokens`` with the includes inlined and the
+        ``{% load %}`` tags removed, by token.
+        """
+        html = []
+        for token, text in tokens:
+            if token.token_type == TokenType.BLOCK:
+                bits = token.split_contents()
+                if bits[0] == "load":
+                    self.add_load(text)
+                    text = ""
+                elif bits[0] == "include":
+                    text = self.inline_include(template_name, bits, text)
+            html.append(text)
+        return html
+
+    def inline_include(self, template_name, bits, text):
+        if len(bits) < 2 or bits[2:3] not in ([], ["with"]) or "only" in bits:
+            return text
+        name = bits[1]
+        if name[0] in "'\"" and name[-1] == name[0]:
+            included = construct_relative_path(template_name, name)[1:-1]
+            default = None
+        elif name in INCLUDE_VARIABLES:
+            included = INCLUDE_VARIABLES[name]
+            default = text
+        else:
+            return text
+
+        self.add_inlined(included)
+        html = self.inline(included)
+        if bits[2:]:
+            html = "{%% with %s %%}%s{%% endwith %%}" % (" ".join(bits[3:]), html)
+        if default is not None:
+            html = '{%% if %s == "%s" %%}%s{%% else %%}%s{%% endif %%}' % (
+                name,
+                included,
+                html,
+                default,
+            )
+        return html
+
+    def inline_extends(self, template_name, extends, tokens):
+        bits = extends.split_contents()
+        parent = construct_relative_path(template_name, bits[1])[1:-1]
+        child = self.inline_tokens(template_name, tokens)
+        blocks = {
+            name: "".join(child[start + 1 : end])
+            for name, (start, end) in find_blocks(tokens).items()
+        }
+        if any("block.super" in content for content in blocks.values()):
+            raise ValueError("%s uses block.super" % template_name)
+
+        self.add_inlined(parent)
+        parent_tokens = tokenize(self.get_source(parent))
+        parent_blocks = {
+            start: (name, end)
+            for name, (start, end) in find_blocks(parent_tokens).items()
+            if name in blocks
+        }
+        html = []
+        i = 0
+        while i < len(parent_tokens):
+            token, text = parent_tokens[i]
+            if i in parent_blocks:
+                name, end = parent_blocks[i]
+                html.append(text + blocks[name] + parent_tokens[end][1])
+                i = end + 1
+                continue
+            if token.token_type == TokenType.BLOCK:
+                tag = token.split_contents()[0]
+                if tag == "extends":
+                    raise ValueError("%s extends another template" % parent)
+                if tag in EXTENDED_DROPPED_TAGS:
+                    text = ""
+            html.extend(self.inline_tokens(parent, [(token, text)]))
+            i += 1
+        return "".join(html)
+
+
+def flatten_template(template_name, get_source=read_source):
+    """
+    Returns the flattened source of ``template_name``.
+    """
+    return Flattener(get_source).flatten(template_name)
+
+
+def flatten_templates(get_source=read_source):
+    """
+    Returns the flattened sources of ``FLAT_TEMPLATES``, by template name.
+    """
+    return {name: flatten_template(name, get_source) for name in FLAT_TEMPLATES}
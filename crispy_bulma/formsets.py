@@ -0,0 +1,50 @@
+"""
+Client-side rows for formsets.
+
+Adding a row to a dynamic formset usually means a request to render the
+next form. With ``render_empty_form`` set on a ``crispy_bulma.helper.FormHelper``
+the formset template renders ``formset.empty_form`` once more, inside a
+``<template>`` element after the forms::
+
+    helper = FormHelper()
+    helper.render_empty_form = True
+
+``crispy_bulma/formset.js`` clones the template for every added row, replacing
+``__prefix__`` with the index of the new form and updating the
+``TOTAL_FORMS`` of the management form. The HTML of the empty form is stored
+in the fragment cache of ``crispy_bulma.cache``, per formset class, prefix
+and helper.
+"""
+
+from django.utils.html import format_html
+
+from crispy_bulma.cache import cache_key, get_or_render
+from crispy_bulma.helper import layout_renderer
+from crispy_bulma.rendering import push_context, render_template
+from crispy_forms.utils import TEMPLATE_PACK
+
+
+def render_empty_form(formset, helper, context):
+    """
+    Returns the ``<template>`` element with the empty form of ``formset``,
+    rendered like the forms in the formset template with ``context``.
+    """
+    form = formset.empty_form
+    template_pack = str(context.get("template_pack") or TEMPLATE_PACK)
+    key = cache_key(form, helper, vary_on=(type(formset), "empty_form"))
+    html = get_or_render(key, lambda: render_form(form, helper, context, template_pack))
+    return format_html(
+        '<template data-formset-prefix="{}">{}</template>', formset.prefix, html
+    )
+
+
+def render_form(form, helper, context, template_pack=TEMPLATE_PACK):
+    """
+    Renders ``form`` with ``display_form.html``, like the formset template
+    renders each of its forms.
+    """
+    if helper.layout:
+        render_layout = layout_renderer(helper, template_pack)
+        with push_context(context, formset_form=form):
+            form.form_html = render_layout(form, context)
+    return render_template("%s/display_form.html" % template_pack, context, form=form)
@@ -0,0 +1,231 @@
+"""
+Rendering parts of a form.
+
+Inline validation and HTMX-style updates replace a single field or layout
+object of a form after a change. ``render_fragment`` renders only that part,
+with the markup it has in the whole form, i.e. the field wrapper, label,
+errors and help text of ``bulma/field.html`` or the template of the layout
+object holding the field::
+
+    html = render_fragment(form, "email", helper)
+    html = render_fragment(form, (1, 0), helper)  # helper.layout[1][0]
+
+A field name renders the field like the layout of ``helper`` does: a field
+wrapped by a layout object other than ``Div``, ``Row``, ``Column`` or
+``Fieldset``, e.g. ``IconField`` or ``FormGroup``, renders that object. A
+sequence of indices renders the layout object at that path of the layout.
+``FragmentMixin`` renders the fragment named by a request parameter in form
+views.
+"""
+
+import copy
+
+from django.http import Http404, HttpResponse
+from django.template import Context
+
+from crispy_bulma.layout import FormGroup
+from crispy_forms.helper import FormHelper
+from crispy_forms.layout import Div, Field, Fieldset, Layout
+from crispy_forms.templatetags.crispy_forms_tags import CrispyFormNode
+from crispy_forms.utils import TEMPLATE_PACK, render_field
+
+# layout objects whose fields render the same inside and outside of them
+CONTAINERS = (Layout, Div, Fieldset)
+
+
+def render_fragment(form, target, helper=None, context=None):
+    """
+    Renders the field named ``target`` of ``form``, or the layout object at
+    the path ``target`` of the layout of ``helper``, with the markup it has
+    in ``render_crispy_form(form, helper, context)``. Raises ``LookupError``
+    if there is no such field or layout object.
+    """
+    return render_fragments(form, [target], helper, context)[0]
+
+
+def render_fragments(form, targets, helper=None, context=None):
+    """
+    Returns the list of the fragments ``targets`` of ``form``, see
+    ``render_fragment``, rendered with one context.
+    """
+    helper, context, template_pack = form_context(form, helper, context)
+    layout_objects = [get_fragment_object(form, target, helper) for target in targets]
+    form.rendered_fields = set()
+    form.crispy_field_template = helper.field_template
+    return [
+        render_field(layout_object, form, context, template_pack=template_pack)
+        for layout_object in layout_objects
+    ]
+
+
+def fragment_id(form, target, helper=None):
+    """
+    Returns the id of the element ``render_fragment(form, target, helper)``
+    renders, which it replaces in the whole form: the ``div_<auto_id>``
+    wrapper of ``bulma/field.html`` for fields, or the ``css_id`` of the
+    layout object, e.g. of the ``FormGroup`` holding the field. Returns
+    ``None`` if that element has no id.
+    """
+    layout_object = get_fragment_object(form, target, get_helper(form, helper))
+    if isinstance(layout_object, Field):
+        names = field_names(layout_object)
+        if len(names) != 1:
+            return None
+        layout_object = names[0]
+    if isinstance(layout_object, str):
+        auto_id = form[layout_object].auto_id
+        return "div_%s" % auto_id if auto_id else None
+    if isinstance(layout_object, FormGroup):
+        return layout_object.id
+    return getattr(layout_object, "css_id", None)
+
+
+def get_fragment_object(form, target, helper):
+    """
+    Returns the field name or layout object the fragment ``target`` of
+    ``form`` is rendered from, see ``render_fragment``.
+    """
+    if not isinstance(target, str):
+        return get_layout_object(helper.layout, target)
+    layout_object = find_field(helper.layout, target)
+    if layout_object is None:
+        if target not in form.fields:
+            raise KeyError("Form has no field %r." % target)
+        return target
+    return layout_object
+
+
+def get_helper(form, helper=None):
+    if helper is None:
+        helper = getattr(form, "helper", None) or FormHelper()
+    return helper
+
+
+def form_context(form, helper=None, context=None):
+    """
+    Returns the helper, the context the layout of ``form`` is rendered with
+    and the template pack, see ``CrispyFormNode.get_render``.
+    """
+    helper = get_helper(form, helper)
+
+    node = CrispyFormNode("form", "helper")
+    if getattr(helper, "template_pack", None):
+        node.template_pack = helper.template_pack
+    template_pack = node.template_pack or TEMPLATE_PACK
+
+    context = Context(context)
+    context.update({"form": form, "helper": helper})
+    response_dict = node.get_response_dict(helper, context, False)
+    context.update({"is_bound": form.is_bound})
+    context.update(response_dict)
+    return helper, context, template_pack
+
+
+def find_field(layout, name):
+    """
+    Returns the layout object ``layout`` renders the field ``name`` with,
+    ``None`` if it is rendered as a plain field or not part of the layout.
+    """
+    for layout_object in getattr(layout, "fields", ()):
+        if layout_object == name:
+            return None
+        if name not in field_names(layout_object):
+            continue
+        if isinstance(layout_object, CONTAINERS):
+            return find_field(layout_object, name)
+        if isinstance(layout_object, Field) and len(layout_object.fields) > 1:
+            # a Field with several fields renders each with the same attributes
+            layout_object = copy.copy(layout_object)
+            layout_object.fields = [name]
+        return layout_object
+    return None
+
+
+def field_names(layout_object):
+    if isinstance(layout_object, str):
+        return [layout_object]
+    get_prefetch_field_names = getattr(layout_object, "get_prefetch_field_names", None)
+    if get_prefetch_field_names is not None:
+        return get_prefetch_field_names()
+    if hasattr(layout_object, "get_field_names"):
+        return [pointer.name for pointer in layout_object.get_field_names()]
+    return []
+
+
+def get_layout_object(layout, path):
+    """
+    Returns the layout object at the sequence of indices ``path``.
+    """
+    layout_object = layout
+    for index in path:
+        fields = getattr(layout_object, "fields", None)
+        if not isinstance(fields, list) or not -len(fields) <= index < len(fields):
+            raise IndexError("Layout has no object at %r." % (tuple(path),))
+        layout_object = fields[index]
+    if layout_object is layout:
+        raise IndexError("The layout itself is not a fragment.")
+    return layout_object
+
+
+def parse_target(value):
+    """
+    Returns the fragment target of a request parameter: a field name, or a
+    layout path of dot separated indices, e.g. ``"1.0"``.
+    """
+    parts = value.split(".")
+    if all(part.isdigit() for part in parts):
+        return tuple(int(part) for part in parts)
+    return value
+
+
+class FragmentMixin:
+    """
+    Mixin for views using ``FormMixin``, e.g. ``FormView`` or ``UpdateView``.
+    If the request has a ``fragment`` parameter, only that field or layout
+    path of the form is rendered, see ``render_fragment``. Submitted forms
+    are validated but never saved by fragment requests::
+
+        class SignupView(FragmentMixin, FormView):
+            form_class = SignupForm
+
+    ``<input hx-post="/signup/?fragment=email" hx-target="#div_id_email">``
+    re-renders the email field with its errors.
+    """
+
+    fragment_parameter = "fragment"
+
+    def get_fragment(self):
+        """
+        Returns the requested fragment target, or ``None``.
+        """
+        value = self.request.GET.get(self.fragment_parameter)
+        if value is None:
+            value = self.request.POST.get(self.fragment_parameter)
+        if not value:
+            return None
+        return parse_target(value)
+
+    def get_fragment_helper(self, form):
+        return getattr(form, "helper", None)
+
+    def form_valid(self, form):
+        if self.get_fragment() is not None:
+            return self.render_to_response(self.get_context_data(form=form))
+        return super().form_valid(form)
+
+    def render_to_response(self, context, **response_kwargs):
+        target = self.get_fragment()
+        if target is None:
+            return super().render_to_response(context, **response_kwargs)
+
+        form = context["form"]
+        try:
+            html = render_fragment(
+                form,
+                target,
+                self.get_fragment_helper(form),
+                {**context, "request": self.request},
+            )
+        except LookupError:
+            raise Http404("No fragment %r in the form." % (target,))
+        return HttpResponse(html, **response_kwargs)
@@ -0,0 +1,112 @@
+from django.utils.safestring import mark_safe
+
+from crispy_bulma.plans import compile_layout
+from crispy_forms.helper import FormHelper as CrispyFormHelper
+from crispy_forms.utils import TEMPLATE_PACK, list_difference, render_field
+
+__all__ = ["FormHelper"]
+
+
+class FormHelper(CrispyFormHelper):
+    """
+    ``FormHelper`` that renders its layout from a cached render plan, see
+    ``crispy_bulma.plans``. The plan is compiled on the first render and
+    recompiled whenever the layout or the templates change::
+
+        from crispy_bulma.helper import FormHelper
+
+        helper = FormHelper()
+        helper.layout = Layout(Row(Column("first_name"), Column("last_name")))
+
+    With ``render_empty_form`` set, formsets rendered with the helper include
+    their empty form in a ``<template>`` element, see ``crispy_bulma.formsets``.
+    """
+
+    render_empty_form = False
+
+    def get_attributes(self, template_pack=TEMPLATE_PACK):
+        items = super().get_attributes(template_pack=template_pack)
+        if self.render_empty_form:
+            items["empty_form_helper"] = self
+        return items
+
+    def get_render_plan(self, template_pack=TEMPLATE_PACK):
+        """
+        Returns the render plan of the layout, compiling it if necessary.
+        """
+        plans = self.__dict__.setdefault("_render_plans", {})
+        plan = plans.get(template_pack)
+        if plan is None or plan.layout is not self.layout or not plan.is_current():
+            plan = plans[template_pack] = compile_layout(self.layout, template_pack)
+        return plan
+
+    def clear_render_plan(self):
+        """
+        Drops the cached render plan, e.g. after modifying the attributes of
+        a layout object in place.
+        """
+        self.__dict__.pop("_render_plans", None)
+
+    def render_layout(self, form, context, template_pack=TEMPLATE_PACK):
+        """
+        Returns safe html of the rendering of the layout
+        """
+        plan = self.get_render_plan(template_pack)
+        return render_plan(self, plan, form, context, template_pack)
+
+
+def render_plan(helper, plan, form, context, template_pack=TEMPLATE_PACK):
+    """
+    Renders the layout of ``helper`` from its render ``plan``, like
+    ``FormHelper.render_layout``.
+    """
+    form.rendered_fields = set()
+    form.crispy_field_template = helper.field_template
+
+    # This renders the specified Layout strictly
+    html = plan.render(form, context, template_pack)
+
+    # Rendering some extra fields if specified
+    if (
+        helper.render_unmentioned_fields
+        or helper.render_hidden_fields
+        or helper.render_required_fields
+    ):
+        fields = tuple(form.fields.keys())
+        left_fields_to_render = list_difference(fields, form.rendered_fields)
+        for field in left_fields_to_render:
+            if (
+                helper.render_unmentioned_fields
+                or (helper.render_hidden_fields and form.fields[field].widget.is_hidden)
+                or (
+                    helper.render_required_fields
+                    and form.fields[field].widget.is_required
+                )
+            ):
+                html += render_field(field, form, context, template_pack=template_pack)
+
+    return mark_safe(html)
+
+
+def layout_renderer(helper, template_pack=TEMPLATE_PACK):
+    """
+    Returns a function ``render(form, context)`` rendering the layout of
+    ``helper`` for the forms of a formset. The layout is compiled into a
+    render plan once and shared by all forms, unless the helper renders its
+    layout in its own way.
+    """
+    if type(helper).render_layout is FormHelper.render_layout:
+        plan = helper.get_render_plan(template_pack)
+    elif type(helper).render_layout is CrispyFormHelper.render_layout:
+        plan = compile_layout(helper.layout, template_pack)
+    else:
+
+        def render(form, context):
+            return helper.render_layout(form, context, template_pack=template_pack)
+
+        return render
+
+    def render(form, context):
+        return render_plan(helper, plan, form, context, template_pack)
+
+    return render
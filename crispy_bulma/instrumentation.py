@@ -0,0 +1,232 @@
+"""
+Timing the rendering of forms.
+
+``install()`` wraps the ``render`` methods of the layout objects, the
+``{% crispy_field %}`` and ``{% fast_field %}`` nodes, the steps of render
+plans and Django's ``{% include %}`` tag with timers. Inside a
+``collect_timings()`` block the time spent in each of them is summed up by
+name, e.g. ``"Row"``, ``"crispy_field"`` or ``"include:bulma/errors.html"``::
+
+    install()
+    with collect_timings() as timings:
+        html = render_crispy_form(form, helper)
+    timings.as_dict()  # {"Row": {"count": 4, "duration": 0.0021}, ...}
+
+Timings are inclusive, a ``Row`` includes the fields it renders. Nothing is
+wrapped before ``install()`` is called, so there is no overhead unless
+instrumentation is enabled. ``uninstall()`` restores the original methods.
+
+``ServerTimingMiddleware`` collects the timings of every request when the
+``CRISPY_BULMA_INSTRUMENTATION`` setting is enabled, adds them to the
+``Server-Timing`` header of the response, logs them to the
+``crispy_bulma.instrumentation`` logger and calls the functions registered
+with ``add_timing_hook(hook)`` with the timings and the request.
+"""
+
+import functools
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.template.loader_tags import IncludeNode
+
+from crispy_bulma import layout, plans
+from crispy_bulma.templatetags.crispy_forms_bulma_field import (
+    CrispyBulmaFieldNode,
+    FastFieldNode,
+)
+
+logger = logging.getLogger(__name__)
+
+_timings = ContextVar("crispy_bulma_timings", default=None)
+
+# (class, method name) wrapped by install(), with their original methods
+_installed = {}
+
+_hooks = []
+
+
+class RenderTimings:
+    """
+    The number of renders and their total duration in seconds, by name.
+    """
+
+    def __init__(self):
+        self.timings = {}
+        # e.g. the workers of render_crispy_formset_parallel
+        self.lock = threading.Lock()
+
+    def add(self, name, duration):
+        with self.lock:
+            count, total = self.timings.get(name, (0, 0.0))
+            self.timings[name] = (count + 1, total + duration)
+
+    def as_dict(self):
+        return {
+            name: {"count": count, "duration": duration}
+            for name, (count, duration) in self.timings.items()
+        }
+
+    def server_timing(self):
+        """
+        Returns the value of a ``Server-Timing`` header, durations in ms.
+        """
+        metrics = []
+        for i, (name, (count, duration)) in enumerate(self.timings.items()):
+            description = "%s x%s" % (name, count)
+            metrics.append(
+                'crispy-%s-%s;dur=%.3f;desc="%s"'
+                % (i, re.sub(r"[^\w.-]", "_", name), duration * 1000, description)
+            )
+        return ", ".join(metrics)
+
+
+@contextmanager
+def collect_timings():
+    """
+    Collects the timings of the renders inside the block into the
+    ``RenderTimings`` it yields. Nested blocks share the outer timings.
+    """
+    timings = _timings.get()
+    if timings is not None:
+        yield timings
+        return
+
+    timings = RenderTimings()
+    token = _timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _timings.reset(token)
+
+
+def timed(method, name):
+    """
+    Returns ``method`` timed under the name ``name(self, *args)``.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        timings = _timings.get()
+        if timings is None:
+            return method(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            timings.add(name(self, *args), time.perf_counter() - start)
+
+    return wrapper
+
+
+def class_name(layout_object, *args):
+    return type(layout_object).__name__
+
+
+def include_name(node, context):
+    template = node.template.resolve(context)
+    # a template name, or a template of any engine
+    name = getattr(getattr(template, "template", template), "name", template)
+    return "include:%s" % name
+
+
+def timed_methods():
+    """
+    Returns the ``(class, method name, name)`` of the timed methods.
+    """
+    return [
+        *(
+            (cls, "render", class_name)
+            for cls in (
+                layout.Button,
+                layout.BulmaBaseInput,
+                layout.FormGroup,
+                layout.IconField,
+                layout.Row,
+                layout.Column,
+            )
+        ),
+        (plans.DivStep, "__call__", lambda step, *args: class_name(step.div)),
+        (plans.FieldsetStep, "__call__", lambda step, *args: "Fieldset"),
+        (plans.FormGroupStep, "__call__", lambda step, *args: "FormGroup"),
+        (CrispyBulmaFieldNode, "render", lambda node, context: "crispy_field"),
+        (FastFieldNode, "render", lambda node, context: "field"),
+        (IncludeNode, "render", include_name),
+    ]
+
+
+def install():
+    """
+    Wraps the timed methods, see ``crispy_bulma.instrumentation``.
+    """
+    for cls, method_name, name in timed_methods():
+        if (cls, method_name) in _installed:
+            continue
+        _installed[cls, method_name] = cls.__dict__.get(method_name)
+        setattr(cls, method_name, timed(getattr(cls, method_name), name))
+
+
+def uninstall():
+    """
+    Restores the methods wrapped by ``install()``.
+    """
+    for (cls, method_name), method in _installed.items():
+        if method is None:
+            # the method is inherited
+            delattr(cls, method_name)
+        else:
+            setattr(cls, method_name, method)
+    _installed.clear()
+
+
+def add_timing_hook(hook):
+    """
+    Registers ``hook(timings, request)``, called with the ``RenderTimings``
+    of every request ``ServerTimingMiddleware`` handles.
+    """
+    _hooks.append(hook)
+
+
+def remove_timing_hook(hook):
+    _hooks.remove(hook)
+
+
+class ServerTimingMiddleware:
+    """
+    Collects the render timings of every request, see
+    ``crispy_bulma.instrumentation``. Only used if the
+    ``CRISPY_BULMA_INSTRUMENTATION`` setting is enabled.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "CRISPY_BULMA_INSTRUMENTATION", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        install()
+
+    def __call__(self, request):
+        with collect_timings() as timings:
+            response = self.get_response(request)
+        if timings.timings:
+            self.report(timings, request, response)
+        return response
+
+    def report(self, timings, request, response):
+        server_timing = timings.server_timing()
+        if response.has_header("Server-Timing"):
+            server_timing = "%s, %s" % (response["Server-Timing"], server_timing)
+        response["Server-Timing"] = server_timing
+
+        logger.info(
+            "Rendered forms of %s %s",
+            request.method,
+            request.path,
+            extra={"crispy_timings": timings.as_dict(), "request": request},
+        )
+        for hook in list(_hooks):
+            hook(timings, request)
@@ -0,0 +1,61 @@
+"""
+Classification of widgets into the "kinds" ``bulma/field.html`` branches on.
+
+The kind of a widget class is computed once, by walking its MRO until a class
+of the table below is found, and memoized per widget class. Subclasses of the
+Django widgets, e.g. a custom ``RadioSelect``, get the kind of their base.
+"""
+
+from django import forms
+
+CHECKBOX = "checkbox"
+CHECKBOXSELECTMULTIPLE = "checkboxselectmultiple"
+CLEARABLE_FILE = "clearable_file"
+FILE = "file"
+INPUT = "input"
+MULTIVALUE = "multivalue"
+PASSWORD = "password"
+RADIOSELECT = "radioselect"
+SELECT = "select"
+SELECTMULTIPLE = "selectmultiple"
+
+WIDGET_KINDS = {
+    forms.CheckboxInput: CHECKBOX,
+    # CheckboxSelectMultiple inherits from RadioSelect since django 4.0
+    forms.CheckboxSelectMultiple: CHECKBOXSELECTMULTIPLE,
+    forms.ClearableFileInput: CLEARABLE_FILE,
+    forms.FileInput: FILE,
+    forms.MultiWidget: MULTIVALUE,
+    forms.PasswordInput: PASSWORD,
+    forms.RadioSelect: RADIOSELECT,
+    forms.Select: SELECT,
+    forms.SelectMultiple: SELECTMULTIPLE,
+}
+
+_kinds = {}
+
+
+def get_widget_kind(widget_class):
+    """
+    Returns the kind of ``widget_class``, ``"input"`` if it has no special kind.
+    """
+    try:
+        return _kinds[widget_class]
+    except KeyError:
+        pass
+
+    kind = INPUT
+    for klass in widget_class.__mro__:
+        if klass in WIDGET_KINDS:
+            kind = WIDGET_KINDS[klass]
+            break
+
+    _kinds[widget_class] = kind
+    return kind
+
+
+def widget_kind(field):
+    """
+    Returns the kind of the widget of the bound ``field``.
+    """
+    return get_widget_kind(type(field.field.widget))
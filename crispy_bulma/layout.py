@@ -1,8 +1,11 @@
-from django.template import Template
-from django.template.loader import render_to_string
+import copy
 
+from asgiref.sync import sync_to_async
+
+from crispy_bulma.choices import aprefetch_choices, choice_cache
+from crispy_bulma.rendering import compile_template, push_context, render_template
+from crispy_forms import layout
 from crispy_forms.layout import (
-    HTML,
     BaseInput,
     ButtonHolder,
     Div,
@@ -26,6 +29,7 @@ __all__ = [
     "Row",
     "Submit",
     "FormGroup",
+    "HTML",
     "UploadField",
     # Imported from CrispyForms itself
     "ButtonHolder",
@@ -33,14 +37,40 @@ __all__ = [
     "Field",
     "Fieldset",
     "Hidden",
-    "HTML",
     "Layout",
     "MultiField",
     "MultiWidgetField",
 ]
 
 
-class UploadField(Field):
+class AsyncRenderMixin:
+    """
+    Adds ``arender``, the async version of ``render``. The choices of the
+    model choice fields the layout object renders are fetched with the async
+    ORM, then the object is rendered in the thread ``sync_to_async`` runs
+    sync code in.
+    """
+
+    def get_prefetch_field_names(self):
+        """
+        Returns the names of the fields whose choices ``arender`` prefetches.
+        """
+        get_field_names = getattr(self, "get_field_names", None)
+        if get_field_names is None:
+            return []
+        return [pointer.name for pointer in get_field_names()]
+
+    async def arender(self, form, context, template_pack=TEMPLATE_PACK, **kwargs):
+        with choice_cache():
+            field_names = self.get_prefetch_field_names()
+            if field_names:
+                await aprefetch_choices(form, field_names)
+            return await sync_to_async(self.render)(
+                form, context, template_pack=template_pack, **kwargs
+            )
+
+
+class UploadField(AsyncRenderMixin, Field):
     def __init__(self, *args, **kwargs):
         if "css_class" in kwargs:
             kwargs["css_class"] += " file-input"
@@ -50,7 +80,7 @@ class UploadField(Field):
         super().__init__(*args, **kwargs)
 
 
-class BulmaBaseInput(BaseInput):
+class BulmaBaseInput(AsyncRenderMixin, BaseInput):
     def __init__(self, *args, **kwargs):
         self.control_class = kwargs.pop("control_class", None)
         super().__init__(*args, **kwargs)
@@ -61,9 +91,14 @@ class BulmaBaseInput(BaseInput):
         Input button value can be a variable in context.
 
         """
-        if self.control_class:
-            context["control_class"] = self.control_class
-        return super().render(form, context, template_pack=template_pack, **kwargs)
+        # The layout may be shared between renders and threads, so the
+        # rendered value goes to a render-local copy of the input.
+        input = copy.copy(self)
+        input.value = compile_template(str(self.value)).render(context)
+        template = self.get_template_name(template_pack)
+        return render_template(
+            template, context, input=input, control_class=self.control_class
+        )
 
 
 class Submit(BulmaBaseInput):
@@ -78,7 +113,7 @@ class Submit(BulmaBaseInput):
     input_type = "submit"
 
 
-class Button(TemplateNameMixin):
+class Button(AsyncRenderMixin, TemplateNameMixin):
     """
     Layout object for rendering an HTML button::
         Button("button content", css_class="extra")
@@ -103,15 +138,30 @@ class Button(TemplateNameMixin):
         self.flat_attrs = flatatt(kwargs)
 
     def render(self, form, context, template_pack=TEMPLATE_PACK, **kwargs):
-        self.content = Template(str(self.content)).render(context)
+        # The layout may be shared between renders and threads, so the
+        # rendered content goes to a render-local copy of the button.
+        button = copy.copy(self)
+        button.content = compile_template(str(self.content)).render(context)
         template = self.get_template_name(template_pack)
+        return render_template(
+            template, context, button=button, control_class=self.control_class
+        )
 
-        extra_context = {"button": self}
-        if self.control_class:
-            extra_context["control_class"] = self.control_class
 
-        context.update(extra_context)
-        return render_to_string(template, context.flatten())
+class HTML(AsyncRenderMixin, layout.HTML):
+    """
+    Layout object. It can contain pure HTML and it has access to the whole
+    context of the page where the form is being rendered. The template is
+    compiled once per distinct HTML source.
+
+    Examples::
+
+        HTML("{% if saved %}Data saved{% endif %}")
+        HTML('<input type="hidden" name="{{ step_field }}" value="{{ step0 }}" />')
+    """
+
+    def render(self, form, context, template_pack=TEMPLATE_PACK, **kwargs):
+        return compile_template(str(self.html)).render(context)
 
 
 class Reset(BulmaBaseInput):
@@ -126,7 +176,7 @@ class Reset(BulmaBaseInput):
     input_type = "reset"
 
 
-class Row(Div):
+class Row(AsyncRenderMixin, Div):
     """
     Layout object. It wraps fields in a div whose default class is "columns".
     >>> Row("form_field_1", "form_field_2", "form_field_3")
@@ -135,7 +185,7 @@ class Row(Div):
     css_class = "columns"
 
 
-class Column(Div):
+class Column(AsyncRenderMixin, Div):
     """
     Layout object. It wraps fields in a div whose default class is "column".
 
@@ -145,7 +195,7 @@ class Column(Div):
     css_class = "column"
 
 
-class IconField(Field):
+class IconField(AsyncRenderMixin, Field):
     """
     Layout object for rendering icons left and/or right of an input field.
 
@@ -199,6 +249,9 @@ class IconField(Field):
         self.icon_append = icon_append
         super().__init__(*args, **kwargs)
 
+    def get_prefetch_field_names(self):
+        return [self.field]
+
     def render(
         self, form, context, template_pack=TEMPLATE_PACK, extra_context=None, **kwargs
     ):
@@ -223,7 +276,7 @@ class IconField(Field):
         )
 
 
-class FormGroup(LayoutObject):
+class FormGroup(AsyncRenderMixin, LayoutObject):
     """
     Bulma layout object. It wraps fields in a <div class="field is-grouped">
     Attributes
@@ -266,13 +319,10 @@ class FormGroup(LayoutObject):
         self.flat_attrs = flatatt(kwargs)
 
     def render(self, form, context, template_pack=TEMPLATE_PACK, **kwargs):
-        # TODO use extra_context
-        # There seem to be a bug in crispy_forms, the `extra_context` kwarg is not being
-        # passed on to `field.render` in `render_field` which is called by `get_rendered_fields`.
-        # Right now `exclude_field_wrapper` is being passed on also to `formgroup.html`,
-        # but it does not break anything.
-        context["exclude_field_wrapper"] = True
-        html = self.get_rendered_fields(form, context, template_pack, **kwargs)
+        # The fields are rendered without their field wrapper. `extra_context` is
+        # not passed on to `field.render` by `render_field` in crispy_forms, so
+        # `exclude_field_wrapper` is pushed onto the context for the fields only.
+        with push_context(context, exclude_field_wrapper=True):
+            html = self.get_rendered_fields(form, context, template_pack, **kwargs)
         template = self.get_template_name(template_pack)
-        context.update({"formgroup": self, "fields_output": html})
-        return render_to_string(template, context.flatten())
+        return render_template(template, context, formgroup=self, fields_output=html)
@@ -0,0 +1,228 @@
+"""
+Template loader keeping the Bulma templates compiled in memory.
+
+Without the cached loader, e.g. with ``DEBUG = True``, every
+``{% include "bulma/..." %}`` finds the template on the filesystem, reads it
+and compiles it again. ``Loader`` compiles all templates in
+``crispy_bulma/templates/bulma/`` once, when it loads its first template,
+and returns the compiled templates after that. Put it between the filesystem
+and the app directories loaders::
+
+    TEMPLATES = [
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "DIRS": [BASE_DIR / "templates"],
+            "OPTIONS": {
+                "loaders": [
+                    "django.template.loaders.filesystem.Loader",
+                    "crispy_bulma.loaders.Loader",
+                    "django.template.loaders.app_directories.Loader",
+                ],
+            },
+        }
+    ]
+
+Overridden templates still win: templates found in ``DIRS`` or in the
+``templates`` directory of an app installed before ``crispy_bulma`` are not
+kept, so the loaders after this one find the override.
+
+``("crispy_bulma.loaders.Loader", True)`` watches the templates for
+development: the modification time of a template's file is checked whenever
+the template is loaded, and changed templates are compiled again.
+
+With the ``CRISPY_BULMA_FLAT_TEMPLATES`` setting the loader loads the
+flattened variants of ``crispy_bulma.flatten``, unless one of the templates
+inlined into them is overridden.
+"""
+
+import os
+import threading
+import weakref
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template import Origin, Template, TemplateDoesNotExist
+from django.template.loaders import filesystem
+from django.template.utils import get_app_template_dirs
+from django.utils._os import safe_join
+
+from crispy_bulma.fast_fields import FLAT_TEMPLATES_DIR, TEMPLATES_DIR
+from crispy_bulma.flatten import FLAT_TEMPLATES, inlined_templates
+
+TEMPLATE_PACK_DIR = os.path.join(TEMPLATES_DIR, "bulma")
+
+_loaders = weakref.WeakSet()
+
+
+@receiver(setting_changed)
+def _reset_loaders(*, setting, **kwargs):
+    if setting == "CRISPY_BULMA_FLAT_TEMPLATES":
+        for loader in list(_loaders):
+            loader.reset()
+
+
+class Loader(filesystem.Loader):
+    """
+    Loads the templates of ``crispy_bulma/templates/bulma/`` from memory, see
+    ``crispy_bulma.loaders``. With ``watch`` templates whose file changed are
+    compiled again.
+    """
+
+    def __init__(self, engine, watch=False):
+        super().__init__(engine, dirs=[TEMPLATES_DIR])
+        self.watch = watch
+        self.lock = threading.Lock()
+        self._templates = None
+        _loaders.add(self)
+
+    @property
+    def templates(self):
+        """
+        The compiled templates and the modification times of their files, by
+        template name.
+        """
+        templates = self._templates
+        if templates is None:
+            with self.lock:
+                if self._templates is None:
+                    self._templates = self.load_templates()
+                templates = self._templates
+        return templates
+
+    def override_dirs(self):
+        """
+        Returns the template directories searched before the one of
+        crispy-bulma.
+        """
+        dirs = list(self.engine.dirs)
+        for template_dir in get_app_template_dirs("templates"):
+            if os.path.abspath(template_dir) == TEMPLATES_DIR:
+                break
+            dirs.append(template_dir)
+        return dirs
+
+    def is_overridden(self, template_name, dirs):
+        for template_dir in dirs:
+            try:
+                if os.path.isfile(safe_join(template_dir, template_name)):
+                    return True
+            except SuspiciousFileOperation:
+                continue
+        return False
+
+    def earlier_loaders(self):
+        """
+        Returns the loaders of the engine searched before this one.
+        """
+        loaders = []
+        for loader in self.engine.template_loaders:
+            if loader is self:
+                break
+            children = getattr(loader, "loaders", [])
+            if self in children:
+                # e.g. the cached loader
+                loaders.extend(children[: children.index(self)])
+                break
+            loaders.append(loader)
+        return loaders
+
+    def is_loaded_earlier(self, template_name):
+        for loader in self.earlier_loaders():
+            try:
+                loader.get_template(template_name)
+            except TemplateDoesNotExist:
+                continue
+            return True
+        return False
+
+    def uses_flat_template(self, template_name, names):
+        """
+        Returns whether the flattened variant of ``template_name`` is loaded,
+        i.e. none of the templates inlined into it is overridden. ``names``
+        are the templates that aren't overridden in a template directory.
+        """
+        if (
+            not getattr(settings, "CRISPY_BULMA_FLAT_TEMPLATES", False)
+            or template_name not in FLAT_TEMPLATES
+        ):
+            return False
+        try:
+            with open(
+                safe_join(FLAT_TEMPLATES_DIR, template_name),
+                encoding=self.engine.file_charset,
+            ) as f:
+                inlined = inlined_templates(f.readline())
+        except FileNotFoundError:
+            return False
+        return inlined is not None and not any(
+            name not in names or self.is_loaded_earlier(name) for name in inlined
+        )
+
+    def load_templates(self):
+        dirs = self.override_dirs()
+        names = set()
+        for root, _, filenames in os.walk(TEMPLATE_PACK_DIR):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                name = os.path.relpath(path, TEMPLATES_DIR).replace(os.sep, "/")
+                if not self.is_overridden(name, dirs):
+                    names.add(name)
+
+        templates = {}
+        for name in names:
+            if self.uses_flat_template(name, names):
+                templates[name] = self.compile(name, FLAT_TEMPLATES_DIR)
+            else:
+                templates[name] = self.compile(name)
+        return templates
+
+    def compile(self, template_name, template_dir=None):
+        origin = Origin(
+            safe_join(template_dir or TEMPLATES_DIR, template_name),
+            template_name,
+            self,
+        )
+        mtime = os.stat(origin.name).st_mtime
+        contents = self.get_contents(origin)
+        return Template(contents, origin, template_name, self.engine), mtime
+
+    def changed(self, template, mtime):
+        try:
+            return os.stat(template.origin.name).st_mtime != mtime
+        except FileNotFoundError:
+            raise TemplateDoesNotExist(template.origin)
+
+    def get_template_sources(self, template_name):
+        # Only used through the cached loader, which compiles the templates
+        # itself.
+        if template_name in self.templates:
+            yield self.templates[template_name][0].origin
+
+    def get_template(self, template_name, skip=None):
+        try:
+            template, mtime = self.templates[template_name]
+        except KeyError:
+            raise TemplateDoesNotExist(template_name)
+        if skip is not None and template.origin in skip:
+            raise TemplateDoesNotExist(
+                template_name,
+                tried=[(template.origin, "Skipped to avoid recursion")],
+            )
+        if self.watch and self.changed(template, mtime):
+            template_dir = None
+            if template.origin.name.startswith(FLAT_TEMPLATES_DIR + os.sep):
+                template_dir = FLAT_TEMPLATES_DIR
+            template, mtime = self.templates[template_name] = self.compile(
+                template_name, template_dir
+            )
+        return template
+
+    def reset(self):
+        """
+        Drops the compiled templates, called by Django's autoreloader when a
+        template changes.
+        """
+        with self.lock:
+            self._templates = None
@@ -0,0 +1,52 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from crispy_bulma.fast_fields import FLAT_TEMPLATES_DIR
+from crispy_bulma.flatten import flatten_templates
+
+
+class Command(BaseCommand):
+    help = (
+        "Writes the flattened variants of the Bulma templates used with the "
+        "CRISPY_BULMA_FLAT_TEMPLATES setting, see crispy_bulma.flatten."
+    )
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=FLAT_TEMPLATES_DIR,
+            help="The directory to write the templates to, by default %(default)s.",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Fail if a template is out of date instead of writing it.",
+        )
+
+    def handle(self, *, output, check, **options):
+        stale = []
+        for name, source in flatten_templates().items():
+            path = os.path.join(output, *name.split("/"))
+            try:
+                with open(path, encoding="utf-8") as f:
+                    if f.read() == source:
+                        continue
+            except FileNotFoundError:
+                pass
+
+            if check:
+                stale.append(name)
+                continue
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(source)
+            if options["verbosity"] >= 1:
+                self.stdout.write("Wrote %s" % path)
+
+        if stale:
+            raise CommandError(
+                "Flattened templates out of date: %s. Run flatten_templates."
+                % ", ".join(stale)
+            )
@@ -0,0 +1,174 @@
+"""
+Parallel rendering of formsets.
+
+The forms of a formset are rendered independently of each other, through
+``display_form.html`` and their layout, but ``render_crispy_form`` renders
+them one after another. For very large formsets
+``render_crispy_formset_parallel`` splits the forms into chunks, renders the
+chunks on a ``concurrent.futures`` thread pool and assembles the formset in
+order::
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        html = render_crispy_formset_parallel(
+            formset, helper, executor=executor, max_workers=4
+        )
+
+The output is the same as ``render_crispy_form(formset, helper)``. Every
+chunk is rendered with its own copies of the contexts and ``forloop``, the
+context variables, active language and time zone are passed on to the
+workers, and the choices of model choice fields are fetched and the layout
+compiled in the calling thread beforehand. The only state the workers share
+is the ``crispy_bulma.rows`` plan of the formset, which is locked, so the
+renderer doesn't rely on the GIL and scales on free-threaded Python builds.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import copy_context
+
+from django.forms.formsets import BaseFormSet
+from django.utils import timezone, translation
+from django.utils.safestring import mark_safe
+
+from crispy_bulma.choices import choice_cache, prefetch_choices
+from crispy_bulma.helper import layout_renderer
+from crispy_bulma.rendering import push_context
+from crispy_bulma.rows import row_plan
+from crispy_bulma.streaming import formset_contexts, stream_formset_template
+from crispy_forms.templatetags.crispy_forms_tags import ForLoopSimulator
+
+# chunks per worker, so that workers finishing early pick up more work
+CHUNKS_PER_WORKER = 4
+
+
+def render_crispy_formset_parallel(
+    formset, helper=None, context=None, executor=None, max_workers=None, chunk_size=None
+):
+    """
+    Renders ``formset`` like ``render_crispy_form(formset, helper, context)``,
+    rendering its forms in chunks of ``chunk_size`` forms on ``executor``, or
+    on a thread pool of ``max_workers`` threads. Without ``chunk_size`` the
+    chunks are sized for ``max_workers`` workers, so pass the number of
+    workers of ``executor`` too; it defaults to the number of CPUs.
+    """
+    if not isinstance(formset, BaseFormSet):
+        raise TypeError("render_crispy_formset_parallel() only renders formsets.")
+    if isinstance(executor, ProcessPoolExecutor):
+        # template nodes and contexts can't be sent to other processes
+        raise TypeError("render_crispy_formset_parallel() needs a thread pool.")
+
+    helper, node_context, final_context, template_pack = formset_contexts(
+        formset, helper, context
+    )
+    render_layout = None
+    if helper.layout:
+        helper.render_hidden_fields = True
+        # the layout is compiled once, before the workers use it
+        render_layout = layout_renderer(helper, template_pack)
+
+    renderer = _ParallelRenderer(
+        formset, render_layout, node_context, executor, max_workers, chunk_size
+    )
+    with choice_cache(), row_plan():
+        prefetch_choices(formset)
+        chunks = stream_formset_template(helper, final_context, template_pack, renderer)
+        return mark_safe("".join(chunks))
+
+
+class _ParallelRenderer:
+    """
+    Renders the ``{% for %}`` loop of the formset template over the forms in
+    parallel chunks, including the layout of every form.
+    """
+
+    def __init__(
+        self, formset, render_layout, context, executor, max_workers, chunk_size
+    ):
+        self.formset = formset
+        self.render_layout = render_layout
+        self.context = context
+        self.executor = executor
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    def __call__(self, item):
+        return None
+
+    def render_loop(self, node, context, values, parentloop):
+        forms = self.formset.forms
+        if (values is not self.formset and values is not forms) or not forms:
+            return None
+
+        total = len(forms)
+        chunk_size = self.chunk_size or math.ceil(
+            total / (self.max_workers * CHUNKS_PER_WORKER)
+        )
+        chunks = [
+            (node, context, parentloop, start, min(start + chunk_size, total))
+            for start in range(0, total, chunk_size)
+        ]
+        if len(chunks) == 1:
+            return self.render_chunk(*chunks[0])
+
+        if self.executor is None:
+            with ThreadPoolExecutor(self.max_workers) as executor:
+                return self.render_chunks(executor, chunks)
+        return self.render_chunks(self.executor, chunks)
+
+    def render_chunks(self, executor, chunks):
+        language = translation.get_language()
+        time_zone = timezone.get_current_timezone()
+
+        def render_chunk(*chunk):
+            # the language and time zone are thread local
+            with translation.override(language), timezone.override(time_zone):
+                return self.render_chunk(*chunk)
+
+        # threads don't inherit context variables, e.g. the choice cache
+        futures = [
+            executor.submit(copy_context().run, render_chunk, *chunk)
+            for chunk in chunks
+        ]
+        return [html for future in futures for html in future.result()]
+
+    def render_chunk(self, node, context, parentloop, start, stop):
+        """
+        Returns the loop bodies of the forms ``start`` to ``stop``, see
+        ``ForNode.render`` and ``CrispyFormNode.get_render``.
+        """
+        forms = self.formset.forms
+        total = len(forms)
+        context = context.__copy__()
+        node_context = self.context.__copy__()
+        forloop = ForLoopSimulator(self.formset)
+        for i in range(start):
+            forloop.iterate()
+
+        htmls = []
+        with context.render_context.push(), node_context.render_context.push():
+            for i in range(start, stop):
+                form = forms[i]
+                if self.render_layout is not None:
+                    with push_context(node_context, forloop=forloop, formset_form=form):
+                        form.form_html = self.render_layout(form, node_context)
+                    forloop.iterate()
+
+                loop_dict = {
+                    "parentloop": parentloop,
+                    "counter0": i,
+                    "counter": i + 1,
+                    "revcounter": total - i,
+                    "revcounter0": total - i - 1,
+                    "first": i == 0,
+                    "last": i == total - 1,
+                }
+                values = {"forloop": loop_dict, node.loopvars[0]: form}
+                with push_context(context, **values):
+                    htmls.append(
+                        "".join(
+                            child.render_annotated(context)
+                            for child in node.nodelist_loop
+                        )
+                    )
+        return htmls
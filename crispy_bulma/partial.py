@@ -0,0 +1,123 @@
+"""
+Partial responses to invalid forms.
+
+When a large form fails validation, re-rendering it sends back every field
+although most of them look exactly as the user submitted them. In partial
+mode only the fields that render differently are rendered: fields with
+errors, fields that showed errors before and fields whose value isn't the
+submitted one. The response is JSON, keyed by the ids of the rendered
+elements, see ``fragment_id()``: the ``div_<auto_id>`` field wrappers of
+``bulma/field.html``, or the ``css_id`` of the layout object holding the
+field, e.g. a ``FormGroup``, which is rendered once for all its fields::
+
+    {
+        "valid": false,
+        "errors": "<div class=\\"notification is-danger\\">...</div>",
+        "fragments": {"div_id_email": "<div id=\\"div_id_email\\" ...>...</div>"}
+    }
+
+``crispy_bulma/partial.js`` submits forms with a ``data-crispy-partial``
+attribute in this mode and patches the fragments in place::
+
+    class ProfileView(PartialResponseMixin, UpdateView):
+        ...
+
+    <form method="post" data-crispy-partial>...</form>
+    <script src="{% static 'crispy_bulma/partial.js' %}" defer></script>
+
+Partial requests send the ``X-Crispy-Partial`` header and list the ids of
+the elements showing errors in ``X-Crispy-Errors``, separated by spaces. A
+changed field without an element to patch, e.g. in a ``FormGroup`` without
+``css_id``, is answered with the whole page.
+"""
+
+from django.http import JsonResponse
+
+from crispy_bulma.fragments import form_context, fragment_id, render_fragments
+from crispy_bulma.rendering import render_template
+
+PARTIAL_HEADER = "HTTP_X_CRISPY_PARTIAL"
+ERRORS_HEADER = "HTTP_X_CRISPY_ERRORS"
+
+
+def changed_fields(form, shown_errors=(), helper=None):
+    """
+    Returns the names of the fields of the bound ``form`` that render
+    differently than the submitted form shows them. ``shown_errors`` are the
+    ids of the elements showing errors in the submitted form.
+    """
+    names = []
+    for name in form.fields:
+        bound_field = form[name]
+        if bound_field.is_hidden or not bound_field.auto_id:
+            continue
+        if (
+            bound_field.errors
+            or bound_field.value() != bound_field.data
+            or fragment_id(form, name, helper) in shown_errors
+        ):
+            names.append(name)
+    return names
+
+
+def render_partial(form, shown_errors=(), helper=None, context=None):
+    """
+    Returns the partial response data of the bound ``form``, see
+    ``crispy_bulma.partial``, or ``None`` if a changed field has no element
+    to patch.
+    """
+    targets = {}
+    for name in changed_fields(form, shown_errors, helper):
+        element_id = fragment_id(form, name, helper)
+        if element_id is None:
+            return None
+        # the fields of a FormGroup share its fragment
+        targets.setdefault(element_id, name)
+    fragments = render_fragments(form, list(targets.values()), helper, context)
+    errors = ""
+    helper, context, template_pack = form_context(form, helper, context)
+    if context.get("form_show_errors"):
+        errors = render_template("%s/errors.html" % template_pack, context)
+    return {
+        "valid": not form.errors,
+        "errors": errors.strip(),
+        "fragments": {
+            element_id: html.strip() for element_id, html in zip(targets, fragments)
+        },
+    }
+
+
+class PartialResponseMixin:
+    """
+    Mixin for views using ``FormMixin``, e.g. ``FormView`` or ``UpdateView``,
+    answering partial requests with the changed fragments of invalid forms,
+    see ``crispy_bulma.partial``. Valid forms are handled as usual, redirects
+    are returned as ``{"valid": true, "redirect": url}``.
+    """
+
+    def is_partial(self):
+        return PARTIAL_HEADER in self.request.META
+
+    def get_shown_errors(self):
+        return frozenset(self.request.META.get(ERRORS_HEADER, "").split())
+
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        if self.is_partial() and response.has_header("Location"):
+            return JsonResponse({"valid": True, "redirect": response["Location"]})
+        return response
+
+    def form_invalid(self, form):
+        if not self.is_partial():
+            return super().form_invalid(form)
+
+        context = self.get_context_data(form=form)
+        data = render_partial(
+            form,
+            self.get_shown_errors(),
+            getattr(form, "helper", None),
+            {**context, "request": self.request},
+        )
+        if data is None:
+            return super().form_invalid(form)
+        return JsonResponse(data)
@@ -0,0 +1,233 @@
+"""
+Render plans for layouts.
+
+Rendering a layout walks the tree of layout objects and renders a wrapper
+template for every ``Div``, ``Row`` and ``Column``, although their HTML only
+depends on the layout objects themselves. ``compile_layout`` turns a layout
+into a flat list of steps instead: the wrapper HTML of these objects is
+rendered once around a placeholder and stored as static strings, and only
+the field slots (field names, ``Field``, ``IconField``, ``HTML``, buttons,
+...) and the context dependent wrappers (``Fieldset``, ``FormGroup``) are
+rendered per render.
+
+A plan records the state of the layout objects it was compiled from and
+``RenderPlan.is_current`` tells whether the layout or the templates changed
+since. ``crispy_bulma.helper.FormHelper`` caches the plan of its layout.
+"""
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template.loader import render_to_string
+from django.utils.autoreload import file_changed
+from django.utils.safestring import SafeString, mark_safe
+
+from crispy_bulma.layout import FormGroup
+from crispy_bulma.rendering import compile_template, push_context, render_template
+from crispy_forms.layout import Div, Fieldset, Layout
+from crispy_forms.utils import render_field
+
+# incremented whenever templates may have changed, which outdates all plans
+_generation = 0
+
+
+@receiver(setting_changed)
+def _reset_plans(*, setting, **kwargs):
+    global _generation
+    if setting == "TEMPLATES":
+        _generation += 1
+
+
+@receiver(file_changed)
+def _template_changed(*, file_path, **kwargs):
+    global _generation
+    if file_path.suffix != ".py":
+        _generation += 1
+
+
+PLACEHOLDERS = (
+    SafeString("\x00crispy-bulma-fields\x00"),
+    SafeString("\x00crispy-bulma-fields-placeholder\x00"),
+)
+
+
+class RenderPlan:
+    """
+    The compiled steps of a layout. Steps are static (safe) strings or
+    callables ``step(form, context, template_pack)`` returning HTML.
+    """
+
+    def __init__(self, layout, template_pack):
+        self.layout = layout
+        self.template_pack = template_pack
+        self.generation = _generation
+        self.snapshots = []
+        self.steps = self.compile(layout)
+
+    def is_current(self):
+        """
+        Returns whether neither the layout objects nor the templates changed
+        since the plan was compiled.
+        """
+        return self.generation == _generation and all(
+            node.__dict__ == snapshot for node, snapshot in self.snapshots
+        )
+
+    def render(self, form, context, template_pack):
+        return render_steps(self.steps, form, context, template_pack)
+
+    def compile(self, node):
+        """
+        Returns the steps of the layout object ``node``.
+        """
+        render = get_render(type(node))
+        if render is get_render(Layout):
+            self.snapshot(node)
+            return self.compile_fields(node)
+        if render is get_render(Div):
+            self.snapshot(node)
+            return self.compile_div(node)
+        if render is get_render(Fieldset):
+            self.snapshot(node)
+            return [FieldsetStep(node, self.compile_fields(node))]
+        if render is get_render(FormGroup):
+            self.snapshot(node)
+            return [FormGroupStep(node, self.compile_fields(node))]
+        return [FieldStep(node)]
+
+    def compile_fields(self, node):
+        steps = []
+        for field in node.fields:
+            for step in self.compile(field):
+                if isinstance(step, str) and steps and isinstance(steps[-1], str):
+                    steps[-1] = SafeString(steps[-1] + step)
+                else:
+                    steps.append(step)
+        return steps
+
+    def compile_div(self, node):
+        fields = self.compile_fields(node)
+        template = node.get_template_name(self.template_pack)
+        wrapper = split_wrapper(template, {"div": node})
+        if wrapper is None:
+            return [DivStep(node, template, fields)]
+        prefix, suffix = wrapper
+        return [prefix, *fields, suffix]
+
+    def snapshot(self, node):
+        self.snapshots.append((node, {**node.__dict__, "fields": list(node.fields)}))
+
+
+def get_render(cls):
+    """
+    Returns the ``render`` method of ``cls``, unwrapped if it is timed by
+    ``crispy_bulma.instrumentation``.
+    """
+    render = getattr(cls, "render", None)
+    return getattr(render, "__wrapped__", render)
+
+
+def split_wrapper(template, context):
+    """
+    Renders ``template`` with ``context`` and placeholder ``fields`` and
+    returns the HTML before and after the fields, or ``None`` if the output
+    depends on the fields themselves.
+    """
+    splits = []
+    for placeholder in PLACEHOLDERS:
+        html = render_to_string(template, {**context, "fields": placeholder})
+        if html.count(placeholder) != 1:
+            return None
+        splits.append(tuple(html.split(placeholder)))
+
+    prefix, suffix = splits[0]
+    empty = render_to_string(template, {**context, "fields": SafeString("")})
+    if splits[1] != splits[0] or empty != prefix + suffix:
+        return None
+    return SafeString(prefix), SafeString(suffix)
+
+
+def render_steps(steps, form, context, template_pack):
+    return mark_safe(
+        "".join(
+            step if isinstance(step, str) else step(form, context, template_pack)
+            for step in steps
+        )
+    )
+
+
+class FieldStep:
+    """
+    A layout object or field name, rendered like ``LayoutObject`` does.
+    """
+
+    def __init__(self, field):
+        self.field = field
+
+    def __call__(self, form, context, template_pack):
+        return render_field(self.field, form, context, template_pack=template_pack)
+
+
+class DivStep:
+    """
+    A ``Div`` whose template depends on its fields, see ``Div.render``.
+    """
+
+    def __init__(self, div, template, steps):
+        self.div = div
+        self.template = template
+        self.steps = steps
+
+    def __call__(self, form, context, template_pack):
+        fields = render_steps(self.steps, form, context, template_pack)
+        return render_to_string(self.template, {"div": self.div, "fields": fields})
+
+
+class FieldsetStep:
+    """
+    A ``Fieldset``, its legend and template depend on the context. See
+    ``Fieldset.render``.
+    """
+
+    def __init__(self, fieldset, steps):
+        self.fieldset = fieldset
+        self.steps = steps
+
+    def __call__(self, form, context, template_pack):
+        fields = render_steps(self.steps, form, context, template_pack)
+        legend = SafeString("")
+        if self.fieldset.legend:
+            legend = compile_template(str(self.fieldset.legend)).render(context)
+        return render_template(
+            self.fieldset.get_template_name(template_pack),
+            context,
+            fieldset=self.fieldset,
+            legend=legend,
+            fields=fields,
+        )
+
+
+class FormGroupStep:
+    """
+    A ``FormGroup``, see ``FormGroup.render``.
+    """
+
+    def __init__(self, formgroup, steps):
+        self.formgroup = formgroup
+        self.steps = steps
+
+    def __call__(self, form, context, template_pack):
+        with push_context(context, exclude_field_wrapper=True):
+            html = render_steps(self.steps, form, context, template_pack)
+        return render_template(
+            self.formgroup.get_template_name(template_pack),
+            context,
+            formgroup=self.formgroup,
+            fields_output=html,
+        )
+
+
+def compile_layout(layout, template_pack):
+    """
+    Returns the ``RenderPlan`` of ``layout`` for ``template_pack``.
+    """
+    return RenderPlan(layout, template_pack)
@@ -0,0 +1,65 @@
+"""
+Form renderer for Bulma.
+
+Forms that don't need a layout can be rendered with ``{{ form }}`` and
+``{{ field.as_field_group }}`` instead of the ``{% crispy %}`` tag. With
+``BulmaFormRenderer`` both render the markup of ``bulma/field.html``,
+without a ``FormHelper``::
+
+    FORM_RENDERER = "crispy_bulma.renderers.BulmaFormRenderer"
+
+or for some forms only::
+
+    class ContactForm(forms.Form):
+        default_renderer = BulmaFormRenderer()
+
+``{{ form }}`` renders like ``{% crispy form %}`` with ``form_tag = False``
+and ``include_media = False``. The renderer keeps the templates it loaded,
+so rendering a form doesn't look up templates again.
+"""
+
+import weakref
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.forms.renderers import DjangoTemplates
+from django.utils.autoreload import file_changed
+
+_renderers = weakref.WeakSet()
+
+
+@receiver(setting_changed)
+def _reset_renderers(*, setting, **kwargs):
+    if setting == "TEMPLATES":
+        for renderer in list(_renderers):
+            renderer.templates.clear()
+
+
+@receiver(file_changed)
+def _template_changed(*, file_path, **kwargs):
+    if file_path.suffix != ".py":
+        for renderer in list(_renderers):
+            renderer.templates.clear()
+
+
+class BulmaFormRenderer(DjangoTemplates):
+    """
+    Renders forms and fields with the Bulma templates, see
+    ``crispy_bulma.renderers``.
+    """
+
+    form_template_name = "bulma/forms/div.html"
+    field_template_name = "bulma/forms/field.html"
+
+    def __init__(self):
+        self.templates = {}
+        _renderers.add(self)
+
+    def get_template(self, template_name):
+        try:
+            return self.templates[template_name]
+        except KeyError:
+            template = self.templates[template_name] = super().get_template(
+                template_name
+            )
+            return template
@@ -0,0 +1,275 @@
+"""
+Rendering helpers shared by the ``crispy_forms_bulma_field`` template tags and
+the Python fast path of ``bulma/field.html``.
+"""
+
+import copy
+from contextlib import contextmanager
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template import Template
+from django.template.base import render_value_in_context
+from django.template.loader import get_template
+from django.utils import formats
+from django.utils.safestring import mark_safe
+
+from crispy_bulma.choices import get_choices
+from crispy_bulma.converters import get_converters
+from crispy_forms.utils import flatatt
+
+
+@lru_cache(maxsize=256)
+def compile_template(source):
+    """
+    Returns ``Template(source)``, compiled once per source string. Used by the
+    layout objects whose content is a template, e.g. ``Button`` and ``HTML``.
+    """
+    return Template(source)
+
+
+@receiver(setting_changed)
+def _reset_templates(*, setting, **kwargs):
+    if setting == "TEMPLATES":
+        compile_template.cache_clear()
+
+
+def render_template(template_name, context, **values):
+    """
+    Renders the template ``template_name`` with the existing ``context`` and
+    ``values`` pushed on top of it. Unlike ``render_to_string(template_name,
+    context.flatten())`` the context isn't copied and ``values`` don't leak
+    into the rest of the layout.
+    """
+    template = get_template(template_name).template
+    with push_context(context, **values):
+        return template.render(context)
+
+
+@contextmanager
+def push_context(context, **values):
+    """
+    Pushes ``values`` onto ``context`` like ``context.push(**values)``. On exit
+    the context is restored to its previous depth, which also drops the layers
+    ``crispy_forms.utils.render_field`` pushes and never pops.
+    """
+    depth = len(context.dicts)
+    context.push(**values)
+    try:
+        yield context
+    finally:
+        del context.dicts[depth:]
+
+
+def merge_tokens(value, extra):
+    """
+    Appends the space separated ``extra`` tokens missing from ``value``.
+    """
+    if not value:
+        return extra
+    tokens = value.split()
+    seen = set(tokens)
+    missing = [token for token in extra.split() if token not in seen]
+    if not missing:
+        return value
+    return " ".join(tokens + missing)
+
+
+def bulma_widget_attrs(widget, attrs, converters):
+    """
+    Returns a copy of ``widget.attrs`` with the Bulma CSS classes of the widget
+    and the ``crispy_field`` attributes merged in.
+    """
+    class_name = widget.__class__.__name__.lower()
+    class_name = converters.get(class_name, class_name)
+
+    widget_attrs = widget.attrs.copy()
+    css_class = merge_tokens(widget_attrs.get("class", ""), class_name)
+    if css_class:
+        widget_attrs["class"] = css_class
+    else:
+        # remove the class="" attribute completely if empty
+        widget_attrs.pop("class", None)
+
+    for attribute_name, attributes in attrs:
+        if attribute_name in widget_attrs:
+            # multiple attributes are in a single string, e.g.
+            # "form-control is-invalid"
+            widget_attrs[attribute_name] = merge_tokens(
+                widget_attrs[attribute_name], attributes
+            )
+        else:
+            widget_attrs[attribute_name] = attributes
+
+    return widget_attrs
+
+
+def bulma_widget(widget, attrs, converters):
+    """
+    Returns a shallow copy of ``widget`` carrying the attributes built by
+    ``bulma_widget_attrs``. ``widget`` itself is never modified.
+    """
+
+    def copy_widget(widget):
+        clone = copy.copy(widget)
+        clone.attrs = bulma_widget_attrs(widget, attrs, converters)
+        choices = getattr(widget, "choices", None)
+        if choices is not None:
+            cached = get_choices(choices)
+            if cached is not choices:
+                clone.choices = cached
+        return clone
+
+    # There are special django widgets that wrap actual widgets,
+    # such as forms.widgets.MultiWidget, admin.widgets.RelatedFieldWidgetWrapper
+    if hasattr(widget, "widgets"):
+        clone = copy.copy(widget)
+        clone.widgets = [copy_widget(subwidget) for subwidget in widget.widgets]
+    elif hasattr(widget, "widget"):
+        clone = copy.copy(widget)
+        clone.widget = copy_widget(widget.widget)
+        if widget.attrs is widget.widget.attrs:
+            clone.attrs = clone.widget.attrs
+    else:
+        clone = copy_widget(widget)
+    return clone
+
+
+def render_widget(field, attrs=()):
+    """
+    Renders the widget of the bound ``field`` like ``{% crispy_field %}``.
+    ``attrs`` is a sequence of resolved (name, value) pairs.
+    """
+    widget = bulma_widget(field.field.widget, attrs, get_converters())
+
+    # Render a render-local copy of the widget, so rendering the same bound
+    # field more than once gives the same output and the form is untouched.
+    html = field.as_widget(widget=widget)
+    if field.field.show_hidden_initial:
+        html += field.as_hidden(only_initial=True)
+    return html
+
+
+def stringformat(value):
+    """
+    Python version of ``{{ value|stringformat:"s" }}``.
+    """
+    if isinstance(value, tuple):
+        value = str(value)
+    try:
+        return "%s" % value
+    except (ValueError, TypeError):
+        return ""
+
+
+def unlocalize(value, context):
+    """
+    Python version of ``{{ value|unlocalize }}``.
+    """
+    return render_value_in_context(
+        str(formats.localize(value, use_l10n=False)), context
+    )
+
+
+class SelectedValues:
+    """
+    The value of a choice field, normalized once so checking whether a choice
+    is selected does not scan the value for every choice.
+
+    ``checkbox`` matches the check of ``checkboxselectmultiple.html``::
+
+        choice.0 in field.value or choice.0|stringformat:"s" in field.value
+        or choice.0|stringformat:"s" == field.value|default_if_none:""|stringformat:"s"
+
+    and ``radio`` the check of ``radioselect.html``, i.e. only the last test.
+    """
+
+    def __init__(self, value):
+        self.string = stringformat("" if value is None else value)
+        self.values = value
+        if value is not None and not isinstance(value, str):
+            try:
+                self.values = frozenset(value)
+            except TypeError:
+                # not iterable or unhashable values, use the value as is
+                pass
+
+    def __contains__(self, value):
+        # a failing lookup is False, as in the {% if %} tag
+        try:
+            return value in self.values
+        except Exception:
+            return False
+
+    def radio(self, choice_value):
+        return stringformat(choice_value) == self.string
+
+    def checkbox(self, choice_value):
+        if choice_value in self:
+            return True
+        choice_string = stringformat(choice_value)
+        return choice_string in self or choice_string == self.string
+
+
+CHOICE_HTML = (
+    '\n<div class="control">\n  <label class="%(type)s" for="%(id)s">\n'
+    '    <input type="%(type)s"%(checked)s name="%(name)s" id="%(id)s"'
+    ' value="%(value)s"%(attrs)s>\n      %(label)s\n  </label>\n</div>\n'
+)
+
+INLINE_CHOICE_HTML = (
+    '\n    <label class="%(type)s" for="%(id)s">\n'
+    '      <input type="%(type)s"%(checked)s name="%(name)s" id="%(id)s"'
+    ' value="%(value)s"%(attrs)s>\n        %(label)s\n    </label>\n  '
+)
+
+
+def render_choices(field, input_type, context, inline=False):
+    """
+    Renders the radio buttons (``input_type="radio"``) or checkboxes
+    (``input_type="checkbox"``) of the choices of the bound ``field`` in a
+    single pass, e.g. for ``bulma/layout/radioselect.html``. The value of the
+    field and the flattened widget attrs are computed once per field.
+    """
+    html_name = render_value_in_context(field.html_name, context)
+    selected = SelectedValues(field.value())
+    is_selected = selected.radio if input_type == "radio" else selected.checkbox
+
+    widget_attrs = mark_safe(flatatt(field.field.widget.attrs))
+    if input_type == "radio":
+        # value="..." {% if field.field.disabled %}disabled{% endif %} {{ attrs }}>
+        disabled = " disabled " if field.field.disabled else "  "
+    else:
+        # value="..."{% if field.field.disabled %} disabled{% endif %} {{ attrs }}>
+        disabled = " disabled " if field.field.disabled else " "
+    attrs = disabled + render_value_in_context(widget_attrs, context)
+
+    if settings.USE_THOUSAND_SEPARATOR:
+
+        def counter(value):
+            return render_value_in_context(value, context)
+
+    else:
+        counter = str
+
+    choice_html = INLINE_CHOICE_HTML if inline else CHOICE_HTML
+    html = []
+    for counter0, (choice_value, choice_label) in enumerate(
+        get_choices(field.field.choices)
+    ):
+        input_id = "id_%s_%s" % (html_name, counter(counter0))
+        html.append(
+            choice_html
+            % {
+                "type": input_type,
+                "id": input_id,
+                "checked": " checked" if is_selected(choice_value) else "",
+                "name": html_name,
+                "value": unlocalize(choice_value, context),
+                "attrs": attrs,
+                "label": unlocalize(choice_label, context),
+            }
+        )
+    return mark_safe("".join(html))
@@ -0,0 +1,222 @@
+"""
+Shared rendering of the rows of a formset.
+
+The forms of a formset have the same fields and differ in their prefix,
+values and errors, yet every form renders each of its fields through
+``bulma/field.html`` and the widget templates again. Inside a ``row_plan()``
+scope the HTML of a field is rendered for the first form and reused for the
+fields of the other forms with the same definition, value, errors and
+rendering context, with the prefix of the form substituted::
+
+    with row_plan():
+        html = render_crispy_form(formset, helper)
+
+The substitution is verified against a real render of the field in a
+second form before the HTML is reused, fields whose HTML depends on
+anything else, e.g. a customized ``field.html``, are always rendered.
+``stream_crispy_formset`` and ``render_crispy_formset_parallel`` render in a
+``row_plan()`` scope.
+"""
+
+import datetime
+import threading
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import Decimal
+
+from django import forms
+from django.db.models import Model
+from django.db.models.query import QuerySet
+from django.forms.models import ModelChoiceIterator
+from django.utils import translation
+from django.utils.functional import Promise
+from django.utils.safestring import mark_safe
+
+from crispy_bulma import fast_fields
+from crispy_bulma.choices import query_key
+
+_row_plan = ContextVar("crispy_bulma_row_plan", default=None)
+
+# the context variables the shipped field templates depend on
+CONTEXT_KEYS = (
+    "exclude_field_wrapper",
+    "form_horizontal",
+    "form_show_errors",
+    "label_class",
+    "wrapper_class",
+)
+
+SCALARS = (
+    str,
+    bytes,
+    int,
+    float,
+    Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+    type(None),
+)
+
+
+@contextmanager
+def row_plan():
+    """
+    Reuses the HTML of the fields of formset forms rendered inside the block.
+    Nested blocks share the plan of the outermost one.
+    """
+    if _row_plan.get() is not None:
+        yield
+        return
+
+    token = _row_plan.set(RowPlan())
+    try:
+        yield
+    finally:
+        _row_plan.reset(token)
+
+
+def stream_row_plan(chunks):
+    """
+    Yields the items of the iterator ``chunks``, producing each of them in a
+    ``row_plan()`` scope shared by all items.
+    """
+    plan = _row_plan.get() or RowPlan()
+    while True:
+        token = _row_plan.set(plan)
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            return
+        finally:
+            _row_plan.reset(token)
+        yield chunk
+
+
+def render_field(context, render):
+    """
+    Returns the HTML of the field in ``context``, ``render()`` renders it.
+    """
+    plan = _row_plan.get()
+    if plan is None or not fast_fields.uses_shipped_templates(context):
+        return render()
+    return plan.render_field(context, render)
+
+
+class RowPlan:
+    """
+    The HTML of the fields rendered so far, by field key. An entry is
+    ``(prefix, html, reusable)``, ``reusable`` is ``None`` until the entry
+    was verified against a second form.
+    """
+
+    def __init__(self):
+        self.fields = {}
+        self.lock = threading.Lock()
+
+    def render_field(self, context, render):
+        field = context["field"]
+        prefix = getattr(field.form, "prefix", None)
+        key = field_key(field, context) if prefix else None
+        if key is None:
+            return render()
+
+        entry = self.fields.get(key)
+        if entry is None:
+            html = render()
+            with self.lock:
+                self.fields.setdefault(key, (prefix, str(html), None))
+            return html
+
+        reference_prefix, reference_html, reusable = entry
+        if reusable:
+            return mark_safe(substitute(reference_html, reference_prefix, prefix))
+
+        html = render()
+        if reusable is None and prefix != reference_prefix:
+            substituted = substitute(reference_html, reference_prefix, prefix)
+            with self.lock:
+                if self.fields[key][2] is not False:
+                    self.fields[key] = (
+                        reference_prefix,
+                        reference_html,
+                        substituted == html,
+                    )
+        return html
+
+
+def substitute(html, old_prefix, new_prefix):
+    return html.replace(old_prefix + "-", new_prefix + "-")
+
+
+def field_key(field, context):
+    """
+    Returns the key of the HTML of the bound ``field`` rendered with
+    ``context``, or ``None`` if it can't be reused.
+    """
+    form = field.form
+    initial = None
+    if field.field.show_hidden_initial:
+        initial = signature(field.initial)
+    key = (
+        field.name,
+        type(form),
+        form.is_bound,
+        form.auto_id,
+        form.label_suffix,
+        form.use_required_attribute,
+        form.renderer,
+        signature(field.field),
+        signature(field.value()),
+        initial,
+        tuple(str(error) for error in field.errors),
+        context.autoescape,
+        context.use_l10n,
+        context.use_tz,
+        translation.get_language(),
+        tuple(signature(context.get(name)) for name in CONTEXT_KEYS),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def signature(value, seen=frozenset()):
+    """
+    Returns a value equal for equal field definitions and values. Fields,
+    widgets and unhashable objects are compared by their attributes, other
+    objects as they are.
+    """
+    if isinstance(value, SCALARS):
+        return (type(value), value)
+    if isinstance(value, Promise):
+        return str(value)
+    if isinstance(value, ModelChoiceIterator):
+        return (type(value), query_key(value.queryset) or value)
+    if isinstance(value, QuerySet):
+        return (QuerySet, query_key(value) or value)
+    if isinstance(value, Model) and value.pk is not None:
+        return (type(value), value.pk)
+    if id(value) in seen:
+        return None
+
+    seen = seen | {id(value)}
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(signature(item, seen) for item in value))
+    if isinstance(value, dict):
+        items = tuple((key, signature(item, seen)) for key, item in value.items())
+        return (dict, items)
+    if isinstance(value, (forms.Field, forms.Widget)):
+        return (type(value), signature(vars(value), seen))
+    try:
+        hash(value)
+    except TypeError:
+        if hasattr(value, "__dict__"):
+            # e.g. validators, which define __eq__ but no __hash__
+            return (type(value), signature(vars(value), seen))
+    # the plan keeps the object alive, so its identity is not reused
+    return value
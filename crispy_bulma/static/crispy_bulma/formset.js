@@ -0,0 +1,64 @@
+/*
+ * Adds forms to formsets rendered with `helper.render_empty_form = True`,
+ * without a request to the server.
+ *
+ * A click on an element with a `data-formset-add="<prefix>"` attribute clones
+ * the `<template data-formset-prefix="<prefix>">` holding the empty form,
+ * inserts the new form before the template and increments the TOTAL_FORMS of
+ * the management form, up to MAX_NUM_FORMS:
+ *
+ *     <script src="{% static 'crispy_bulma/formset.js' %}" defer></script>
+ *     <button type="button" class="button" data-formset-add="form">Add</button>
+ *
+ * `crispyBulma.addForm(prefix)` does the same from scripts. A `formset:added`
+ * event with the prefix and index of the new form bubbles up from the template.
+ */
+(function () {
+  "use strict";
+
+  function managementInput(prefix, name) {
+    return document.querySelector(
+      'input[name="' + prefix + "-" + name + '"]'
+    );
+  }
+
+  function addForm(prefix) {
+    var template = document.querySelector(
+      'template[data-formset-prefix="' + prefix + '"]'
+    );
+    var total = managementInput(prefix, "TOTAL_FORMS");
+    if (!template || !total) {
+      return null;
+    }
+
+    var index = parseInt(total.value, 10);
+    var max = managementInput(prefix, "MAX_NUM_FORMS");
+    if (max && max.value !== "" && index >= parseInt(max.value, 10)) {
+      return null;
+    }
+
+    var form = document.createElement("template");
+    form.innerHTML = template.innerHTML.replace(/__prefix__/g, index);
+    template.parentNode.insertBefore(form.content, template);
+    total.value = index + 1;
+
+    template.dispatchEvent(
+      new CustomEvent("formset:added", {
+        bubbles: true,
+        detail: { prefix: prefix, index: index },
+      })
+    );
+    return index;
+  }
+
+  document.addEventListener("click", function (event) {
+    var button = event.target.closest("[data-formset-add]");
+    if (button) {
+      event.preventDefault();
+      addForm(button.getAttribute("data-formset-add"));
+    }
+  });
+
+  window.crispyBulma = window.crispyBulma || {};
+  window.crispyBulma.addForm = addForm;
+})();
@@ -0,0 +1,103 @@
+/*
+ * Submits forms with a `data-crispy-partial` attribute as partial requests,
+ * see `crispy_bulma.partial`, and patches the changed fragments in place:
+ *
+ *     <form method="post" data-crispy-partial>...</form>
+ *     <script src="{% static 'crispy_bulma/partial.js' %}" defer></script>
+ *
+ * Every fragment replaces the element with its id. The non field errors
+ * replace the `.notification.is-danger` of the form, or are inserted before
+ * its first field. Valid forms follow the redirect of the view, and other
+ * responses, e.g. the whole page, replace the document.
+ */
+(function () {
+  "use strict";
+
+  function shownErrors(form) {
+    var ids = [];
+    form.querySelectorAll(".is-danger").forEach(function (element) {
+      for (; element !== form; element = element.parentNode) {
+        if (element.id && ids.indexOf(element.id) === -1) {
+          ids.push(element.id);
+        }
+      }
+    });
+    return ids.join(" ");
+  }
+
+  function showPage(html) {
+    document.open();
+    document.write(html);
+    document.close();
+  }
+
+  function replace(element, html) {
+    var template = document.createElement("template");
+    template.innerHTML = html;
+    element.replaceWith(template.content);
+  }
+
+  function patchErrors(form, html) {
+    var errors = form.querySelector(".notification.is-danger");
+    if (errors) {
+      if (html) {
+        replace(errors, html);
+      } else {
+        errors.remove();
+      }
+    } else if (html) {
+      var field = form.querySelector('[id^="div_"]');
+      var template = document.createElement("template");
+      template.innerHTML = html;
+      if (field) {
+        field.parentNode.insertBefore(template.content, field);
+      } else {
+        form.prepend(template.content);
+      }
+    }
+  }
+
+  function patch(form, data) {
+    Object.keys(data.fragments).forEach(function (id) {
+      var element = document.getElementById(id);
+      if (element && form.contains(element)) {
+        replace(element, data.fragments[id]);
+      }
+    });
+    patchErrors(form, data.errors);
+    form.dispatchEvent(
+      new CustomEvent("partial:patched", { bubbles: true, detail: data })
+    );
+  }
+
+  document.addEventListener("submit", function (event) {
+    var form = event.target;
+    if (!form.hasAttribute("data-crispy-partial")) {
+      return;
+    }
+    event.preventDefault();
+
+    fetch(form.action || window.location.href, {
+      method: "POST",
+      body: new FormData(form, event.submitter),
+      credentials: "same-origin",
+      headers: {
+        "X-Crispy-Partial": "1",
+        "X-Crispy-Errors": shownErrors(form),
+      },
+    })
+      .then(function (response) {
+        var type = response.headers.get("Content-Type") || "";
+        if (type.indexOf("application/json") === -1) {
+          return response.text().then(showPage);
+        }
+        return response.json().then(function (data) {
+          if (data.redirect) {
+            window.location.assign(data.redirect);
+          } else {
+            patch(form, data);
+          }
+        });
+      });
+  });
+})();
@@ -0,0 +1,268 @@
+"""
+Streaming rendering of formsets.
+
+``render_crispy_form(formset)`` renders the layout of every form up front
+and returns the whole formset as one string. ``stream_crispy_formset``
+renders the same HTML as a generator of chunks: the form tag, the management
+form, the errors, every form and the inputs are yielded as they are
+rendered, and the layout of each form is only rendered when the form is
+reached. It can be passed to ``StreamingHttpResponse`` directly::
+
+    def bulk_edit(request):
+        formset = ItemFormSet(queryset=Item.objects.all())
+        context = {"csrf_token": get_token(request)}
+        return StreamingHttpResponse(stream_crispy_formset(formset, helper, context))
+
+The formset template is walked node by node. ``{% specialspaceless %}``,
+``{% if %}`` and ``{% for %}`` tags are streamed, any other tag is rendered
+as a whole, so overridden formset templates are supported too. The layout
+is compiled into one render plan for all forms and the forms are rendered in
+a ``crispy_bulma.rows.row_plan()`` scope.
+"""
+
+import re
+
+from django.forms.formsets import BaseFormSet
+from django.template import Context
+from django.template.base import VariableDoesNotExist
+from django.template.context import make_context
+from django.template.defaulttags import ForNode, IfNode
+from django.template.loader import get_template
+
+from crispy_bulma.helper import layout_renderer
+from crispy_bulma.rendering import push_context
+from crispy_bulma.rows import stream_row_plan
+from crispy_forms.helper import FormHelper
+from crispy_forms.templatetags.crispy_forms_tags import (
+    CrispyFormNode,
+    ForLoopSimulator,
+    whole_uni_formset_template,
+)
+from crispy_forms.templatetags.crispy_forms_utils import SpecialSpacelessNode
+from crispy_forms.utils import TEMPLATE_PACK
+
+# the end of a chunk that may be part of a match of ``remove_spaces`` spanning
+# into the next chunk: trailing whitespace, preceded by ">" or "/" or "/>"
+TAIL_RE = re.compile(r"(?:/>|[/>])?\s*\Z")
+SPACES_RE = re.compile(r">\s{3,}<")
+SLASH_RE = re.compile(r"/><")
+
+
+def remove_spaces(html):
+    """
+    ``crispy_forms.templatetags.crispy_forms_utils.remove_spaces``.
+    """
+    return SLASH_RE.sub("/> <", SPACES_RE.sub("> <", html))
+
+
+def stream_spaceless(chunks):
+    """
+    Streaming version of ``{% specialspaceless %}``: yields the chunks of
+    ``remove_spaces("".join(chunks).strip())``.
+    """
+    pending = ""
+    started = False
+    for chunk in chunks:
+        pending += chunk
+        if not started:
+            pending = pending.lstrip()
+            started = bool(pending)
+        # keep back what a match could span into the next chunk
+        cut = TAIL_RE.search(pending).start()
+        if cut:
+            yield remove_spaces(pending[:cut])
+            pending = pending[cut:]
+    html = remove_spaces(pending.rstrip())
+    if html:
+        yield html
+
+
+def stream_nodelist(nodelist, context, prepare):
+    """
+    Yields the output of the nodes of ``nodelist`` rendered with ``context``.
+    ``prepare(item)`` is called for every item of a ``{% for %}`` loop before
+    its body is rendered and may return a function called after it. If
+    ``prepare`` has a ``render_loop(node, context, values, parentloop)``
+    method, it may render a whole loop instead and return its chunks, or
+    ``None`` to render the loop item by item.
+    """
+    for node in nodelist:
+        if isinstance(node, SpecialSpacelessNode):
+            chunks = stream_spaceless(stream_nodelist(node.nodelist, context, prepare))
+        elif isinstance(node, IfNode) and is_streamed(node):
+            chunks = stream_if(node, context, prepare)
+        elif isinstance(node, ForNode) and len(node.loopvars) == 1:
+            chunks = stream_for(node, context, prepare)
+        else:
+            chunks = (node.render_annotated(context),)
+
+        for chunk in chunks:
+            if chunk:
+                yield chunk
+
+
+def is_streamed(node):
+    """
+    Returns whether ``node`` contains a tag that is streamed.
+    """
+    return any(
+        node.get_nodes_by_type(node_type)
+        for node_type in (ForNode, SpecialSpacelessNode)
+    )
+
+
+def stream_if(node, context, prepare):
+    # IfNode.render
+    for condition, nodelist in node.conditions_nodelists:
+        if condition is not None:
+            try:
+                match = condition.eval(context)
+            except VariableDoesNotExist:
+                match = None
+        else:
+            match = True
+
+        if match:
+            yield from stream_nodelist(nodelist, context, prepare)
+            return
+
+
+def stream_for(node, context, prepare):
+    # ForNode.render for a single loop variable, yielding every iteration
+    if "forloop" in context:
+        parentloop = context["forloop"]
+    else:
+        parentloop = {}
+    with context.push():
+        values = node.sequence.resolve(context, ignore_failures=True)
+        if values is None:
+            values = []
+        if not hasattr(values, "__len__"):
+            values = list(values)
+        len_values = len(values)
+        if len_values < 1:
+            yield node.nodelist_empty.render(context)
+            return
+        render_loop = getattr(prepare, "render_loop", None)
+        if render_loop is not None and not node.is_reversed:
+            chunks = render_loop(node, context, values, parentloop)
+            if chunks is not None:
+                yield from chunks
+                return
+        if node.is_reversed:
+            values = reversed(values)
+        loop_dict = context["forloop"] = {"parentloop": parentloop}
+        for i, item in enumerate(values):
+            # Shortcuts for current loop iteration number.
+            loop_dict["counter0"] = i
+            loop_dict["counter"] = i + 1
+            # Reverse counter iteration numbers.
+            loop_dict["revcounter"] = len_values - i
+            loop_dict["revcounter0"] = len_values - i - 1
+            # Boolean values designating first and last times through loop.
+            loop_dict["first"] = i == 0
+            loop_dict["last"] = i == len_values - 1
+
+            context[node.loopvars[0]] = item
+            cleanup = prepare(item)
+            yield "".join(
+                child.render_annotated(context) for child in node.nodelist_loop
+            )
+            if cleanup is not None:
+                cleanup()
+
+
+def stream_crispy_formset(formset, helper=None, context=None):
+    """
+    Renders ``formset`` like ``render_crispy_form(formset, helper, context)``
+    and yields the HTML in chunks.
+    """
+    if not isinstance(formset, BaseFormSet):
+        raise TypeError("stream_crispy_formset() only renders formsets.")
+
+    helper, node_context, final_context, template_pack = formset_contexts(
+        formset, helper, context
+    )
+    prepare = _no_prepare
+    if helper.layout:
+        helper.render_hidden_fields = True
+        prepare = _LayoutRenderer(formset, helper, node_context, template_pack)
+    chunks = stream_formset_template(helper, final_context, template_pack, prepare)
+    yield from stream_row_plan(chunks)
+
+
+def formset_contexts(formset, helper=None, context=None):
+    """
+    Returns the helper, the context to render the layouts of the forms with,
+    the context of the formset template and the template pack, like
+    ``CrispyFormNode.get_render`` without rendering the forms.
+    """
+    if helper is None:
+        helper = getattr(formset, "helper", None) or FormHelper()
+
+    node = CrispyFormNode("form", "helper")
+    if getattr(helper, "template_pack", None):
+        node.template_pack = helper.template_pack
+    template_pack = node.template_pack or TEMPLATE_PACK
+
+    context = Context(context)
+    context.update({"form": formset, "helper": helper})
+    response_dict = node.get_response_dict(helper, context, True)
+    node_context = context.__copy__()
+    node_context.update({"is_bound": formset.is_bound})
+    node_context.update(response_dict)
+    final_context = node_context.__copy__()
+    final_context["formset"] = formset
+    return helper, node_context, final_context, template_pack
+
+
+def stream_formset_template(helper, context, template_pack, prepare=None):
+    """
+    Yields the chunks of the formset template of ``helper`` rendered with
+    ``context``, see ``stream_nodelist`` for ``prepare``.
+    """
+    if getattr(helper, "template", False):
+        template = get_template(helper.template)
+    else:
+        template = whole_uni_formset_template(template_pack)
+
+    # Template.render
+    template = template.template
+    context = make_context(context.flatten(), autoescape=template.engine.autoescape)
+    with context.render_context.push_state(template):
+        with context.bind_template(template):
+            context.template_name = template.name
+            yield from stream_nodelist(
+                template.nodelist, context, prepare or _no_prepare
+            )
+
+
+def _no_prepare(item):
+    return None
+
+
+class _LayoutRenderer:
+    """
+    Renders the layout of each form of the formset when the formset template
+    reaches it, like ``CrispyFormNode.get_render`` does for all forms up front.
+    """
+
+    def __init__(self, formset, helper, context, template_pack):
+        self.forms = {id(form) for form in formset.forms}
+        self.render_layout = layout_renderer(helper, template_pack)
+        self.context = context
+        self.forloop = ForLoopSimulator(formset)
+
+    def __call__(self, form):
+        if id(form) not in self.forms:
+            return None
+
+        with push_context(self.context, forloop=self.forloop, formset_form=form):
+            form.form_html = self.render_layout(form, self.context)
+        self.forloop.iterate()
+
+        def cleanup():
+            # the rendered form is yielded, don't keep it for the whole formset
+            del form.form_html
+
+        return cleanup
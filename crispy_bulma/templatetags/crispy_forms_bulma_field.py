@@ -3,8 +3,13 @@
 # https://github.com/django-crispy-forms/django-crispy-forms/blob/1.12.0/crispy_forms/templatetags/crispy_forms_field.py
 
 from django import forms, template
-from django.conf import settings
-from django.template import Variable
+
+from crispy_bulma import fast_fields, rows
+from crispy_bulma.cache import render_cached_form
+from crispy_bulma.choices import choice_cache
+from crispy_bulma.formsets import render_empty_form
+from crispy_bulma.kinds import widget_kind
+from crispy_bulma.rendering import render_choices, render_widget
 
 register = template.Library()
 
@@ -58,6 +63,9 @@ def is_multivalue(field):
     return isinstance(field.field.widget, forms.MultiWidget)
 
 
+register.filter("widget_kind", widget_kind)
+
+
 @register.filter
 def classes(field):
     """
@@ -80,83 +88,42 @@ def pairwise(iterable):
     return zip(a, a)
 
 
+def resolve_attr(value, context):
+    """
+    Resolves a ``crispy_field`` attribute compiled by ``compile_attr``.
+    """
+    if isinstance(value, str):
+        return value
+    return value.resolve(context)
+
+
+def compile_attr(parser, bit):
+    """
+    Compiles a ``crispy_field`` attribute name or value. String literals such as
+    ``"is-danger"`` are returned as constants, so they cost nothing at render time.
+    """
+    expression = parser.compile_filter(bit)
+    if isinstance(expression.var, str) and not expression.filters:
+        return expression.var
+    return expression
+
+
 class CrispyBulmaFieldNode(template.Node):
     def __init__(self, field, attrs):
+        # ``field`` is a FilterExpression and ``attrs`` a tuple of
+        # (name, value) pairs compiled by ``compile_attr``. Both are
+        # immutable after parsing, so the node is thread safe.
         self.field = field
         self.attrs = attrs
 
     def render(self, context):
-        # Nodes are not threadsafe so we must store and look up our instance
-        # variables in the current rendering context first
-        if self not in context.render_context:
-            context.render_context[self] = (
-                Variable(self.field),
-                self.attrs,
-            )
-
-        field, attrs = context.render_context[self]
-        field = field.resolve(context)
-
-        # There are special django widgets that wrap actual widgets,
-        # such as forms.widgets.MultiWidget, admin.widgets.RelatedFieldWidgetWrapper
-        widgets = getattr(
-            field.field.widget,
-            "widgets",
-            [getattr(field.field.widget, "widget", field.field.widget)],
-        )
+        field = self.field.resolve(context)
+        attrs = [
+            (resolve_attr(name, context), resolve_attr(value, context))
+            for name, value in self.attrs
+        ]
 
-        if isinstance(attrs, dict):
-            attrs = [attrs] * len(widgets)
-
-        converters = {
-            "dateinput": "dateinput input",
-            "datetimeinput": "datetimeinput input",
-            "textinput": "input",
-            "fileinput": "fileinput",
-            "clearablefileinput": "clearablefileinput",
-            "passwordinput": "input",
-            "emailinput": "input",
-            "checkboxinput": "",
-            "select": "",
-            "selectmultiple": "",
-            "numberinput": "numberinput input",
-            "timeinput": "timeinput input",
-            "urlinput": "urlinput input",
-            # custom widget
-            "fileuploadinput": "file-input",
-        }
-        converters.update(getattr(settings, "CRISPY_CLASS_CONVERTERS", {}))
-
-        for widget, attr in zip(widgets, attrs):
-            class_name = widget.__class__.__name__.lower()
-            class_name = converters.get(class_name, class_name)
-            css_class = widget.attrs.get("class", "")
-            if css_class:
-                if css_class.find(class_name) == -1:
-                    css_class += " %s" % class_name
-            else:
-                css_class = class_name
-
-            widget.attrs["class"] = css_class
-
-            if "class" in widget.attrs and not widget.attrs["class"]:
-                # remove the class="" attribute completely if empty
-                del widget.attrs["class"]
-
-            for attribute_name, attribute in attr.items():
-                attribute_name = Variable(attribute_name).resolve(context)
-                attributes = Variable(attribute).resolve(context)
-
-                if attribute_name in widget.attrs:
-                    # multiple attributes are in a single string, e.g.
-                    # "form-control is-invalid"
-                    for attr in attributes.split():
-                        if attr not in widget.attrs[attribute_name].split():
-                            widget.attrs[attribute_name] += " " + attr
-                else:
-                    widget.attrs[attribute_name] = attributes
-
-        return str(field)
+        return render_widget(field, attrs)
 
 
 @register.tag(name="crispy_field")
@@ -165,12 +132,97 @@ def crispy_field(parser, token):
     {% crispy_field field attrs %}
     """
     tokens = token.split_contents()
-    field = tokens.pop(1)
+    field = parser.compile_filter(tokens.pop(1))
     attrs = {}
 
     # We need to pop tag name, or pairwise would fail
     tokens.pop(0)
     for attribute_name, value in pairwise(tokens):
-        attrs[attribute_name] = value
+        attrs[attribute_name] = (
+            compile_attr(parser, attribute_name),
+            compile_attr(parser, value),
+        )
+
+    return CrispyBulmaFieldNode(field, tuple(attrs.values()))
+
+
+@register.simple_tag(takes_context=True)
+def crispy_choices(context, field, input_type, inline=False):
+    """
+    {% crispy_choices field "radio" %}
+    {% crispy_choices field "checkbox" inline=True %}
+
+    Renders the radio buttons or checkboxes of the choices of ``field``.
+    """
+    return render_choices(field, input_type, context, inline=inline)
+
+
+class FastFieldNode(template.Node):
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+
+    def render(self, context):
+        return rows.render_field(context, lambda: self.render_field(context))
+
+    def render_field(self, context):
+        if fast_fields.can_render(context):
+            return fast_fields.render(context)
+        return self.nodelist.render(context)
 
-    return CrispyBulmaFieldNode(field, attrs)
+
+@register.tag(name="fast_field")
+def fast_field(parser, token):
+    """
+    {% fast_field %} ... {% endfast_field %}
+
+    Wraps ``bulma/field.html``. When ``CRISPY_BULMA_FAST_FIELDS`` is enabled
+    the field is rendered in Python, see ``crispy_bulma.fast_fields``. Inside
+    a ``row_plan()`` scope the HTML may be reused, see ``crispy_bulma.rows``.
+    """
+    nodelist = parser.parse(("endfast_field",))
+    parser.delete_first_token()
+    return FastFieldNode(nodelist)
+
+
+class ChoiceCacheNode(template.Node):
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+
+    def render(self, context):
+        with choice_cache():
+            return self.nodelist.render(context)
+
+
+@register.tag(name="choice_cache")
+def choice_cache_tag(parser, token):
+    """
+    {% choice_cache %} ... {% endchoice_cache %}
+
+    Fetches the choices of each distinct model choice queryset rendered inside
+    the block once, see ``crispy_bulma.choices``.
+    """
+    nodelist = parser.parse(("endchoice_cache",))
+    parser.delete_first_token()
+    return ChoiceCacheNode(nodelist)
+
+
+@register.simple_tag(takes_context=True)
+def crispy_cached(context, form, helper=None, *vary_on):
+    """
+    {% crispy_cached form [helper] [vary_on ...] %}
+
+    Renders ``form`` like ``{% crispy %}``, from the fragment cache if the
+    form is unbound, see ``crispy_bulma.cache``.
+    """
+    return render_cached_form(form, helper, context.flatten(), vary_on=vary_on)
+
+
+@register.simple_tag(takes_context=True)
+def crispy_empty_form(context, formset, helper):
+    """
+    {% crispy_empty_form formset helper %}
+
+    Renders the empty form of ``formset`` in a ``<template>`` element, see
+    ``crispy_bulma.formsets``.
+    """
+    return render_empty_form(formset, helper, context)
@@ -0,0 +1,210 @@
+"""
+Validating single fields.
+
+Inline validation on every keystroke or blur shouldn't post and re-render
+the whole form. ``FieldValidationMixin`` answers requests with a
+``validate`` parameter by cleaning only that field, and the fields it
+depends on, and returning only its fragment from ``bulma/field.html``, with
+the ``is-danger`` classes and error messages::
+
+    class SignupView(FieldValidationMixin, FormView):
+        form_class = SignupForm
+        # password2 is compared to password1 in SignupForm.clean()
+        dependent_fields = {"password2": ["password1"]}
+        validation_fields = ["username", "email", "password2"]
+
+The widgets of ``validation_fields`` get ``hx-*`` attributes posting the
+form to ``?validate=<name>`` after the user stopped typing for
+``validation_debounce`` milliseconds. ``validation_throttle = (10, 1)``
+answers more than 10 validation requests per second of a client with
+``429 Too Many Requests``. ``debounce()`` and ``throttle()`` are the hooks
+to change either.
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+from django.forms import FileField, ValidationError
+from django.forms.utils import ErrorDict
+from django.http import Http404, HttpResponse
+from django.utils.functional import lazy
+from django.views.generic.edit import BaseCreateView
+
+from crispy_bulma.cache import get_cache
+from crispy_bulma.fragments import fragment_id, render_fragment
+
+
+def validate_fields(form, names):
+    """
+    Cleans the fields ``names`` of the bound ``form`` and runs its
+    ``clean()`` method, like ``form.full_clean()`` does for all fields. The
+    errors of other fields are not set, and the model instance of model
+    forms is left alone.
+    """
+    form._errors = ErrorDict(renderer=form.renderer)
+    form.cleaned_data = {}
+    for name in names:
+        bound_field = form[name]
+        field = bound_field.field
+        value = bound_field.initial if field.disabled else bound_field.data
+        try:
+            if isinstance(field, FileField):
+                value = field.clean(value, bound_field.initial)
+            else:
+                value = field.clean(value)
+            form.cleaned_data[name] = value
+            if hasattr(form, "clean_%s" % name):
+                form.cleaned_data[name] = getattr(form, "clean_%s" % name)()
+        except ValidationError as e:
+            form.add_error(name, e)
+
+    try:
+        cleaned_data = form.clean()
+    except ValidationError as e:
+        form.add_error(None, e)
+    else:
+        if cleaned_data is not None:
+            form.cleaned_data = cleaned_data
+    return form
+
+
+class FieldValidationMixin:
+    """
+    Mixin for views using ``FormMixin``, e.g. ``FormView`` or ``UpdateView``,
+    validating and rendering single fields, see ``crispy_bulma.validation``.
+    """
+
+    validation_parameter = "validate"
+    # {field name: names of the fields its validation depends on}
+    dependent_fields = {}
+    # the fields validated while the user types
+    validation_fields = ()
+    # milliseconds after the last change before a field is validated
+    validation_debounce = 300
+    # (requests, seconds) allowed per client, or None
+    validation_throttle = None
+
+    def get_validation_field(self):
+        """
+        Returns the name of the field to validate, or ``None``.
+        """
+        name = self.request.GET.get(self.validation_parameter)
+        if name is None:
+            name = self.request.POST.get(self.validation_parameter)
+        return name or None
+
+    def get_dependent_fields(self, name):
+        return list(self.dependent_fields.get(name, ()))
+
+    def post(self, request, *args, **kwargs):
+        name = self.get_validation_field()
+        if name is None:
+            return super().post(request, *args, **kwargs)
+        if hasattr(self, "get_object"):
+            self.object = self.get_validation_object()
+        return self.validate_field(name)
+
+    def get_validation_object(self):
+        """
+        Returns the object of views with ``get_object()``, set as
+        ``self.object`` before the form is built like ``UpdateView.post()``
+        does. ``CreateView`` has no object yet.
+        """
+        if isinstance(self, BaseCreateView):
+            return None
+        return self.get_object()
+
+    def validate_field(self, name):
+        """
+        Returns the response to a validation request for the field ``name``.
+        """
+        retry_after = self.throttle(name)
+        if retry_after is not None:
+            response = HttpResponse(status=429)
+            response["Retry-After"] = str(retry_after)
+            return response
+
+        form = self.get_form()
+        names = [name] + self.get_dependent_fields(name)
+        if any(field_name not in form.fields for field_name in names):
+            raise Http404("No field %r in the form." % name)
+
+        validate_fields(form, names)
+        context = self.get_context_data(form=form)
+        html = render_fragment(
+            form,
+            name,
+            getattr(form, "helper", None),
+            {**context, "request": self.request},
+        )
+        return HttpResponse(html)
+
+    def throttle(self, name):
+        """
+        Returns the number of seconds the client has to wait before
+        validating ``name`` again, or ``None`` to validate it now.
+        """
+        if not self.validation_throttle:
+            return None
+
+        requests, seconds = self.validation_throttle
+        key = "crispy_bulma.validation.%s" % self.get_throttle_key()
+        cache = get_cache()
+        cache.add(key, 0, seconds)
+        try:
+            count = cache.incr(key)
+        except ValueError:
+            # the window expired in between
+            cache.add(key, 1, seconds)
+            count = 1
+        if count > requests:
+            return seconds
+        return None
+
+    def get_throttle_key(self):
+        """
+        Returns the key the validation requests of a client are counted by.
+        """
+        session = getattr(self.request, "session", None)
+        if session is not None and session.session_key:
+            return "session:%s" % session.session_key
+        return "address:%s" % self.request.META.get("REMOTE_ADDR", "")
+
+    def debounce(self, name):
+        """
+        Returns the milliseconds after the last change of ``name`` before it
+        is validated.
+        """
+        return self.validation_debounce
+
+    def get_validation_attrs(self, form, name):
+        """
+        Returns the widget attributes validating the field ``name`` of
+        ``form`` while the user types, for htmx.
+        """
+        query = "?%s=%s" % (self.validation_parameter, name)
+        return {
+            "hx-post": self.request.path + query,
+            "hx-trigger": "input changed delay:%sms, blur" % self.debounce(name),
+            # resolved when the widget renders, after views set form.helper
+            "hx-target": lazy(self.get_validation_target, str)(form, name),
+            "hx-swap": "outerHTML",
+            "hx-include": "closest form",
+        }
+
+    def get_validation_target(self, form, name):
+        """
+        Returns the selector of the element the fragment of the field ``name``
+        replaces, see ``crispy_bulma.fragments.fragment_id``.
+        """
+        element_id = fragment_id(form, name, getattr(form, "helper", None))
+        if element_id is None:
+            raise ImproperlyConfigured(
+                "The field %r has no element to replace, e.g. it is in a "
+                "FormGroup without css_id." % name
+            )
+        return "#%s" % element_id
+
+    def get_form(self, form_class=None):
+        form = super().get_form(form_class)
+        for name in self.validation_fields:
+            form.fields[name].widget.attrs.update(self.get_validation_attrs(form, name))
+        return form
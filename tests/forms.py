@@ -1,4 +1,5 @@
 from django import forms
+from django.contrib.auth.models import Group
 from django.db import models
 
 from crispy_forms.helper import FormHelper
@@ -292,3 +293,25 @@ class FormGroupForm(forms.Form):
     fruit = forms.ChoiceField(
         choices=[("apple", "Apple"), ("pear", "Pear")],
     )
+
+
+class ModelChoicesForm(forms.Form):
+    select = forms.ModelChoiceField(queryset=Group.objects.all())
+    radio = forms.ModelChoiceField(
+        queryset=Group.objects.all(), widget=forms.RadioSelect
+    )
+    checkboxes = forms.ModelMultipleChoiceField(
+        queryset=Group.objects.all(), widget=forms.CheckboxSelectMultiple
+    )
+
+
+class UserProjectsForm(forms.Form):
+    project = forms.ChoiceField()
+    group = forms.ModelChoiceField(queryset=Group.objects.all())
+
+    def __init__(self, *args, user, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["project"].choices = [(user, "%s-secret-project" % user)]
+        self.fields["project"].initial = user
+        self.fields["project"].widget.attrs["data-user"] = user
+        self.fields["group"].queryset = Group.objects.filter(name=user)
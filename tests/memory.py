@@ -0,0 +1,102 @@
+"""
+``tracemalloc`` measurements of renders, see ``test_memory.py``.
+"""
+
+import functools
+import gc
+import tracemalloc
+from contextlib import contextmanager
+
+
+class Measurement:
+    """
+    The memory a render used, in bytes: ``peak`` is the highest traced
+    memory during the render, ``retained`` and ``blocks`` the memory and
+    number of memory blocks still allocated after it. ``calls`` maps the
+    names of the measured methods to the peaks of each of their calls.
+    """
+
+    def __init__(self):
+        self.peak = 0
+        self.retained = 0
+        self.blocks = 0
+        self.calls = {}
+
+    def max_call_peak(self, name):
+        return max(self.calls[name])
+
+
+class _CallTracker:
+    """
+    Tracks the peak memory of every call of the wrapped methods. Calls may
+    be nested, e.g. ``Button.render`` in ``FormGroup.render``, so the peak
+    of the traced memory is reset per call and passed on to the callers.
+    """
+
+    def __init__(self, measurement):
+        self.measurement = measurement
+        self.stack = []
+
+    def enter(self):
+        current, peak = tracemalloc.get_traced_memory()
+        for frame in self.stack:
+            frame[1] = max(frame[1], peak)
+        tracemalloc.reset_peak()
+        self.stack.append([current, current])
+
+    def exit(self, name):
+        current, peak = tracemalloc.get_traced_memory()
+        start, frame_peak = self.stack.pop()
+        frame_peak = max(frame_peak, peak)
+        if self.stack:
+            self.stack[-1][1] = max(self.stack[-1][1], frame_peak)
+        self.measurement.calls.setdefault(name, []).append(frame_peak - start)
+
+    def wrap(self, name, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            self.enter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.exit(name)
+
+        return wrapper
+
+
+@contextmanager
+def measure_memory(monkeypatch=None, methods=()):
+    """
+    Measures the memory used inside the block into the ``Measurement`` it
+    yields. ``methods`` are ``(class, method name)`` pairs whose calls are
+    measured too, patched with ``monkeypatch``.
+    """
+    measurement = Measurement()
+    tracker = _CallTracker(measurement)
+    for cls, name in methods:
+        label = "%s.%s" % (cls.__name__, name)
+        monkeypatch.setattr(cls, name, tracker.wrap(label, getattr(cls, name)))
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.take_snapshot()
+        tracker.enter()
+        yield measurement
+        tracker.exit("total")
+        gc.collect()
+        end = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # the snapshots and the measurements themselves
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ]
+    stats = end.filter_traces(filters).compare_to(
+        start.filter_traces(filters), "filename"
+    )
+    measurement.peak = measurement.calls.pop("total")[0]
+    measurement.retained = sum(stat.size_diff for stat in stats)
+    measurement.blocks = sum(stat.count_diff for stat in stats)
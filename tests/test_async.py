@@ -0,0 +1,72 @@
+import pytest
+from asgiref.sync import async_to_sync
+
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.forms import formset_factory
+from django.template import Context
+from django.test.utils import CaptureQueriesContext
+
+from crispy_bulma.aio import arender_crispy_form
+from crispy_bulma.choices import aprefetch_choices
+from crispy_bulma.layout import Button, Column, FormGroup, IconField, Row, Submit
+from crispy_forms.utils import render_crispy_form
+
+from .forms import ModelChoicesForm
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def objects():
+    return [Group.objects.create(name="Group %s" % i) for i in range(3)]
+
+
+def test_arender_crispy_form(objects):
+    form = ModelChoicesForm(initial={"radio": objects[1]})
+    html = render_crispy_form(form)
+
+    with CaptureQueriesContext(connection) as queries:
+        assert async_to_sync(arender_crispy_form)(form) == html
+
+    # the three fields share their queryset
+    assert len(queries) == 1
+
+
+def test_arender_crispy_form_formset(objects):
+    formset = formset_factory(ModelChoicesForm, extra=3)()
+    html = render_crispy_form(formset)
+
+    with CaptureQueriesContext(connection) as queries:
+        assert async_to_sync(arender_crispy_form)(formset) == html
+
+    assert len(queries) == 1
+
+
+def test_aprefetch_choices_outside_choice_cache():
+    with pytest.raises(RuntimeError):
+        async_to_sync(aprefetch_choices)(ModelChoicesForm())
+
+
+@pytest.mark.parametrize(
+    "layout_object, num_queries",
+    [
+        (Row(Column("select"), "radio"), 1),
+        (IconField("select", icon_prepend="fas fa-users"), 1),
+        (FormGroup(Submit("save", "Save"), Button("Delete")), 0),
+    ],
+)
+def test_layout_object_arender(objects, layout_object, num_queries):
+    def make_form():
+        # as set up by FormHelper.render_layout
+        form = ModelChoicesForm()
+        form.crispy_field_template = None
+        return form
+
+    html = layout_object.render(make_form(), Context())
+
+    with CaptureQueriesContext(connection) as queries:
+        arender = async_to_sync(layout_object.arender)
+        assert arender(make_form(), Context()) == html
+
+    assert len(queries) == num_queries
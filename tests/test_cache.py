@@ -0,0 +1,176 @@
+import pytest
+
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.template import Context, Template
+from django.template.context_processors import csrf
+from django.test import RequestFactory, override_settings
+from django.utils import translation
+
+from crispy_bulma import cache as form_cache
+from crispy_bulma.cache import cache_key, render_cached_form
+from crispy_bulma.layout import HTML, Layout
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+
+from .forms import SampleForm, UserProjectsForm
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    calls = []
+
+    def render(form, helper=None, context=None):
+        calls.append(form)
+        return render_crispy_form(form, helper, context)
+
+    monkeypatch.setattr(form_cache, "render_crispy_form", render)
+    return calls
+
+
+def test_render_cached_form(renders):
+    context = {"csrf_token": "first"}
+    html = render_cached_form(SampleForm(), FormHelper(), context)
+    assert html == render_crispy_form(SampleForm(), FormHelper(), context)
+    assert 'name="csrfmiddlewaretoken" value="first"' in html
+
+    context = {"csrf_token": "second"}
+    html = render_cached_form(SampleForm(), FormHelper(), context)
+    assert html == render_crispy_form(SampleForm(), FormHelper(), context)
+    assert len(renders) == 1
+
+
+def test_render_cached_form_sets_csrf_cookie(renders):
+    render_cached_form(SampleForm(), FormHelper(), {"csrf_token": "first"})
+
+    request = RequestFactory().get("/")
+    html = render_cached_form(SampleForm(), FormHelper(), csrf(request))
+    assert "CSRF_COOKIE" in request.META
+    assert "csrfmiddlewaretoken" in html
+    assert len(renders) == 1
+
+
+def test_render_cached_form_without_csrf_token(renders):
+    html = render_cached_form(SampleForm(), FormHelper())
+    assert "csrfmiddlewaretoken" not in html
+
+    html = render_cached_form(SampleForm(), FormHelper(), {"csrf_token": "first"})
+    assert 'value="first"' in html
+    assert len(renders) == 2
+
+
+def test_render_cached_form_nonce(renders):
+    helper = FormHelper()
+    helper.form_tag = False
+    helper.layout = Layout("email", HTML('<script nonce="{{ csp_nonce }}"></script>'))
+
+    for nonce in ["first", "second"]:
+        html = render_cached_form(SampleForm(), helper, {"csp_nonce": nonce})
+        assert '<script nonce="%s">' % nonce in html
+    assert len(renders) == 1
+
+
+def test_render_cached_form_bound(renders):
+    form = SampleForm({"email": "invalid"})
+    render_cached_form(form, FormHelper())
+    render_cached_form(form, FormHelper())
+    assert len(renders) == 2
+    assert len(cache._cache) == 0
+
+
+def test_cache_key():
+    helper = FormHelper()
+    key = cache_key(SampleForm(), helper)
+    assert cache_key(SampleForm(), FormHelper()) == key
+
+    assert cache_key(SampleForm(prefix="other"), helper) != key
+    assert cache_key(SampleForm(initial={"email": "a@b.c"}), helper) != key
+    assert cache_key(SampleForm(), helper, {"csrf_token": "x"}) != key
+    assert cache_key(SampleForm(), helper, vary_on=[1]) != key
+
+    with translation.override("de"):
+        assert cache_key(SampleForm(), helper) != key
+
+    helper.form_method = "get"
+    assert cache_key(SampleForm(), helper) != key
+
+    helper = FormHelper()
+    helper.layout = Layout("email")
+    layout_key = cache_key(SampleForm(), helper)
+    helper.layout.append("first_name")
+    assert cache_key(SampleForm(), helper) != layout_key
+
+
+def test_cache_key_follows_templates():
+    key = cache_key(SampleForm(), FormHelper())
+    templates = [
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "OPTIONS": {
+                "loaders": [
+                    (
+                        "django.template.loaders.locmem.Loader",
+                        {"bulma/layout/help_text.html": "<p>custom help text</p>"},
+                    ),
+                    "django.template.loaders.app_directories.Loader",
+                ],
+            },
+        }
+    ]
+    with override_settings(TEMPLATES=templates):
+        assert cache_key(SampleForm(), FormHelper()) != key
+    assert cache_key(SampleForm(), FormHelper()) == key
+
+
+@override_settings(CRISPY_BULMA_FORM_CACHE_HOLES=[])
+def test_render_cached_form_holes_setting():
+    render_cached_form(SampleForm(), FormHelper(), {"csrf_token": "first"})
+    html = render_cached_form(SampleForm(), FormHelper(), {"csrf_token": "second"})
+    assert 'value="first"' in html
+
+
+def test_crispy_cached_tag(renders):
+    template = Template(
+        """
+        {% load crispy_forms_bulma_field %}
+        {% crispy_cached form %}
+        {% crispy_cached form None "other" %}
+        """
+    )
+    html = template.render(Context({"form": SampleForm()}))
+    template.render(Context({"form": SampleForm()}))
+    assert html.count("<form") == 2
+    assert len(renders) == 2
+
+
+@pytest.mark.django_db
+def test_cache_key_covers_fields(renders):
+    alice = render_cached_form(UserProjectsForm(user="alice"), FormHelper())
+    bob = render_cached_form(UserProjectsForm(user="bob"), FormHelper())
+    assert "alice-secret-project" in alice
+    assert "alice" not in bob
+    assert "bob-secret-project" in bob
+    assert len(renders) == 2
+
+    render_cached_form(UserProjectsForm(user="alice"), FormHelper())
+    assert len(renders) == 2
+
+    keys = set()
+    for change in [
+        lambda form: None,
+        lambda form: setattr(form.fields["project"], "initial", "other"),
+        lambda form: form.fields["project"].widget.attrs.update(x="1"),
+        lambda form: setattr(form.fields["group"], "queryset", Group.objects.none()),
+        lambda form: form.order_fields(["group", "project"]),
+    ]:
+        form = UserProjectsForm(user="alice")
+        change(form)
+        keys.add(cache_key(form, FormHelper()))
+    assert len(keys) == 5
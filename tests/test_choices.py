@@ -0,0 +1,103 @@
+import pytest
+
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.forms import formset_factory
+from django.template import Context, Template
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from crispy_bulma.choices import (
+    assert_no_duplicate_choice_queries,
+    choice_cache,
+    choice_cache_middleware,
+)
+from crispy_forms.utils import render_crispy_form
+
+from .forms import ModelChoicesForm
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def objects():
+    return [Group.objects.create(name="Group %s" % i) for i in range(3)]
+
+
+def test_choice_cache(objects):
+    form = ModelChoicesForm(
+        initial={"radio": objects[1], "checkboxes": [objects[0], objects[2]]}
+    )
+    html = render_crispy_form(form)
+
+    with CaptureQueriesContext(connection) as queries:
+        with choice_cache():
+            cached_html = render_crispy_form(form)
+            assert render_crispy_form(form) == cached_html
+
+    assert cached_html == html
+    # the three fields share their queryset
+    assert len(queries) == 1
+
+
+def test_choice_cache_formset(objects):
+    formset = formset_factory(ModelChoicesForm, extra=5)()
+    html = render_crispy_form(formset)
+
+    with CaptureQueriesContext(connection) as queries:
+        with choice_cache():
+            assert render_crispy_form(formset) == html
+
+    assert len(queries) == 1
+
+
+def test_choice_cache_keys(objects):
+    form = ModelChoicesForm()
+    form.fields["radio"].queryset = Group.objects.filter(pk=objects[0].pk)
+    form.fields["checkboxes"].queryset = Group.objects.none()
+
+    with CaptureQueriesContext(connection) as queries:
+        with choice_cache():
+            html = render_crispy_form(form)
+
+    assert len(queries) == 2
+    assert html.count('type="radio"') == 1
+    assert html.count('type="checkbox"') == 0
+
+
+def test_choice_cache_tag(objects):
+    template = Template(
+        """
+        {% load crispy_forms_tags crispy_forms_bulma_field %}
+        {% choice_cache %}{% crispy form %}{% crispy form %}{% endchoice_cache %}
+        """
+    )
+    with CaptureQueriesContext(connection) as queries:
+        template.render(Context({"form": ModelChoicesForm()}))
+
+    assert len(queries) == 1
+
+
+def test_choice_cache_middleware(objects):
+    def view(request):
+        render_crispy_form(ModelChoicesForm())
+        render_crispy_form(ModelChoicesForm())
+
+    middleware = choice_cache_middleware(view)
+    with CaptureQueriesContext(connection) as queries:
+        middleware(RequestFactory().get("/"))
+
+    assert len(queries) == 1
+
+
+def test_assert_no_duplicate_choice_queries(objects):
+    formset = formset_factory(ModelChoicesForm, extra=2)()
+
+    with pytest.raises(AssertionError, match="1 choice queries"):
+        with assert_no_duplicate_choice_queries():
+            render_crispy_form(formset)
+
+    with assert_no_duplicate_choice_queries() as queries:
+        with choice_cache():
+            render_crispy_form(formset)
+    assert list(queries.values()) == [1]
@@ -0,0 +1,151 @@
+import pytest
+
+import django
+from django.template import Context, Engine, engines
+from django.test import override_settings
+from django.test.html import parse_html
+
+from crispy_bulma.bulma import InlineRadios
+from crispy_bulma.layout import Button, Column, Field, FormGroup, IconField, Row, Submit
+from crispy_forms.helper import FormHelper
+from crispy_forms.layout import Layout
+from crispy_forms.utils import render_crispy_form
+
+from .forms import (
+    CheckboxesSampleForm,
+    FormGroupForm,
+    HelpTextForm,
+    InputsForm,
+    SampleForm,
+    SampleForm5,
+    SampleForm6,
+)
+from .utils import parse_expected
+
+LT50 = "__lt50" if django.VERSION < (5, 0) else ""
+
+
+def inputs_form(layout_object):
+    form = InputsForm()
+    form.helper = FormHelper()
+    form.helper.layout = Layout(layout_object)
+    return form
+
+
+def email_form():
+    form = SampleForm()
+    form.helper = FormHelper()
+    form.helper.layout = Layout("email")
+    return form
+
+
+def row_form():
+    form = SampleForm()
+    form.helper = FormHelper()
+    form.helper.layout = Layout(
+        Row(Column("first_name", css_class="is-full")),
+        Row(Column("first_name"), Column("last_name")),
+    )
+    return form
+
+
+def help_text_form():
+    form = HelpTextForm()
+    form.helper = FormHelper()
+    return form
+
+
+def form_group_form(form_horizontal=False):
+    form = FormGroupForm()
+    form.helper = FormHelper()
+    form.helper.form_horizontal = form_horizontal
+    form.helper.layout = Layout(
+        Field("text_input"),
+        FormGroup(
+            Field("fruit"),
+            Submit("accept", "Accept", css_class="is-primary"),
+            Button("Reject", css_class="is-danger"),
+        ),
+    )
+    return form
+
+
+FIXTURES = [
+    (lambda: inputs_form("text_input"), "test_text_input.html"),
+    (lambda: inputs_form("text_area"), "test_text_area.html"),
+    (lambda: inputs_form("radio"), "test_radio.html"),
+    (lambda: inputs_form(InlineRadios("inline_radios")), "test_inline_radios.html"),
+    (lambda: inputs_form("checkbox"), "test_checkbox.html"),
+    (lambda: inputs_form("checkboxes"), "test_checkboxes.html"),
+    (lambda: inputs_form("inline_checkboxes"), "test_inline_checkboxes.html"),
+    (lambda: inputs_form("select_input"), "test_select.html"),
+    (
+        lambda: inputs_form(Field("select_multiple", size="5")),
+        "test_selectmultiple.html",
+    ),
+    (
+        lambda: inputs_form(
+            IconField(
+                "input_with_icon",
+                icon_prepend="fa-solid fa-envelope",
+                icon_append="fa-duotone fa-check-double",
+                css_class="is-large",
+            )
+        ),
+        "test_input_with_icon.html",
+    ),
+    (email_form, "test_email_field%s.html" % LT50),
+    (row_form, "row.html"),
+    (help_text_form, "help_text_escape%s.html" % LT50),
+    (form_group_form, "test_form_group%s.html" % LT50),
+    (lambda: form_group_form(True), "test_form_group_horizontal%s.html" % LT50),
+]
+
+
+@pytest.mark.parametrize("make_form,expected", FIXTURES)
+def test_fast_fields_parity(make_form, expected):
+    html = render_crispy_form(make_form())
+    with override_settings(CRISPY_BULMA_FAST_FIELDS=True):
+        fast_html = render_crispy_form(make_form())
+
+    assert fast_html == html
+    assert parse_html(fast_html) == parse_expected(expected)
+
+
+@pytest.mark.parametrize(
+    "form",
+    [
+        SampleForm(),
+        SampleForm({"email": "invalid", "first_name": "too long"}),
+        CheckboxesSampleForm(),
+        CheckboxesSampleForm({"checkboxes": ["2", "3"]}),
+        SampleForm5({"radio_select": "1000"}),
+        SampleForm6(),
+        InputsForm({"text_input": "text", "checkbox": "on", "select_multiple": ["2"]}),
+    ],
+)
+@pytest.mark.parametrize("form_horizontal", [False, True])
+def test_fast_fields_parity_without_layout(form, form_horizontal):
+    helper = FormHelper()
+    helper.form_horizontal = form_horizontal
+    helper.label_class = "is-small"
+    html = render_crispy_form(form, helper)
+    with override_settings(CRISPY_BULMA_FAST_FIELDS=True):
+        assert render_crispy_form(form, helper) == html
+
+
+@override_settings(CRISPY_BULMA_FAST_FIELDS=True)
+def test_fast_fields_fall_back_to_overridden_templates():
+    engine = Engine(
+        loaders=[
+            (
+                "django.template.loaders.locmem.Loader",
+                {"bulma/layout/help_text.html": "<p>custom help text</p>"},
+            ),
+            "django.template.loaders.app_directories.Loader",
+        ],
+        libraries=engines["django"].engine.libraries,
+    )
+    template = engine.get_template("bulma/field.html")
+    html = template.render(Context({"field": HelpTextForm()["email"]}))
+    assert "<p>custom help text</p>" in html
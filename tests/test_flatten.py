@@ -0,0 +1,186 @@
+from contextlib import contextmanager
+
+import pytest
+
+from django.core.management import call_command
+from django.template import Context, Template, engines
+from django.test import override_settings
+
+from crispy_bulma.bulma import InlineCheckboxes, InlineRadios
+from crispy_bulma.fast_fields import FLAT_TEMPLATES_DIR, TEMPLATES_DIR
+from crispy_bulma.flatten import flatten_template, inlined_templates
+from crispy_bulma.layout import IconField, Submit
+from crispy_forms.helper import FormHelper
+from crispy_forms.layout import Layout
+from crispy_forms.utils import render_crispy_form
+
+from .forms import (
+    CheckboxesSampleForm,
+    FileForm,
+    GroupedChoiceForm,
+    HelpTextForm,
+    InputsForm,
+    LabelForm,
+    SampleForm,
+    SampleFormCustomWidgets,
+)
+from .utils import clear_crispy_templates
+
+LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "crispy_bulma.loaders.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+
+
+@contextmanager
+def template_settings(loaders=LOADERS, flat=True):
+    clear_crispy_templates()
+    try:
+        with override_settings(
+            TEMPLATES=[
+                {
+                    "BACKEND": "django.template.backends.django.DjangoTemplates",
+                    "OPTIONS": {"loaders": loaders},
+                }
+            ],
+            CRISPY_BULMA_FLAT_TEMPLATES=flat,
+        ):
+            yield
+    finally:
+        clear_crispy_templates()
+
+
+def assert_same_html(render):
+    html = render()
+    with template_settings():
+        origin = engines["django"].get_template("bulma/whole_uni_form.html").origin
+        assert origin.name.startswith(FLAT_TEMPLATES_DIR)
+        assert render() == html
+
+
+def test_flat_templates_up_to_date():
+    call_command("flatten_templates", check=True, verbosity=0)
+
+
+@pytest.mark.parametrize(
+    "form_class",
+    [
+        CheckboxesSampleForm,
+        FileForm,
+        GroupedChoiceForm,
+        HelpTextForm,
+        InputsForm,
+        LabelForm,
+        SampleForm,
+        SampleFormCustomWidgets,
+    ],
+    ids=lambda cls: cls.__name__,
+)
+@pytest.mark.parametrize("bound", [False, True])
+def test_render_form(form_class, bound):
+    data = {"email": "invalid", "first_name": "toolong"} if bound else None
+    helper = FormHelper()
+    helper.add_input(Submit("submit", "Submit"))
+    assert_same_html(lambda: render_crispy_form(form_class(data), helper))
+
+
+@pytest.mark.parametrize("form_horizontal", [False, True])
+@pytest.mark.parametrize("fast_fields", [False, True])
+def test_render_layout(form_horizontal, fast_fields):
+    helper = FormHelper()
+    helper.form_horizontal = form_horizontal
+    helper.layout = Layout(
+        "text_input",
+        IconField("input_with_icon", icon_prepend="fa fa-user"),
+        InlineRadios("inline_radios"),
+        InlineCheckboxes("inline_checkboxes"),
+        "select_multiple",
+        "checkbox",
+    )
+    with override_settings(CRISPY_BULMA_FAST_FIELDS=fast_fields):
+        assert_same_html(
+            lambda: render_crispy_form(InputsForm({"text_input": ""}), helper)
+        )
+
+
+def test_render_crispy_filter():
+    template = Template("{% load crispy_forms_filters %}{{ form|crispy }}")
+    assert_same_html(lambda: template.render(Context({"form": SampleForm()})))
+
+
+def test_render_custom_field_template():
+    helper = FormHelper()
+    helper.field_template = "custom_field_template.html"
+    assert_same_html(lambda: render_crispy_form(SampleForm(), helper))
+
+
+def test_setting_disabled():
+    with template_settings(flat=False):
+        origin = engines["django"].get_template("bulma/field.html").origin
+    assert origin.name.startswith(TEMPLATES_DIR)
+
+
+def test_overridden_inlined_template():
+    loaders = [
+        (
+            "django.template.loaders.locmem.Loader",
+            {"bulma/layout/help_text.html": "<p>custom help text</p>"},
+        ),
+        *LOADERS,
+    ]
+    with template_settings(loaders):
+        engine = engines["django"]
+        assert engine.get_template("bulma/field.html").origin.name.startswith(
+            TEMPLATES_DIR
+        )
+        assert engine.get_template("bulma/layout/select.html").origin.name.startswith(
+            TEMPLATES_DIR
+        )
+        html = render_crispy_form(HelpTextForm(), FormHelper())
+    assert "<p>custom help text</p>" in html
+
+
+def test_inlined_templates():
+    source = flatten_template("bulma/layout/input_with_icon.html")
+    # the field-body block of field.html with its includes is replaced
+    assert inlined_templates(source) == [
+        "bulma/field.html",
+        "bulma/layout/help_text.html",
+    ]
+    assert "{% extends" not in source
+    assert "{% fast_field %}" not in source
+    assert inlined_templates("<div></div>") is None
+
+
+def test_flatten_includes():
+    sources = {
+        "a/main.html": (
+            "{% load l1 %}"
+            '[{% include "./b.html" with x=1 y=z %}]'
+            '[{% include "a/b.html" only %}]'
+            "[{% include name %}]"
+            "[{% include field_template %}]"
+        ),
+        "a/b.html": "{% load l1 %}{% load l2 %}b",
+        "bulma/field.html": "field",
+    }
+    assert flatten_template("a/main.html", sources.__getitem__) == (
+        "{# flattened: a/b.html bulma/field.html #}{% load l1 %}{% load l2 %}"
+        "[{% with x=1 y=z %}b{% endwith %}]"
+        '[{% include "a/b.html" only %}]'
+        "[{% include name %}]"
+        '[{% if field_template == "bulma/field.html" %}field'
+        "{% else %}{% include field_template %}{% endif %}]"
+    )
+
+
+def test_flatten_block_super():
+    sources = {
+        "child.html": (
+            '{% extends "base.html" %}{% block a %}{{ block.super }}{% endblock %}'
+        ),
+        "base.html": "{% block a %}a{% endblock %}",
+    }
+    with pytest.raises(ValueError):
+        flatten_template("child.html", sources.__getitem__)
@@ -0,0 +1,93 @@
+import pytest
+
+from django.core.cache import cache
+from django.forms import formset_factory
+
+from crispy_bulma import formsets
+from crispy_bulma.helper import FormHelper
+from crispy_bulma.layout import Column, Layout, Row
+from crispy_bulma.streaming import stream_crispy_formset
+from crispy_forms.utils import render_crispy_form
+
+from .forms import SampleForm, UserProjectsForm
+
+SampleFormSet = formset_factory(SampleForm, extra=2)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    calls = []
+    render_form = formsets.render_form
+
+    def render(form, *args, **kwargs):
+        calls.append(form)
+        return render_form(form, *args, **kwargs)
+
+    monkeypatch.setattr(formsets, "render_form", render)
+    return calls
+
+
+def make_helper(layout=False, render_empty_form=True):
+    helper = FormHelper()
+    helper.render_empty_form = render_empty_form
+    if layout:
+        helper.layout = Layout("email", Row(Column("first_name"), "last_name"))
+    return helper
+
+
+@pytest.mark.parametrize("layout", [False, True])
+def test_render_empty_form(layout):
+    html = render_crispy_form(SampleFormSet(), make_helper(layout))
+    assert html.count('<template data-formset-prefix="form">') == 1
+    template = html[html.index("<template") : html.index("</template>")]
+    assert 'name="form-__prefix__-email"' in template
+    assert 'id="div_id_form-__prefix__-first_name"' in template
+    assert 'name="form-TOTAL_FORMS"' not in template
+    # the forms of the formset come first
+    assert html.index('name="form-1-email"') < html.index("<template")
+    if layout:
+        assert 'class="columns"' in template
+
+
+@pytest.mark.parametrize("layout", [False, True])
+def test_render_empty_form_disabled(layout):
+    html = render_crispy_form(SampleFormSet(), make_helper(layout, False))
+    assert "<template" not in html
+    assert "__prefix__" not in html
+
+
+def test_render_empty_form_cached(renders):
+    first = render_crispy_form(SampleFormSet(), make_helper(layout=True))
+    second = render_crispy_form(SampleFormSet(), make_helper(layout=True))
+    assert first == second
+    assert len(renders) == 1
+
+    # another prefix is another empty form
+    html = render_crispy_form(SampleFormSet(prefix="rows"), make_helper(layout=True))
+    assert 'name="rows-__prefix__-email"' in html
+    assert len(renders) == 2
+
+
+def test_render_empty_form_streamed():
+    html = render_crispy_form(SampleFormSet(), make_helper(layout=True))
+    streamed = "".join(stream_crispy_formset(SampleFormSet(), make_helper(True)))
+    assert streamed == html
+    assert '<template data-formset-prefix="form">' in streamed
+
+
+@pytest.mark.django_db
+def test_render_empty_form_key_covers_form_kwargs():
+    FormSet = formset_factory(UserProjectsForm, extra=0)
+    html = {
+        user: render_crispy_form(FormSet(form_kwargs={"user": user}), make_helper())
+        for user in ["alice", "bob"]
+    }
+    assert "alice-secret-project" in html["alice"]
+    assert "alice" not in html["bob"]
@@ -0,0 +1,182 @@
+import pytest
+
+from django.http import Http404
+from django.test import RequestFactory
+from django.views.generic import FormView
+
+from crispy_bulma.fragments import (
+    FragmentMixin,
+    fragment_id,
+    parse_target,
+    render_fragment,
+)
+from crispy_bulma.layout import (
+    Column,
+    Field,
+    FormGroup,
+    IconField,
+    Layout,
+    Row,
+    Submit,
+)
+from crispy_forms.helper import FormHelper
+from crispy_forms.templatetags.crispy_forms_utils import remove_spaces
+from crispy_forms.utils import render_crispy_form
+
+from .forms import SampleForm
+
+
+def make_helper():
+    helper = FormHelper()
+    helper.layout = Layout(
+        "is_company",
+        IconField("email", icon_prepend="fas fa-envelope"),
+        Row(Column("first_name"), Column(Field("last_name", "password1"))),
+        FormGroup(Submit("save", "Save"), "password2"),
+    )
+    return helper
+
+
+def assert_fragment(html, form, helper):
+    assert remove_spaces(html.strip()) in render_crispy_form(form, helper)
+
+
+@pytest.mark.parametrize("bound", [False, True])
+@pytest.mark.parametrize(
+    "name", ["is_company", "email", "first_name", "last_name", "password1"]
+)
+def test_render_fragment_field(bound, name):
+    data = {"email": "invalid", "first_name": "toolong"} if bound else None
+    html = render_fragment(SampleForm(data), name, make_helper())
+    assert 'id="div_id_%s"' % name in html
+    assert html.count('class="field') == 1
+    assert_fragment(html, SampleForm(data), make_helper())
+
+
+def test_render_fragment_field_errors():
+    form = SampleForm({"email": "invalid"})
+    html = render_fragment(form, "email", make_helper())
+    assert "is-danger" in html
+    assert "Enter a valid email address." in html
+    assert "fas fa-envelope" in html
+
+
+def test_render_fragment_field_without_layout():
+    html = render_fragment(SampleForm(), "email")
+    assert 'id="div_id_email"' in html
+    assert 'name="password1"' not in html
+    assert_fragment(html, SampleForm(), FormHelper())
+
+
+def test_render_fragment_field_in_form_group():
+    html = render_fragment(SampleForm(), "password2", make_helper())
+    assert 'name="save"' in html
+    assert 'name="password2"' in html
+    assert_fragment(html, SampleForm(), make_helper())
+
+
+@pytest.mark.parametrize("path", [(1,), (2,), (2, 1), (3,)])
+def test_render_fragment_layout_path(path):
+    html = render_fragment(SampleForm(), path, make_helper())
+    assert_fragment(html, SampleForm(), make_helper())
+
+
+def test_render_fragment_layout_path_field():
+    html = render_fragment(SampleForm(), [2, 0, 0], make_helper())
+    assert html == render_fragment(SampleForm(), "first_name", make_helper())
+
+
+@pytest.mark.parametrize(
+    "target,element_id",
+    [
+        ("is_company", "div_id_is_company"),
+        ("email", "div_id_email"),
+        ("last_name", "div_id_last_name"),
+        ("password2", None),
+        ((2, 0, 0), "div_id_first_name"),
+        ((2, 1, 0), None),
+        ((3,), None),
+    ],
+)
+def test_fragment_id(target, element_id):
+    assert fragment_id(SampleForm(), target, make_helper()) == element_id
+    if element_id is not None:
+        html = render_fragment(SampleForm(), target, make_helper())
+        assert html.strip().startswith('<div\n    id="%s"' % element_id)
+
+
+@pytest.mark.parametrize("form_horizontal", [False, True])
+def test_fragment_id_form_group(form_horizontal):
+    helper = make_helper()
+    helper.form_horizontal = form_horizontal
+    helper.layout[3].id = "passwords"
+    assert fragment_id(SampleForm(), "password2", helper) == "passwords"
+    html = render_fragment(SampleForm(), "password2", helper)
+    assert html.strip().startswith('<div id="passwords" class="field is-')
+    assert html.count('id="passwords"') == 1
+    assert_fragment(html, SampleForm(), helper)
+
+
+@pytest.mark.parametrize("target", ["unknown", (5,), (0, 0), ()])
+def test_render_fragment_unknown(target):
+    with pytest.raises(LookupError):
+        render_fragment(SampleForm(), target, make_helper())
+
+
+def test_parse_target():
+    assert parse_target("email") == "email"
+    assert parse_target("2.1") == (2, 1)
+    assert parse_target("3") == (3,)
+
+
+class SampleView(FragmentMixin, FormView):
+    form_class = SampleForm
+    template_name = "crispy_render_template.html"
+    success_url = "/done/"
+
+    def get_form(self, form_class=None):
+        form = super().get_form(form_class)
+        form.helper = make_helper()
+        return form
+
+
+def test_fragment_mixin_get():
+    request = RequestFactory().get("/", {"fragment": "email"})
+    response = SampleView.as_view()(request)
+    assert response.status_code == 200
+    html = response.content.decode()
+    assert 'id="div_id_email"' in html
+    assert "<form" not in html
+
+
+def test_fragment_mixin_post_invalid():
+    request = RequestFactory().post("/?fragment=email", {"email": "invalid"})
+    response = SampleView.as_view()(request)
+    assert response.status_code == 200
+    assert "Enter a valid email address." in response.content.decode()
+
+
+def test_fragment_mixin_post_valid_is_not_saved():
+    data = {
+        "email": "a@example.com",
+        "password1": "secret",
+        "password2": "secret",
+        "first_name": "a",
+        "last_name": "b",
+        "datetime_field_0": "2024-01-01",
+        "datetime_field_1": "10:00",
+        "fragment": "2.0",
+    }
+    response = SampleView.as_view()(RequestFactory().post("/", data))
+    assert response.status_code == 200
+    assert 'id="div_id_first_name"' in response.content.decode()
+
+    del data["fragment"]
+    response = SampleView.as_view()(RequestFactory().post("/", data))
+    assert response.status_code == 302
+
+
+def test_fragment_mixin_unknown_fragment():
+    request = RequestFactory().get("/", {"fragment": "unknown"})
+    with pytest.raises(Http404):
+        SampleView.as_view()(request)
@@ -0,0 +1,147 @@
+import logging
+
+import pytest
+
+from django.http import HttpResponse
+from django.template import Context, Template
+from django.test import RequestFactory, override_settings
+
+from crispy_bulma import instrumentation, layout
+from crispy_bulma.helper import FormHelper as BulmaFormHelper
+from crispy_bulma.instrumentation import (
+    ServerTimingMiddleware,
+    add_timing_hook,
+    collect_timings,
+    install,
+    remove_timing_hook,
+    uninstall,
+)
+from crispy_bulma.layout import (
+    Button,
+    Column,
+    FormGroup,
+    IconField,
+    Layout,
+    Row,
+    Submit,
+)
+from crispy_forms.helper import FormHelper
+from crispy_forms.layout import Div
+from crispy_forms.utils import render_crispy_form
+
+from .forms import SampleForm
+
+
+@pytest.fixture
+def installed():
+    install()
+    yield
+    uninstall()
+
+
+def make_helper(helper_class=FormHelper):
+    helper = helper_class()
+    helper.layout = Layout(
+        IconField("email", icon_prepend="fas fa-envelope"),
+        Row(Column("first_name"), Column("last_name")),
+        FormGroup(Submit("save", "Save"), Button("Cancel")),
+    )
+    return helper
+
+
+def test_not_installed():
+    assert "render" not in Row.__dict__
+    with collect_timings() as timings:
+        render_crispy_form(SampleForm(), make_helper())
+    assert timings.as_dict() == {}
+
+
+def test_uninstall(installed):
+    assert Row.render is not Div.render
+    uninstall()
+    assert "render" not in Row.__dict__
+    assert Row.render is Div.render
+    assert FormGroup.render.__name__ == "render"
+    assert not hasattr(FormGroup.render, "__wrapped__")
+
+
+def test_collect_timings(installed):
+    html = render_crispy_form(SampleForm(), make_helper())
+    with collect_timings() as timings:
+        assert render_crispy_form(SampleForm(), make_helper()) == html
+    counts = {name: timing["count"] for name, timing in timings.as_dict().items()}
+    assert counts["IconField"] == 1
+    assert counts["Row"] == 1
+    assert counts["Column"] == 2
+    assert counts["FormGroup"] == 1
+    assert counts["Submit"] == 1
+    assert counts["Button"] == 1
+    assert counts["include:bulma/display_form.html"] == 1
+    assert counts["field"] == 3
+    assert counts["crispy_field"] == 3
+    assert all(timing["duration"] >= 0 for timing in timings.as_dict().values())
+
+
+def test_collect_timings_render_plan(installed):
+    helper = make_helper(BulmaFormHelper)
+    html = render_crispy_form(SampleForm(), helper)
+    with collect_timings() as timings:
+        assert render_crispy_form(SampleForm(), helper) == html
+    # Row and Column are static strings of the plan
+    assert "Row" not in timings.as_dict()
+    assert timings.as_dict()["FormGroup"]["count"] == 1
+    assert timings.as_dict()["field"]["count"] == 3
+
+
+def test_outside_collect_timings(installed):
+    template = Template("{% load crispy_forms_tags %}{% crispy form helper %}")
+    context = Context({"form": SampleForm(), "helper": make_helper()})
+    assert template.render(context) == render_crispy_form(SampleForm(), make_helper())
+
+
+def test_server_timing():
+    timings = instrumentation.RenderTimings()
+    timings.add("Row", 0.002)
+    timings.add("Row", 0.001)
+    timings.add("include:bulma/field.html", 0.0005)
+    assert timings.server_timing() == (
+        'crispy-0-Row;dur=3.000;desc="Row x2", '
+        "crispy-1-include_bulma_field.html;dur=0.500;"
+        'desc="include:bulma/field.html x1"'
+    )
+
+
+def render_view(request):
+    return HttpResponse(render_crispy_form(SampleForm(), make_helper()))
+
+
+@override_settings(CRISPY_BULMA_INSTRUMENTATION=True)
+def test_middleware(caplog):
+    calls = []
+
+    def hook(timings, request):
+        calls.append((timings, request))
+
+    add_timing_hook(hook)
+    try:
+        middleware = ServerTimingMiddleware(render_view)
+        request = RequestFactory().get("/form/")
+        with caplog.at_level(logging.INFO, logger="crispy_bulma.instrumentation"):
+            response = middleware(request)
+    finally:
+        remove_timing_hook(hook)
+        uninstall()
+
+    assert 'desc="Row x1"' in response["Server-Timing"]
+    [record] = caplog.records
+    assert record.getMessage() == "Rendered forms of GET /form/"
+    assert record.crispy_timings["Column"]["count"] == 2
+    [(timings, hook_request)] = calls
+    assert hook_request is request
+    assert timings.as_dict() == record.crispy_timings
+
+
+def test_middleware_disabled():
+    with pytest.raises(instrumentation.MiddlewareNotUsed):
+        ServerTimingMiddleware(render_view)
+    assert "render" not in layout.Row.__dict__
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 import django
@@ -8,7 +10,9 @@ from django.template import Context, Template
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
+from crispy_bulma.layout import HTML as BulmaHTML
 from crispy_bulma.layout import Button, Column, Field, FormGroup, Row, Submit
+from crispy_bulma.rendering import compile_template
 from crispy_forms.helper import FormHelper
 from crispy_forms.layout import HTML, Fieldset, Layout
 from crispy_forms.utils import render_crispy_form
@@ -552,3 +556,77 @@ def test_form_group_form():
     else:
         result = "test_form_group_horizontal.html"
     assert parse_form(form) == parse_expected(result)
+
+
+def test_button_and_html_content_are_not_modified():
+    button = Button("{{ label }}")
+    html = BulmaHTML("<p>{{ label }}</p>")
+    helper = FormHelper()
+    helper.layout = Layout(button, html)
+
+    for label in ["first", "{{ second }}"]:
+        output = render_crispy_form(SampleForm(), helper, {"label": label})
+        assert ">%s</button>" % label in output
+        assert "<p>%s</p>" % label in output
+
+    assert button.content == "{{ label }}"
+    assert html.html == "<p>{{ label }}</p>"
+
+
+def test_button_and_html_templates_are_compiled_once():
+    compile_template.cache_clear()
+    helper = FormHelper()
+    helper.layout = Layout(Button("{{ label }}"), BulmaHTML("<p>{{ label }}</p>"))
+
+    for label in ["first", "second", "third"]:
+        render_crispy_form(SampleForm(), helper, {"label": label})
+
+    info = compile_template.cache_info()
+    assert (info.misses, info.hits) == (2, 4)
+
+
+def test_concurrent_render_of_shared_layout():
+    helper = FormHelper()
+    helper.form_tag = False
+    helper.layout = Layout(
+        Button("Button {{ label }}"),
+        BulmaHTML("<p>HTML {{ label }}</p>"),
+        FormGroup(Button("Grouped {{ label }}")),
+    )
+
+    def render(label):
+        return render_crispy_form(SampleForm(), helper, {"label": label})
+
+    labels = ["label-%s" % i for i in range(200)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        outputs = list(executor.map(render, labels))
+
+    for label, output in zip(labels, outputs):
+        assert output.count(label) == 3
+        assert ">Button %s</button>" % label in output
+        assert "<p>HTML %s</p>" % label in output
+        assert ">Grouped %s</button>" % label in output
+
+
+def test_layout_objects_do_not_leak_into_context():
+    form = FormGroupForm()
+    form.helper = FormHelper()
+    form.helper.layout = Layout(
+        FormGroup(
+            Submit("accept", "Accept {{ label }}", control_class="is-expanded"),
+            Button("Reject", control_class="is-right"),
+        ),
+        Button("After"),
+        Field("text_input"),
+    )
+    context = Context({"label": "now"})
+    html = form.helper.render_layout(form, context)
+
+    assert "exclude_field_wrapper" not in context
+    assert "control_class" not in context
+    assert 'value="Accept now"' in html
+    assert html.count("is-expanded") == 1
+    assert html.count("is-right") == 1
+    assert '<div class="control">\n  <button  class="button">After</button>' in html
+    assert 'id="div_id_text_input"' in html
+    assert form.helper.layout[0][0].value == "Accept {{ label }}"
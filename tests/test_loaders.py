@@ -0,0 +1,157 @@
+import os
+from contextlib import contextmanager
+
+import pytest
+
+from django.template import Context, Engine, TemplateDoesNotExist, engines
+from django.test import override_settings
+
+from crispy_bulma.loaders import TEMPLATE_PACK_DIR, Loader
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+
+from .forms import SampleForm, SampleForm5
+from .utils import clear_crispy_templates
+
+LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "crispy_bulma.loaders.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+
+
+@contextmanager
+def loader_settings():
+    clear_crispy_templates()
+    with override_settings(
+        TEMPLATES=[
+            {
+                "BACKEND": "django.template.backends.django.DjangoTemplates",
+                "OPTIONS": {"loaders": LOADERS},
+            }
+        ]
+    ):
+        yield
+    clear_crispy_templates()
+
+
+def make_engine(loaders=LOADERS, dirs=()):
+    return Engine(
+        dirs=list(dirs),
+        loaders=loaders,
+        libraries=engines["django"].engine.libraries,
+    )
+
+
+def test_loads_all_templates():
+    loader = Loader(make_engine())
+    names = {
+        os.path.relpath(
+            os.path.join(root, filename), os.path.dirname(TEMPLATE_PACK_DIR)
+        )
+        for root, _, filenames in os.walk(TEMPLATE_PACK_DIR)
+        for filename in filenames
+    }
+    assert "bulma/layout/input_with_icon.html" in loader.templates
+    assert set(loader.templates) == {name.replace(os.sep, "/") for name in names}
+
+
+def test_templates_compiled_once():
+    engine = make_engine()
+    template = engine.get_template("bulma/field.html")
+    assert engine.get_template("bulma/field.html") is template
+    assert template.origin.loader is engine.template_loaders[1]
+
+
+def test_other_templates_not_loaded():
+    with pytest.raises(TemplateDoesNotExist):
+        Loader(make_engine()).get_template("crispy_render_template.html")
+
+
+@pytest.mark.parametrize("form_class", [SampleForm, SampleForm5])
+def test_render_same_html(form_class, monkeypatch):
+    html = render_crispy_form(form_class({"email": "invalid"}), FormHelper())
+
+    loaded = []
+    get_template = Loader.get_template
+
+    def load(loader, template_name, skip=None):
+        loaded.append(template_name)
+        return get_template(loader, template_name, skip)
+
+    monkeypatch.setattr(Loader, "get_template", load)
+    with loader_settings():
+        assert (
+            render_crispy_form(form_class({"email": "invalid"}), FormHelper()) == html
+        )
+    assert "bulma/field.html" in loaded
+
+
+def test_dirs_override_wins(tmp_path):
+    (tmp_path / "bulma" / "layout").mkdir(parents=True)
+    (tmp_path / "bulma" / "layout" / "help_text.html").write_text("<p>custom</p>")
+    engine = make_engine(dirs=[tmp_path])
+    loader = engine.template_loaders[1]
+    assert "bulma/layout/help_text.html" not in loader.templates
+    template = engine.get_template("bulma/layout/help_text.html")
+    assert template.source == "<p>custom</p>"
+
+
+def test_earlier_loader_wins():
+    engine = make_engine(
+        [
+            (
+                "django.template.loaders.locmem.Loader",
+                {"bulma/layout/help_text.html": "<p>custom</p>"},
+            ),
+            *LOADERS,
+        ]
+    )
+    assert engine.get_template("bulma/layout/help_text.html").source == "<p>custom</p>"
+
+
+def test_extends_field_template():
+    # layout/input_with_icon.html extends ../field.html of the same loader
+    engine = make_engine()
+    template = engine.get_template("bulma/layout/input_with_icon.html")
+    html = template.render(
+        Context({"field": SampleForm()["email"], "icon_prepend": "fas fa-envelope"})
+    )
+    assert "has-icons-left" in html
+    assert 'name="email"' in html
+
+
+def test_cached_loader():
+    engine = make_engine([("django.template.loaders.cached.Loader", LOADERS)])
+    template = engine.get_template("bulma/field.html")
+    assert isinstance(template.origin.loader, Loader)
+    assert engine.get_template("bulma/field.html") is template
+
+
+def test_watch(tmp_path, monkeypatch):
+    (tmp_path / "bulma").mkdir()
+    path = tmp_path / "bulma" / "errors.html"
+    path.write_text("first")
+    monkeypatch.setattr("crispy_bulma.loaders.TEMPLATES_DIR", str(tmp_path))
+    monkeypatch.setattr("crispy_bulma.loaders.TEMPLATE_PACK_DIR", str(path.parent))
+    monkeypatch.setattr(Loader, "override_dirs", lambda loader: [])
+    loader = Loader(make_engine(), watch=True)
+    template = loader.get_template("bulma/errors.html")
+    assert template.source == "first"
+    assert loader.get_template("bulma/errors.html") is template
+
+    path.write_text("second")
+    os.utime(path, (0, 0))
+    assert loader.get_template("bulma/errors.html").source == "second"
+
+    path.unlink()
+    with pytest.raises(TemplateDoesNotExist):
+        loader.get_template("bulma/errors.html")
+
+
+def test_reset():
+    loader = Loader(make_engine())
+    templates = loader.templates
+    loader.reset()
+    assert loader.templates is not templates
+    assert loader.get_dirs() == [os.path.dirname(TEMPLATE_PACK_DIR)]
@@ -0,0 +1,108 @@
+"""
+Memory budgets of rendering forms and formsets.
+
+Every scenario is rendered once to load the templates, then measured with
+``tracemalloc``. The budgets are about twice the measured values, so an
+allocation regression in the field, ``Button`` or ``FormGroup`` rendering
+fails the scenario while noise between Python and Django versions doesn't.
+"""
+
+import sys
+
+import pytest
+
+from django import forms
+from django.forms import formset_factory
+
+from crispy_bulma.layout import Button, Column, FormGroup, Layout, Row, Submit
+from crispy_bulma.templatetags.crispy_forms_bulma_field import CrispyBulmaFieldNode
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+
+from .forms import SampleForm
+from .memory import measure_memory
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 9), reason="tracemalloc.reset_peak() needs Python 3.9"
+)
+
+METHODS = [
+    (CrispyBulmaFieldNode, "render"),
+    (Button, "render"),
+    (FormGroup, "render"),
+]
+
+KB = 1024
+
+
+def make_form_class(fields):
+    attrs = {"field_%s" % i: forms.CharField(max_length=30) for i in range(fields)}
+    return type("Form%s" % fields, (forms.Form,), attrs)
+
+
+def make_helper():
+    helper = FormHelper()
+    helper.layout = Layout(
+        "email",
+        Row(Column("first_name"), Column("last_name")),
+        FormGroup(
+            Submit("save", "Save"), *(Button("Button %s" % i) for i in range(10))
+        ),
+    )
+    return helper
+
+
+def render_form(fields):
+    form_class = make_form_class(fields)
+    return lambda: render_crispy_form(form_class(), FormHelper())
+
+
+def render_layout():
+    return render_crispy_form(SampleForm(), make_helper())
+
+
+def render_formset(size):
+    formset_class = formset_factory(
+        SampleForm, extra=size, max_num=size, absolute_max=size
+    )
+    return lambda: render_crispy_form(formset_class(), make_helper())
+
+
+SCENARIOS = {
+    "form-10": render_form(10),
+    "form-100": render_form(100),
+    "form-layout": render_layout,
+    "formset-10": render_formset(10),
+    "formset-100": render_formset(100),
+}
+
+FIELD_CALLS = {"CrispyBulmaFieldNode.render": 32 * KB}
+LAYOUT_CALLS = {
+    **FIELD_CALLS,
+    "Button.render": 10 * KB,
+    "FormGroup.render": 32 * KB,
+}
+
+# scenario: (peak, retained, retained blocks, max peak per call of METHODS)
+BUDGETS = {
+    "form-10": (144 * KB, 16 * KB, 100, FIELD_CALLS),
+    "form-100": (680 * KB, 16 * KB, 100, FIELD_CALLS),
+    "form-layout": (128 * KB, 16 * KB, 100, LAYOUT_CALLS),
+    "formset-10": (640 * KB, 16 * KB, 100, LAYOUT_CALLS),
+    "formset-100": (5600 * KB, 32 * KB, 200, LAYOUT_CALLS),
+}
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_memory_budget(monkeypatch, scenario):
+    render = SCENARIOS[scenario]
+    render()
+    with measure_memory(monkeypatch, METHODS) as measurement:
+        render()
+
+    peak, retained, blocks, call_peaks = BUDGETS[scenario]
+    assert measurement.peak <= peak
+    assert measurement.retained <= retained
+    assert measurement.blocks <= blocks
+    for name, budget in call_peaks.items():
+        assert measurement.max_call_peak(name) <= budget, name
@@ -0,0 +1,120 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.forms import formset_factory
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+
+from crispy_bulma.helper import FormHelper as PlanFormHelper
+from crispy_bulma.layout import HTML, Button, Column, Layout, Row, Submit
+from crispy_bulma.parallel import render_crispy_formset_parallel
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+
+from .forms import ModelChoicesForm, SampleForm
+
+
+def make_formset(bound=False, extra=7):
+    formset_class = formset_factory(SampleForm, extra=extra)
+    if not bound:
+        return formset_class()
+    return formset_class(
+        {"form-TOTAL_FORMS": "5", "form-INITIAL_FORMS": "0", "form-0-email": "x"}
+    )
+
+
+def make_helper(layout=False, helper_class=FormHelper):
+    helper = helper_class()
+    helper.add_input(Submit("save", "Save"))
+    if layout:
+        helper.layout = Layout(
+            HTML("{% if forloop.first %}<p>first</p>{% endif %}"),
+            "email",
+            Row(Column("first_name"), Column("last_name")),
+            Button("Row {{ forloop.counter }} of {{ forloop.revcounter }}"),
+        )
+    return helper
+
+
+@pytest.mark.parametrize("bound", [False, True])
+@pytest.mark.parametrize("layout", [False, True])
+@pytest.mark.parametrize("chunk_size", [None, 1, 3, 100])
+def test_render_crispy_formset_parallel(bound, layout, chunk_size):
+    context = {"csrf_token": "token"}
+    html = render_crispy_form(make_formset(bound), make_helper(layout), context)
+    parallel_html = render_crispy_formset_parallel(
+        make_formset(bound),
+        make_helper(layout),
+        context,
+        max_workers=3,
+        chunk_size=chunk_size,
+    )
+    assert parallel_html == html
+
+
+def test_render_crispy_formset_parallel_executor():
+    html = render_crispy_form(make_formset(), make_helper(True, PlanFormHelper))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for i in range(3):
+            helper = make_helper(True, PlanFormHelper)
+            parallel_html = render_crispy_formset_parallel(
+                make_formset(), helper, executor=executor, chunk_size=2
+            )
+            assert parallel_html == html
+
+
+@pytest.mark.parametrize("max_workers,chunks", [(None, 9), (1, 3), (2, 5)])
+def test_render_crispy_formset_parallel_executor_chunks(
+    monkeypatch, max_workers, chunks
+):
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        submit = executor.submit
+        submitted = []
+
+        def count_submit(*args):
+            submitted.append(args)
+            return submit(*args)
+
+        monkeypatch.setattr(executor, "submit", count_submit)
+        render_crispy_formset_parallel(
+            make_formset(extra=9), executor=executor, max_workers=max_workers
+        )
+    # chunks for max_workers, or the CPUs, ignoring the executor's workers
+    assert len(submitted) == chunks
+
+
+def test_render_crispy_formset_parallel_language():
+    with translation.override("de"):
+        html = render_crispy_form(make_formset(bound=True))
+        parallel_html = render_crispy_formset_parallel(
+            make_formset(bound=True), max_workers=2, chunk_size=1
+        )
+    assert "Dieses Feld ist zwingend erforderlich." in html
+    assert parallel_html == html
+
+
+@pytest.mark.django_db
+def test_render_crispy_formset_parallel_choices():
+    Group.objects.bulk_create(Group(name="Group %s" % i) for i in range(3))
+    formset = formset_factory(ModelChoicesForm, extra=6)
+    html = render_crispy_form(formset())
+
+    with CaptureQueriesContext(connection) as queries:
+        parallel_html = render_crispy_formset_parallel(
+            formset(), max_workers=2, chunk_size=2
+        )
+
+    assert parallel_html == html
+    assert len(queries) == 1
+
+
+def test_render_crispy_formset_parallel_errors():
+    with pytest.raises(TypeError):
+        render_crispy_formset_parallel(SampleForm())
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(TypeError):
+            render_crispy_formset_parallel(make_formset(), executor=executor)
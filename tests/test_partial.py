@@ -0,0 +1,140 @@
+import pytest
+
+from django.urls import path
+from django.views.generic import FormView
+
+from crispy_bulma.layout import FormGroup, Layout
+from crispy_bulma.partial import PartialResponseMixin, changed_fields, render_partial
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+
+from .forms import SampleForm
+
+DATA = {
+    "email": "a@example.com",
+    "password1": "secret",
+    "password2": "secret",
+    "first_name": "a",
+    "last_name": "b",
+    "datetime_field_0": "2024-01-01",
+    "datetime_field_1": "10:00",
+}
+
+
+class ProfileView(PartialResponseMixin, FormView):
+    form_class = SampleForm
+    template_name = "crispy_render_template.html"
+    success_url = "/done/"
+
+
+def make_helper(css_id=None):
+    helper = FormHelper()
+    helper.layout = Layout(
+        "email",
+        FormGroup("password1", "password2", css_id=css_id),
+        "first_name",
+        "last_name",
+        "datetime_field",
+    )
+    return helper
+
+
+class GroupedProfileView(ProfileView):
+    def get_form(self, form_class=None):
+        form = super().get_form(form_class)
+        form.helper = make_helper()
+        return form
+
+
+urlpatterns = [
+    path("profile/", ProfileView.as_view()),
+    path("grouped/", GroupedProfileView.as_view()),
+]
+
+pytestmark = pytest.mark.urls(__name__)
+
+
+def test_changed_fields():
+    form = SampleForm({**DATA, "email": "invalid", "first_name": "toolong"})
+    assert changed_fields(form) == ["email", "first_name"]
+    assert changed_fields(form, {"div_id_last_name"}) == [
+        "email",
+        "first_name",
+        "last_name",
+    ]
+
+
+def test_changed_fields_values():
+    form = SampleForm(DATA)
+    form.fields["last_name"].disabled = True
+    assert changed_fields(form) == ["last_name"]
+
+
+def test_render_partial():
+    form = SampleForm({**DATA, "email": "invalid", "password2": "other"})
+    data = render_partial(form)
+    assert data["valid"] is False
+    assert list(data["fragments"]) == ["div_id_email"]
+    html = data["fragments"]["div_id_email"]
+    assert html.startswith('<div\n    id="div_id_email"')
+    assert "Enter a valid email address." in html
+    assert "Passwords dont match" in data["errors"]
+
+
+def test_render_partial_form_group():
+    helper = make_helper("passwords")
+    form = SampleForm({**DATA, "password1": "", "password2": ""})
+    data = render_partial(form, helper=helper)
+    assert list(data["fragments"]) == ["passwords"]
+    html = data["fragments"]["passwords"]
+    assert html.startswith('<div id="passwords"')
+    assert html.count('name="password1"') == html.count('name="password2"') == 1
+    assert html.count("is-danger") == 2
+    assert 'id="passwords"' in render_crispy_form(form, helper)
+
+    form = SampleForm(DATA)
+    assert changed_fields(form, {"passwords"}, helper) == ["password1", "password2"]
+
+
+def test_render_partial_form_group_without_id():
+    form = SampleForm({**DATA, "password1": ""})
+    assert render_partial(form, helper=make_helper()) is None
+    form = SampleForm({**DATA, "email": "invalid"})
+    assert list(render_partial(form, helper=make_helper())["fragments"]) == [
+        "div_id_email"
+    ]
+
+
+def test_partial_response_whole_page(client):
+    response = client.post(
+        "/grouped/", {**DATA, "password1": ""}, headers={"X-Crispy-Partial": "1"}
+    )
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/html")
+    assert "<form" in response.content.decode()
+
+
+def test_partial_response(client):
+    response = client.post(
+        "/profile/",
+        {**DATA, "first_name": "toolong"},
+        headers={"X-Crispy-Partial": "1", "X-Crispy-Errors": "div_id_email"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["valid"] is False
+    assert data["errors"] == ""
+    assert list(data["fragments"]) == ["div_id_email", "div_id_first_name"]
+    assert "is-danger" not in data["fragments"]["div_id_email"]
+    assert "is-danger" in data["fragments"]["div_id_first_name"]
+
+
+def test_partial_response_valid(client):
+    response = client.post("/profile/", DATA, headers={"X-Crispy-Partial": "1"})
+    assert response.json() == {"valid": True, "redirect": "/done/"}
+
+
+def test_full_response(client):
+    response = client.post("/profile/", {**DATA, "first_name": "toolong"})
+    assert "<form" in response.content.decode()
+    assert client.post("/profile/", DATA).status_code == 302
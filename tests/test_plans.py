@@ -0,0 +1,184 @@
+import pytest
+
+from django.forms import formset_factory
+from django.template import Context
+from django.test import override_settings
+
+from crispy_bulma.bulma import InlineRadios
+from crispy_bulma.helper import FormHelper, layout_renderer
+from crispy_bulma.layout import (
+    HTML,
+    Button,
+    Column,
+    Div,
+    Field,
+    Fieldset,
+    FormGroup,
+    IconField,
+    Layout,
+    Row,
+    Submit,
+)
+from crispy_bulma.plans import DivStep, FieldStep, RenderPlan
+from crispy_forms.helper import FormHelper as CrispyFormHelper
+from crispy_forms.utils import render_crispy_form
+
+from .forms import InputsForm, SampleForm
+
+
+def sample_layout():
+    return Layout(
+        Fieldset(
+            "Legend {{ label }}",
+            Row(
+                Column("email", css_class="is-half"),
+                Column(Field("password1", css_class="big", wrapper_class="wr")),
+            ),
+            Div(
+                Div(IconField("password2", icon_prepend="fa a"), css_id="inner"),
+                css_class="outer",
+                data_test="x",
+            ),
+        ),
+        HTML("<p>{{ label }}</p>"),
+        "first_name",
+        FormGroup(
+            Field("last_name"),
+            Submit("save", "Save"),
+            Button("Delete {{ label }}", css_class="is-danger"),
+        ),
+        Div("is_company", template="optional_div.html"),
+        Div("datetime_field", template="optional_div.html"),
+        Button("After"),
+    )
+
+
+def render(helper_class, form, **kwargs):
+    helper = helper_class()
+    helper.layout = sample_layout()
+    for name, value in kwargs.items():
+        setattr(helper, name, value)
+    return render_crispy_form(form, helper, {"label": "text"})
+
+
+@pytest.mark.parametrize(
+    "form",
+    [SampleForm(), SampleForm({"email": "invalid", "first_name": "too long"})],
+)
+@pytest.mark.parametrize("form_horizontal", [False, True])
+def test_render_plan_parity(form, form_horizontal):
+    html = render(CrispyFormHelper, form, form_horizontal=form_horizontal)
+    plan_html = render(FormHelper, form, form_horizontal=form_horizontal)
+    assert plan_html == html
+
+
+def test_render_plan_parity_formset():
+    formset = formset_factory(SampleForm, extra=3)()
+    assert render(FormHelper, formset) == render(CrispyFormHelper, formset)
+
+
+def test_render_plan_parity_unmentioned_fields():
+    form = InputsForm()
+    helper = CrispyFormHelper()
+    helper.layout = Layout(Row(Column(InlineRadios("inline_radios"))))
+    helper.render_unmentioned_fields = True
+    plan_helper = FormHelper()
+    plan_helper.layout = helper.layout
+    plan_helper.render_unmentioned_fields = True
+    assert render_crispy_form(form, plan_helper) == render_crispy_form(form, helper)
+
+
+def test_render_plan_steps():
+    helper = FormHelper()
+    helper.layout = Layout(
+        Row(Column("email"), Column("first_name")),
+        Div("last_name", template="optional_div.html"),
+    )
+    steps = helper.get_render_plan().steps
+
+    assert [type(step) for step in steps[1:-1:2]] == [FieldStep, FieldStep]
+    assert isinstance(steps[-1], DivStep)
+    assert steps[0] == '<div class="columns" ><div class="column" >'
+    assert steps[2] == '</div>\n<div class="column" >'
+    assert steps[4] == "</div>\n</div>\n"
+
+
+def test_render_plan_is_cached():
+    helper = FormHelper()
+    helper.layout = Layout(Row(Column("email")))
+    plan = helper.get_render_plan()
+    render_crispy_form(SampleForm(), helper)
+    assert helper.get_render_plan() is plan
+    assert helper.get_render_plan("bulma") is plan
+
+    helper.clear_render_plan()
+    assert helper.get_render_plan() is not plan
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda helper: helper.layout.append("first_name"),
+        lambda helper: helper.layout[0].append(Column("first_name")),
+        lambda helper: helper["email"].wrap(Div, css_class="wrapped"),
+        lambda helper: setattr(helper.layout[0][0], "css_class", "is-half"),
+        lambda helper: setattr(helper, "layout", Layout(Row(Column("email")))),
+    ],
+)
+def test_render_plan_follows_layout_changes(change):
+    helper = FormHelper()
+    helper.layout = Layout(Row(Column("email")))
+    plan = helper.get_render_plan()
+
+    change(helper)
+    assert helper.get_render_plan() is not plan
+
+    crispy_helper = CrispyFormHelper()
+    crispy_helper.layout = helper.layout
+    html = render_crispy_form(SampleForm(), helper)
+    assert html == render_crispy_form(SampleForm(), crispy_helper)
+
+
+def test_render_plan_follows_template_changes():
+    helper = FormHelper()
+    helper.layout = Layout(Row(Column("email")))
+    plan = helper.get_render_plan()
+
+    with override_settings(TEMPLATES=[]):
+        pass
+    assert helper.get_render_plan() is not plan
+
+
+def test_render_plan_context_is_not_modified():
+    helper = FormHelper()
+    helper.layout = sample_layout()
+    context = Context({"label": "text"})
+    form = SampleForm()
+    helper.render_layout(form, context)
+
+    for key in ["fieldset", "formgroup", "exclude_field_wrapper", "control_class"]:
+        assert key not in context
+
+
+@pytest.mark.parametrize("helper_class", [FormHelper, CrispyFormHelper])
+def test_layout_renderer(helper_class, monkeypatch):
+    helper = helper_class()
+    helper.layout = sample_layout()
+    render = layout_renderer(helper)
+    html = helper.render_layout(SampleForm(), Context({"label": "text"}))
+
+    compiled = []
+    monkeypatch.setattr(RenderPlan, "compile", lambda *args: compiled.append(args))
+    for i in range(3):
+        assert render(SampleForm(), Context({"label": "text"})) == html
+    assert compiled == []
+
+
+def test_layout_renderer_custom_render_layout():
+    class CustomFormHelper(CrispyFormHelper):
+        def render_layout(self, form, context, template_pack=None):
+            return "custom"
+
+    helper = CustomFormHelper()
+    helper.layout = sample_layout()
+    assert layout_renderer(helper)(SampleForm(), Context()) == "custom"
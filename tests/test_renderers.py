@@ -0,0 +1,66 @@
+import pytest
+
+import django
+from django.test import override_settings
+
+from crispy_bulma.fragments import render_fragment
+from crispy_bulma.renderers import BulmaFormRenderer
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+
+from .forms import (
+    CheckboxesSampleForm,
+    FileForm,
+    InputsForm,
+    SampleForm,
+    SampleForm5,
+    SampleFormWithMultiValueField,
+)
+
+FORMS = [
+    CheckboxesSampleForm,
+    FileForm,
+    InputsForm,
+    SampleForm,
+    SampleForm5,
+    SampleFormWithMultiValueField,
+]
+
+
+def crispy_html(form):
+    helper = FormHelper()
+    helper.form_tag = False
+    helper.include_media = False
+    return render_crispy_form(form, helper).strip()
+
+
+@pytest.mark.parametrize("form_class", FORMS, ids=lambda cls: cls.__name__)
+@pytest.mark.parametrize("bound", [False, True])
+def test_render_form(form_class, bound):
+    data = {"email": "invalid", "first_name": "toolong"} if bound else None
+    renderer = BulmaFormRenderer()
+    html = str(form_class(data, renderer=renderer))
+    assert html == crispy_html(form_class(data))
+
+
+def test_render_form_non_field_errors():
+    form = SampleForm({"password1": "one", "password2": "two"})
+    html = str(SampleForm(form.data, renderer=BulmaFormRenderer()))
+    assert "Passwords dont match" in html
+    assert html == crispy_html(form)
+
+
+@pytest.mark.skipif(django.VERSION < (5, 0), reason="as_field_group is new in 5.0")
+@pytest.mark.parametrize("name", ["is_company", "email", "datetime_field"])
+def test_render_field_group(name):
+    form = SampleForm({"email": "invalid"}, renderer=BulmaFormRenderer())
+    html = form[name].as_field_group()
+    assert html == render_fragment(SampleForm({"email": "invalid"}), name).strip()
+
+
+def test_templates_cached():
+    renderer = BulmaFormRenderer()
+    template = renderer.get_template("bulma/forms/div.html")
+    assert renderer.get_template("bulma/forms/div.html") is template
+    with override_settings(TEMPLATES=[]):
+        assert renderer.templates == {}
@@ -0,0 +1,107 @@
+import pytest
+
+from django import forms
+from django.contrib.auth.models import Group
+from django.forms import formset_factory
+from django.test import override_settings
+from django.utils import translation
+
+from crispy_bulma.layout import Column, Layout, Row
+from crispy_bulma.rows import row_plan
+from crispy_bulma.templatetags.crispy_forms_bulma_field import FastFieldNode
+from crispy_forms.helper import FormHelper
+from crispy_forms.utils import render_crispy_form
+
+from .forms import CheckboxesSampleForm, ModelChoicesForm, SampleForm
+
+
+@pytest.fixture
+def field_renders(monkeypatch):
+    renders = []
+    render_field = FastFieldNode.render_field
+
+    def counting_render_field(self, context):
+        renders.append(context["field"].html_name)
+        return render_field(self, context)
+
+    monkeypatch.setattr(FastFieldNode, "render_field", counting_render_field)
+    return renders
+
+
+def make_helper(layout=False):
+    helper = FormHelper()
+    if layout:
+        helper.layout = Layout("email", Row(Column("first_name"), Column("last_name")))
+    return helper
+
+
+def assert_same_html(formset_class, helper=None, **kwargs):
+    html = render_crispy_form(formset_class(**kwargs), helper)
+    with row_plan():
+        assert render_crispy_form(formset_class(**kwargs), helper) == html
+
+
+@pytest.mark.parametrize("fast_fields", [False, True])
+@pytest.mark.parametrize("layout", [False, True])
+def test_row_plan(fast_fields, layout):
+    formset_class = formset_factory(SampleForm, extra=4)
+    with override_settings(CRISPY_BULMA_FAST_FIELDS=fast_fields):
+        assert_same_html(formset_class, make_helper(layout))
+
+
+def test_row_plan_reuses_fields(field_renders):
+    formset_class = formset_factory(SampleForm, extra=10)
+    with row_plan():
+        render_crispy_form(formset_class(), make_helper(layout=True))
+
+    # rendered for the first two forms, then reused
+    assert field_renders.count("form-0-email") == 1
+    assert field_renders.count("form-1-email") == 1
+    assert not any(name.startswith("form-2-") for name in field_renders)
+
+
+def test_row_plan_bound():
+    formset_class = formset_factory(CheckboxesSampleForm, extra=0)
+    data = {"form-TOTAL_FORMS": "4", "form-INITIAL_FORMS": "0"}
+    data.update({"form-0-checkboxes": ["1"], "form-2-checkboxes": ["2", "3"]})
+    data.update({"form-1-alphacheckboxes": "option_one"})
+    assert_same_html(formset_class, data=data)
+
+
+def test_row_plan_prefix_in_value():
+    formset_class = formset_factory(SampleForm, extra=4)
+    initial = [{"first_name": "form-0-", "email": "a@form-0-.com"}] * 4
+    assert_same_html(formset_class, initial=initial)
+
+
+def test_row_plan_customized_forms():
+    class CustomizedFormSet(forms.BaseFormSet):
+        def add_fields(self, form, index):
+            super().add_fields(form, index)
+            if index is not None:
+                form.fields["email"].help_text = "Email %s" % (index // 2)
+                form.fields["first_name"].widget.attrs["data-index"] = index
+
+    formset_class = formset_factory(SampleForm, CustomizedFormSet, extra=5)
+    assert_same_html(formset_class)
+
+
+def test_row_plan_language():
+    formset_class = formset_factory(SampleForm, extra=3)
+    with translation.override("de"):
+        assert_same_html(formset_class, data={"form-TOTAL_FORMS": "3"})
+
+
+@pytest.mark.django_db
+def test_row_plan_model_choices():
+    Group.objects.bulk_create(Group(name="Group %s" % i) for i in range(3))
+
+    class GroupFormSet(forms.BaseFormSet):
+        def add_fields(self, form, index):
+            super().add_fields(form, index)
+            if index == 3:
+                queryset = Group.objects.filter(name="Group 1")
+                form.fields["select"].queryset = queryset
+
+    formset_class = formset_factory(ModelChoicesForm, GroupFormSet, extra=5)
+    assert_same_html(formset_class)
@@ -0,0 +1,115 @@
+import pytest
+
+from django import forms
+from django.forms import formset_factory
+from django.http import StreamingHttpResponse
+
+from crispy_bulma.layout import HTML, Button, Column, Layout, Row, Submit
+from crispy_bulma.streaming import stream_crispy_formset, stream_spaceless
+from crispy_forms.helper import FormHelper
+from crispy_forms.templatetags.crispy_forms_utils import remove_spaces
+from crispy_forms.utils import render_crispy_form
+
+from .forms import SampleForm
+
+
+class MinFormSet(forms.BaseFormSet):
+    def clean(self):
+        raise forms.ValidationError("Formset error")
+
+
+def make_formset(bound=False, **kwargs):
+    formset_class = formset_factory(SampleForm, extra=3, **kwargs)
+    if not bound:
+        return formset_class()
+    return formset_class(
+        {"form-TOTAL_FORMS": "2", "form-INITIAL_FORMS": "0", "form-0-email": "x"}
+    )
+
+
+def make_helper(layout=False, **kwargs):
+    helper = FormHelper()
+    helper.add_input(Submit("save", "Save"))
+    if layout:
+        helper.layout = Layout(
+            HTML("{% if forloop.first %}<p>first</p>{% endif %}"),
+            "email",
+            Row(Column("first_name"), Column("last_name")),
+            Button("Row {{ forloop.counter }}"),
+        )
+    for name, value in kwargs.items():
+        setattr(helper, name, value)
+    return helper
+
+
+@pytest.mark.parametrize("bound", [False, True])
+@pytest.mark.parametrize("layout", [False, True])
+@pytest.mark.parametrize(
+    "helper_attrs",
+    [{}, {"form_tag": False}, {"form_method": "get"}, {"form_horizontal": True}],
+)
+def test_stream_crispy_formset(bound, layout, helper_attrs):
+    context = {"csrf_token": "token"}
+    html = render_crispy_form(
+        make_formset(bound), make_helper(layout, **helper_attrs), context
+    )
+    chunks = list(
+        stream_crispy_formset(
+            make_formset(bound), make_helper(layout, **helper_attrs), context
+        )
+    )
+    assert "".join(chunks) == html
+    # the form tag, csrf token, management form, forms and inputs
+    assert len(chunks) > len(make_formset(bound).forms)
+
+
+def test_stream_crispy_formset_errors():
+    formset_class = formset_factory(SampleForm, formset=MinFormSet)
+    data = {"form-TOTAL_FORMS": "1", "form-INITIAL_FORMS": "0"}
+    html = render_crispy_form(formset_class(data), make_helper())
+    streamed = "".join(stream_crispy_formset(formset_class(data), make_helper()))
+    assert "Formset error" in streamed
+    assert streamed == html
+
+
+def test_stream_crispy_formset_renders_forms_lazily():
+    formset = make_formset()
+    chunks = stream_crispy_formset(formset, make_helper(layout=True))
+
+    html = ""
+    while "div_id_form-0-email" not in html:
+        html += next(chunks)
+    assert not any(hasattr(form, "form_html") for form in formset.forms[1:])
+    assert "div_id_form-1-email" not in html
+
+    html += "".join(chunks)
+    assert "div_id_form-2-email" in html
+    assert not any(hasattr(form, "form_html") for form in formset.forms)
+
+
+def test_stream_crispy_formset_streaming_response():
+    html = render_crispy_form(make_formset(), make_helper(layout=True))
+    response = StreamingHttpResponse(
+        stream_crispy_formset(make_formset(), make_helper(layout=True))
+    )
+    assert b"".join(response.streaming_content).decode() == html
+
+
+def test_stream_crispy_formset_form():
+    with pytest.raises(TypeError):
+        list(stream_crispy_formset(SampleForm()))
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        "  <div>   <p>x</p>\n\n\n<br/><input/>  <span>  </span>   ",
+        "<a/>   <b>   </b>    <i />\n    <u/><s></s>",
+    ],
+)
+def test_stream_spaceless(html):
+    expected = remove_spaces(html.strip())
+    for i in range(len(html) + 1):
+        for j in range(i, len(html) + 1):
+            chunks = [html[:i], html[i:j], html[j:]]
+            assert "".join(stream_spaceless(chunks)) == expected
@@ -1,13 +1,27 @@
 import pytest
 
+from django import forms
 from django.forms.boundfield import BoundField
 from django.forms.formsets import formset_factory
 from django.template import Context, Template
 from django.test import override_settings
 
+from crispy_bulma.converters import (
+    get_converters,
+    register_converter,
+    unregister_converter,
+)
+from crispy_bulma.kinds import get_widget_kind
+from crispy_bulma.templatetags.crispy_forms_bulma_field import CrispyBulmaFieldNode
+from crispy_bulma.widgets import FileUploadInput
 from crispy_forms.exceptions import CrispyError
 
-from .forms import SampleForm
+from .forms import (
+    CustomCheckboxSelectMultiple,
+    CustomRadioSelect,
+    SampleForm,
+    SampleFormCustomWidgets,
+)
 
 
 def test_crispy_field():
@@ -207,3 +221,184 @@ def test_crispy_field_and_class_converters():
     html = template.render(c)
     assert "error" in html
     assert "inputtext" in html
+
+
+def test_bulma_crispy_field_class_converters():
+    template = Template(
+        """
+        {% load crispy_forms_bulma_field %}
+        {% crispy_field testField %}
+    """
+    )
+    c = Context({"testField": SampleForm()["first_name"]})
+    assert 'class="input"' in template.render(c)
+
+    with override_settings(CRISPY_CLASS_CONVERTERS={"textinput": "inputtext"}):
+        c = Context({"testField": SampleForm()["first_name"]})
+        assert 'class="inputtext"' in template.render(c)
+
+    c = Context({"testField": SampleForm()["first_name"]})
+    assert 'class="input"' in template.render(c)
+
+
+def test_register_converter():
+    template = Template(
+        """
+        {% load crispy_forms_bulma_field %}
+        {% crispy_field testField %}
+    """
+    )
+    register_converter(forms.TextInput, "input is-rounded")
+    try:
+        c = Context({"testField": SampleForm()["first_name"]})
+        assert 'class="input is-rounded"' in template.render(c)
+
+        # settings still take precedence over registered converters
+        with override_settings(CRISPY_CLASS_CONVERTERS={"textinput": "inputtext"}):
+            c = Context({"testField": SampleForm()["first_name"]})
+            assert 'class="inputtext"' in template.render(c)
+    finally:
+        unregister_converter("TextInput")
+
+    assert get_converters()["textinput"] == "input"
+
+
+def test_crispy_field_attrs_are_compiled():
+    template = Template(
+        """
+        {% load crispy_forms_bulma_field %}
+        {% crispy_field testField "class" "is-danger" "placeholder" placeholder|upper %}
+    """
+    )
+    node = template.nodelist.get_nodes_by_type(CrispyBulmaFieldNode)[0]
+    (class_name, class_value), (placeholder_name, placeholder_value) = node.attrs
+    assert class_name == "class"
+    assert class_value == "is-danger"
+    assert placeholder_name == "placeholder"
+    assert not isinstance(placeholder_value, str)
+
+    c = Context({"testField": SampleForm()["first_name"], "placeholder": "name"})
+    html = template.render(c)
+    assert 'class="input is-danger"' in html
+    assert 'placeholder="NAME"' in html
+
+
+def test_crispy_field_does_not_modify_widget():
+    template = Template(
+        """
+        {% load crispy_forms_bulma_field %}
+        {% crispy_field testField "class" "is-danger" %}
+    """
+    )
+    form = SampleForm()
+    form.fields["first_name"].widget.attrs["class"] = "custom"
+    c = Context({"testField": form["first_name"]})
+
+    html = template.render(c)
+    assert 'class="custom input is-danger"' in html
+    assert template.render(c) == html
+    assert form.fields["first_name"].widget.attrs == {
+        "class": "custom",
+        "maxlength": "5",
+    }
+
+
+def test_crispy_field_multiwidget_does_not_modify_widgets():
+    template = Template(
+        """
+        {% load crispy_forms_bulma_field %}
+        {% crispy_field testField %}
+    """
+    )
+    form = SampleForm()
+    c = Context({"testField": form["datetime_field"]})
+
+    html = template.render(c)
+    assert html.count('class="dateinput input"') == 1
+    assert html.count('class="timeinput input"') == 1
+    assert template.render(c) == html
+    for widget in form.fields["datetime_field"].widget.widgets:
+        assert "class" not in widget.attrs
+
+
+@pytest.mark.parametrize(
+    "widget,kind",
+    [
+        (forms.TextInput, "input"),
+        (forms.Textarea, "input"),
+        (forms.PasswordInput, "password"),
+        (forms.CheckboxInput, "checkbox"),
+        (forms.Select, "select"),
+        (forms.NullBooleanSelect, "select"),
+        (forms.SelectMultiple, "selectmultiple"),
+        (forms.RadioSelect, "radioselect"),
+        (CustomRadioSelect, "radioselect"),
+        (forms.CheckboxSelectMultiple, "checkboxselectmultiple"),
+        (CustomCheckboxSelectMultiple, "checkboxselectmultiple"),
+        (forms.FileInput, "file"),
+        (forms.ClearableFileInput, "clearable_file"),
+        (FileUploadInput, "clearable_file"),
+        (forms.SplitDateTimeWidget, "multivalue"),
+    ],
+)
+def test_get_widget_kind(widget, kind):
+    assert get_widget_kind(widget) == kind
+    # the second lookup is served from the cache
+    assert get_widget_kind(widget) == kind
+
+
+def test_widget_kind_filter():
+    template = Template(
+        """
+        {% load crispy_forms_bulma_field %}
+        {% for field in form %}{{ field|widget_kind }} {% endfor %}
+    """
+    )
+    html = template.render(Context({"form": SampleFormCustomWidgets()}))
+    assert "radioselect checkboxselectmultiple" in html
+
+
+@pytest.mark.parametrize(
+    "field,multiple",
+    [
+        (forms.ChoiceField(choices=[(1, "one")]), False),
+        (forms.MultipleChoiceField(choices=[(1, "one")]), True),
+    ],
+)
+def test_select_template_outside_field_template(field, multiple):
+    # custom field templates include the select without setting widget_kind
+    form = type("SelectForm", (forms.Form,), {"choice": field})()
+    template = Template('{% include "bulma/layout/select.html" %}')
+    html = template.render(Context({"field": form["choice"]}))
+    assert ("select is-multiple" in html) is multiple
+
+
+def test_crispy_choices():
+    class ChoicesForm(forms.Form):
+        numbers = forms.MultipleChoiceField(
+            choices=[(i, "Number %s" % i) for i in range(20)],
+            widget=forms.CheckboxSelectMultiple(attrs={"data-test": "x"}),
+            disabled=True,
+        )
+        number = forms.ChoiceField(
+            choices=[(i, "Number %s" % i) for i in range(20)],
+            widget=forms.RadioSelect,
+        )
+
+    template = Template(
+        """
+        {% load crispy_forms_bulma_field %}
+        {% crispy_choices form.numbers "checkbox" %}
+        {% crispy_choices form.number "radio" inline=True %}
+    """
+    )
+    form = ChoicesForm(initial={"numbers": [3, "5"], "number": 7})
+    html = template.render(Context({"form": form}))
+
+    assert html.count("checked") == 3
+    assert 'type="checkbox" checked name="numbers" id="id_numbers_3"' in html
+    assert 'type="checkbox" checked name="numbers" id="id_numbers_5"' in html
+    assert 'type="radio" checked name="number" id="id_number_7"' in html
+    assert html.count('class="control"') == 20
+    assert html.count('value="1" disabled  data-test="x">') == 1
+    assert html.count('value="1"  >') == 1
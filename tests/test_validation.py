@@ -0,0 +1,205 @@
+import pytest
+
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import path
+from django.views.generic import CreateView, FormView, UpdateView
+
+from crispy_bulma.layout import FormGroup, Layout
+from crispy_bulma.validation import FieldValidationMixin, validate_fields
+from crispy_forms.helper import FormHelper
+
+from .forms import SampleForm
+
+DATA = {
+    "email": "a@example.com",
+    "password1": "secret",
+    "password2": "secret",
+    "first_name": "a",
+    "last_name": "b",
+    "datetime_field_0": "2024-01-01",
+    "datetime_field_1": "10:00",
+}
+
+
+class PasswordForm(SampleForm):
+    def clean(self):
+        cleaned_data = super(SampleForm, self).clean()
+        if cleaned_data.get("password1") != cleaned_data.get("password2"):
+            self.add_error("password2", "Passwords dont match")
+        return cleaned_data
+
+
+class SignupView(FieldValidationMixin, FormView):
+    form_class = PasswordForm
+    template_name = "crispy_render_template.html"
+    success_url = "/done/"
+    dependent_fields = {"password2": ["password1"]}
+    validation_fields = ["email"]
+
+
+class ThrottledView(SignupView):
+    validation_throttle = (2, 60)
+
+
+class GroupedSignupView(SignupView):
+    validation_fields = ["email", "password2"]
+    css_id = "passwords"
+
+    def get_form(self, form_class=None):
+        form = super().get_form(form_class)
+        form.helper = FormHelper()
+        form.helper.layout = Layout(
+            "email", FormGroup("password1", "password2", css_id=self.css_id)
+        )
+        return form
+
+
+class UngroupedSignupView(GroupedSignupView):
+    css_id = None
+
+
+class GroupUpdateView(FieldValidationMixin, UpdateView):
+    model = Group
+    fields = ["name"]
+    template_name = "crispy_render_template.html"
+    success_url = "/done/"
+
+
+class GroupCreateView(FieldValidationMixin, CreateView):
+    model = Group
+    fields = ["name"]
+    template_name = "crispy_render_template.html"
+    success_url = "/done/"
+
+
+urlpatterns = [
+    path("signup/", SignupView.as_view()),
+    path("throttled/", ThrottledView.as_view()),
+    path("grouped/", GroupedSignupView.as_view()),
+    path("ungrouped/", UngroupedSignupView.as_view()),
+    path("groups/<int:pk>/", GroupUpdateView.as_view()),
+    path("groups/add/", GroupCreateView.as_view()),
+]
+
+pytestmark = pytest.mark.urls(__name__)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_validate_field(client):
+    response = client.post("/signup/?validate=email", {"email": "invalid"})
+    assert response.status_code == 200
+    html = response.content.decode()
+    assert 'id="div_id_email"' in html
+    assert 'class="input is-danger"' in html
+    assert 'id="error_1_id_email"' in html
+    assert 'class="help is-danger"' in html
+    assert "Enter a valid email address." in html
+    # only the field is validated and rendered
+    assert "<form" not in html
+    assert "first_name" not in html
+
+
+def test_validate_field_valid(client):
+    response = client.post("/signup/?validate=email", DATA)
+    html = response.content.decode()
+    assert response.status_code == 200
+    assert 'id="div_id_email"' in html
+    assert "is-danger" not in html
+
+
+def test_validate_field_parameter_in_post_data(client):
+    response = client.post("/signup/", {"email": "invalid", "validate": "email"})
+    assert response.status_code == 200
+    assert "Enter a valid email address." in response.content.decode()
+
+
+def test_validate_dependent_fields(client):
+    data = {"password1": "one", "password2": "two"}
+    response = client.post("/signup/?validate=password2", data)
+    assert "Passwords dont match" in response.content.decode()
+
+    data = {"password1": "same", "password2": "same"}
+    response = client.post("/signup/?validate=password2", data)
+    assert "is-danger" not in response.content.decode()
+
+
+def test_validate_unknown_field(client):
+    response = client.post("/signup/?validate=unknown", DATA)
+    assert response.status_code == 404
+
+
+def test_post_without_validate(client):
+    response = client.post("/signup/", DATA)
+    assert response.status_code == 302
+
+
+def test_validation_attrs(client):
+    html = client.get("/signup/").content.decode()
+    assert 'hx-post="/signup/?validate=email"' in html
+    assert 'hx-trigger="input changed delay:300ms, blur"' in html
+    assert 'hx-target="#div_id_email"' in html
+
+
+def test_validation_attrs_form_group(client):
+    html = client.get("/grouped/").content.decode()
+    assert 'hx-target="#div_id_email"' in html
+    assert html.count('hx-target="#passwords"') == 1
+    assert 'id="passwords"' in html
+
+    response = client.post("/grouped/?validate=password2", DATA)
+    assert response.content.decode().strip().startswith('<div id="passwords"')
+
+
+def test_validation_attrs_form_group_without_id(client):
+    with pytest.raises(ImproperlyConfigured):
+        client.get("/ungrouped/")
+
+
+def test_throttle(client):
+    for i in range(2):
+        response = client.post("/throttled/?validate=email", DATA)
+        assert response.status_code == 200
+    response = client.post("/throttled/?validate=email", DATA)
+    assert response.status_code == 429
+    assert response["Retry-After"] == "60"
+
+
+def test_validate_fields_only_cleans_fields():
+    form = validate_fields(PasswordForm({"email": "invalid"}), ["email"])
+    assert list(form.errors) == ["email"]
+
+
+@pytest.mark.django_db
+def test_validate_field_update_view(client):
+    group = Group.objects.create(name="editors")
+    url = "/groups/%s/?validate=name" % group.pk
+
+    response = client.post(url, {"name": "writers"})
+    assert response.status_code == 200
+    html = response.content.decode()
+    assert 'value="writers"' in html
+    assert "is-danger" not in html
+
+    response = client.post(url, {"name": ""})
+    assert "This field is required." in response.content.decode()
+    group.refresh_from_db()
+    assert group.name == "editors"
+
+    response = client.post("/groups/0/?validate=name", {"name": "writers"})
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_validate_field_create_view(client):
+    response = client.post("/groups/add/?validate=name", {"name": ""})
+    assert response.status_code == 200
+    assert "This field is required." in response.content.decode()
+    assert not Group.objects.exists()
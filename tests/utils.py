@@ -3,11 +3,23 @@ from pathlib import Path
 
 from django.test.html import Element, parse_html
 
+from crispy_forms.templatetags import crispy_forms_filters, crispy_forms_tags
 from crispy_forms.utils import render_crispy_form
 
 TEST_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
+def clear_crispy_templates():
+    """
+    Clears the templates crispy_forms keeps for whole forms and formsets, so
+    they are loaded again with the current template settings.
+    """
+    crispy_forms_filters.uni_form_template.cache_clear()
+    crispy_forms_filters.uni_formset_template.cache_clear()
+    crispy_forms_tags.whole_uni_form_template.cache_clear()
+    crispy_forms_tags.whole_uni_formset_template.cache_clear()
+
+
 def contains_partial(haystack, needle, ignore_needle_children=False):
     """Search for a html element with at least the corresponding elements
     (other elements may be present in the matched element from the haystack)